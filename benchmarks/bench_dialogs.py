@@ -0,0 +1,57 @@
+"""
+Benchmark of opening the price list dialogs.
+Measures the first opening (dialog construction and rendering) and reopenings
+served from the reusable dialog and the per-snapshot text cache, with a full
+day of 15-minute slots. The modal event loop itself is not measured.
+
+Usage:
+    python -m benchmarks.bench_dialogs --reopen 200
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from datetime import datetime, timedelta, timezone
+
+from PyQt6.QtWidgets import QApplication, QDialog
+
+from data.recorded_repository import RecordedPriceRepository
+from domain.clock import ManualClock
+from domain.entities import PricePoint
+from presentation.main_window import MainWindow
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark price dialog opening")
+    parser.add_argument("--reopen", type=int, default=200, help="Number of reopenings to time")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    QDialog.exec = lambda dialog: 0  # time the preparation only, not the modal loop
+
+    start = datetime(2024, 3, 24, 22, tzinfo=timezone.utc)
+    slot = timedelta(minutes=15)
+    prices = [PricePoint(price=5 + index % 96 / 10, start_date=start + slot * index,
+                         end_date=start + slot * (index + 1)) for index in range(96 * 3)]
+    clock = ManualClock(datetime(2024, 3, 26, 12, 30, tzinfo=timezone.utc))
+    window = MainWindow(api_client=RecordedPriceRepository(prices, clock, history=timedelta(days=2)), clock=clock)
+
+    for name, show in (("Daily prices", window.show_daily_prices), ("Next day prices", window.show_next_day_prices)):
+        with contextlib.redirect_stdout(io.StringIO()):  # silence the debug logs
+            started = time.perf_counter()
+            show()
+            first = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for _ in range(args.reopen):
+                show()
+            reopen = (time.perf_counter() - started) / args.reopen
+        print(f"{name + ':':17} first open {first * 1000:7.2f} ms, reopen {reopen * 1000:6.3f} ms")
+
+    window.close()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Size and throughput benchmark for the columnar price history format.
+Compares against the latest-prices.json representation of the same data.
+
+Usage:
+    python -m benchmarks.bench_history_export --years 10
+"""
+
+import argparse
+import io
+import json
+import random
+import time
+from datetime import datetime, timezone
+
+from data.history_store import iter_history, iter_history_blocks, write_history
+from data.streaming import iter_price_points
+from domain.entities import PricePoint
+
+
+def generate(years: int) -> list:
+    """
+    Generate 15-minute prices with three decimals, like the API publishes.
+    Prices follow a seeded random walk so they do not compress unrealistically well.
+    """
+    rand = random.Random(42)
+    start = int(datetime(2015, 1, 1, tzinfo=timezone.utc).timestamp())
+    price = 8.0
+    points = []
+    for index in range(years * 365 * 96):
+        price = max(-2.0, price + rand.gauss(0, 0.6))
+        points.append(PricePoint.from_epoch(round(price, 3), start + index * 900, start + (index + 1) * 900))
+    return points
+
+
+def to_json(points: list) -> bytes:
+    return json.dumps({"prices": [
+        {
+            "price": point.price,
+            "startDate": point.start_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "endDate": point.end_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        }
+        for point in points
+    ]}).encode("utf-8")
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the columnar price history format")
+    parser.add_argument("--years", type=int, default=10, help="Years of 15-minute prices to generate")
+    args = parser.parse_args(argv)
+
+    points = generate(args.years)
+    rows = len(points)
+
+    document = to_json(points)
+    _, json_read = timed(lambda: sum(1 for _ in iter_price_points([document])))
+
+    buffer = io.BytesIO()
+    _, write = timed(lambda: write_history(buffer, points))
+    size = buffer.tell()
+    buffer.seek(0)
+    _, read = timed(lambda: sum(1 for _ in iter_history(buffer)))
+    buffer.seek(0)
+    _, read_columns = timed(lambda: sum(len(prices) for prices, _, _ in iter_history_blocks(buffer)))
+
+    print(f"Rows:            {rows:,} ({args.years} years at 15 minutes)")
+    print(f"JSON size:       {len(document) / 2**20:8.2f} MiB")
+    print(f"Columnar size:   {size / 2**20:8.2f} MiB ({len(document) / size:.0f}x smaller, {size / rows:.2f} bytes/row)")
+    print(f"Columnar write:  {rows / write / 1e6:8.2f} M rows/s")
+    print(f"Columnar read:   {rows / read / 1e6:8.2f} M rows/s (PricePoint objects)")
+    print(f"Columnar read:   {rows / read_columns / 1e6:8.2f} M rows/s (column arrays)")
+    print(f"JSON read:       {rows / json_read / 1e6:8.2f} M rows/s (streaming parser)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Memory benchmark for the PricePoint representation.
+Compares the compact slotted PricePoint with the previous plain dataclass
+holding two timezone-aware datetimes.
+
+Usage:
+    python -m benchmarks.bench_price_point_memory --points 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from domain.entities import PricePoint
+
+
+@dataclass
+class LegacyPricePoint:
+    """
+    The previous PricePoint representation, kept for comparison.
+    """
+    price: float
+    start_date: datetime
+    end_date: datetime
+
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+SLOT = timedelta(minutes=15)
+
+
+def build_legacy(count: int) -> list:
+    return [
+        LegacyPricePoint(price=index * 0.001, start_date=START + SLOT * index, end_date=START + SLOT * (index + 1))
+        for index in range(count)
+    ]
+
+
+def build_compact(count: int) -> list:
+    return [
+        PricePoint(price=index * 0.001, start_date=START + SLOT * index, end_date=START + SLOT * (index + 1))
+        for index in range(count)
+    ]
+
+
+def measure(builder: Callable[[int], list], count: int) -> float:
+    """
+    Measure the memory retained by a list of price points.
+
+    Args:
+        builder (Callable[[int], list]): Builds the list of points
+        count (int): Number of points to build
+
+    Returns:
+        float: Retained bytes per point, including the list itself
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    points = builder(count)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del points
+    return retained / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare PricePoint memory usage")
+    parser.add_argument("--points", type=int, default=1_000_000, help="Number of price points to build")
+    args = parser.parse_args(argv)
+
+    legacy = measure(build_legacy, args.points)
+    compact = measure(build_compact, args.points)
+    print(f"Points:              {args.points:,}")
+    print(f"Legacy dataclass:    {legacy:6.1f} bytes/point ({legacy * args.points / 2**20:,.1f} MiB)")
+    print(f"Compact PricePoint:  {compact:6.1f} bytes/point ({compact * args.points / 2**20:,.1f} MiB)")
+    print(f"Reduction:           {1 - compact / legacy:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of bulk alert evaluation with sorted threshold indexes.
+Compares SubscriptionIndex with checking every subscriber's PriceLimits.
+
+Usage:
+    python -m benchmarks.bench_subscriptions --subscribers 100000
+"""
+
+import argparse
+import random
+import time
+
+from domain.entities import NotifyMode, PriceLimits
+from domain.subscriptions import SubscriptionIndex
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark subscriber alert evaluation")
+    parser.add_argument("--subscribers", type=int, default=100_000)
+    parser.add_argument("--slots", type=int, default=96, help="Price slots to evaluate (one day of 15-minute slots)")
+    args = parser.parse_args(argv)
+
+    rand = random.Random(1)
+    rules = []
+    for number in range(args.subscribers):
+        # Most households only want to hear about rare cheap or expensive slots
+        limits = PriceLimits(lower_limit=rand.uniform(-1, 3), upper_limit=rand.uniform(15, 40))
+        rules.append((f"sub-{number}", limits, rand.choice(list(NotifyMode))))
+    prices = [rand.uniform(0, 20) for _ in range(args.slots)]
+
+    started = time.perf_counter()
+    index = SubscriptionIndex()
+    for subscriber_id, limits, mode in rules:
+        index.register(subscriber_id, limits, mode)
+    index.triggered(0.0)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed_hits = sum(len(index.evaluate(price)) for price in prices)
+    indexed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned_hits = sum(
+        1 for price in prices for _, limits, mode in rules if limits.limit_breached(price, mode)
+    )
+    scanned = time.perf_counter() - started
+
+    assert indexed_hits == scanned_hits
+    print(f"Subscribers:     {args.subscribers:,}, slots: {args.slots}, alerts: {indexed_hits:,}")
+    print(f"Index build:     {build * 1000:8.1f} ms")
+    print(f"Sorted index:    {indexed / args.slots * 1000:8.3f} ms/slot")
+    print(f"Full scan:       {scanned / args.slots * 1000:8.3f} ms/slot ({scanned / indexed:.0f}x slower)")
+
+    started = time.perf_counter()
+    counts = [sum(map(len, index.triggered(price))) for price in prices]
+    lookup = time.perf_counter() - started
+    print(f"Hit lists only:  {lookup / args.slots * 1000:8.3f} ms/slot (no alert objects, {sum(counts):,} hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark of cross-zone comparison.
+Builds ZonePriceTable from per-zone snapshots, which includes computing the
+spread and the cheapest zone per slot, for a growing number of zones, to
+check that memory and time grow linearly with the zone count.
+
+Usage:
+    python -m benchmarks.bench_zones --days 30 --max-zones 16
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from domain.entities import PricePoint, to_epoch
+from domain.snapshot import PriceSnapshot
+from domain.zones import ZonePriceTable
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark cross-zone comparison")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--max-zones", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    rand = random.Random(1)
+    start = to_epoch(datetime(2024, 1, 1, tzinfo=timezone.utc))
+    slots = args.days * 96  # 15-minute slots
+    fetched_at = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=args.days)
+    snapshots = {}
+    for number in range(args.max_zones):
+        prices = [PricePoint.from_epoch(rand.uniform(-1, 30), start + index * 900, start + (index + 1) * 900)
+                  for index in range(slots)]
+        snapshots[f"Z{number:02d}"] = PriceSnapshot.from_prices(prices, fetched_at)
+
+    print(f"Slots: {slots:,}")
+    zone_count = 1
+    while zone_count <= args.max_zones:
+        subset = dict(list(snapshots.items())[:zone_count])
+        started = time.perf_counter()
+        table = ZonePriceTable.from_snapshots(subset)
+        build = time.perf_counter() - started
+
+        memory = sum(column.buffer_info()[1] * column.itemsize for column in (table.starts, table.ends, *table.columns))
+        print(f"{zone_count:3d} zones: table {memory / 1024:8.0f} KiB, "
+              f"build with spread+cheapest {build * 1000:7.1f} ms")
+        zone_count *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,27 @@ from the external API service.
 """
 
 import requests
-from datetime import datetime, timezone, timedelta
-from typing import List
+from datetime import date, timedelta
+from typing import Iterator, List, Optional
+from domain.clock import Clock, SystemClock
+from domain.day_index import DayIndex
 from domain.entities import PricePoint
 from domain.repositories import PriceRepository
+from domain.snapshot import PriceSnapshot
+from .snapshot_cache import SnapshotCache
+from .streaming import iter_price_points, parse_price
+
+def parse_prices(data: dict) -> List[PricePoint]:
+    """
+    Convert a decoded latest-prices.json response into PricePoint objects.
+
+    Args:
+        data (dict): The decoded JSON response
+
+    Returns:
+        List[PricePoint]: List of price points in response order
+    """
+    return [parse_price(price_data) for price_data in data["prices"]]
 
 class PorssiSahkoApiClient(PriceRepository):
     """
@@ -16,14 +33,17 @@ class PorssiSahkoApiClient(PriceRepository):
     Implements the PriceRepository interface to provide price data.
     """
 
-    def __init__(self, base_url: str = "https://api.porssisahko.net/v1"):
+    def __init__(self, base_url: str = "https://api.porssisahko.net/v1", clock: Optional[Clock] = None):
         """
         Initialize the API client with the base URL.
 
         Args:
             base_url (str): The base URL for the Porssisahko API
+            clock (Optional[Clock]): Source of the current time, the system clock by default
         """
         self.base_url = base_url
+        self.clock = clock or SystemClock()
+        self.snapshots = SnapshotCache(self.get_latest_prices, self.clock)
 
     def get_latest_prices(self) -> List[PricePoint]:
         """
@@ -40,20 +60,71 @@ class PorssiSahkoApiClient(PriceRepository):
         response = requests.get(f"{self.base_url}/latest-prices.json")
         response.raise_for_status()
         
-        data = response.json()
-        return [
-            PricePoint(
-                price=price_data["price"],
-                start_date=datetime.fromisoformat(price_data["startDate"].replace("Z", "+00:00")),
-                end_date=datetime.fromisoformat(price_data["endDate"].replace("Z", "+00:00"))
-            )
-            for price_data in data["prices"]
-        ]
+        return parse_prices(response.json())
+
+    def iter_latest_prices(self, chunk_size: int = 1 << 16) -> Iterator[PricePoint]:
+        """
+        Stream the latest electricity prices from the API.
+        The response body is read and parsed incrementally, so memory use does not
+        grow with the payload size. Intended for bulk and archive payloads.
+
+        Args:
+            chunk_size (int): Number of bytes read from the response at a time
+
+        Returns:
+            Iterator[PricePoint]: Price points in response order
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        with requests.get(f"{self.base_url}/latest-prices.json", stream=True) as response:
+            response.raise_for_status()
+            yield from iter_price_points(response.iter_content(chunk_size))
+
+    def get_snapshot(self) -> PriceSnapshot:
+        """
+        Get the parsed price snapshot of the current publication cycle.
+        The snapshot is fetched at most once per cycle and shared by all callers;
+        concurrent calls wait for a single fetch. Each new snapshot's changes
+        describe how it differs from the snapshot fetched before it.
+
+        Returns:
+            PriceSnapshot: The shared snapshot
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        return self.snapshots.get()
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached snapshot so the next query fetches fresh data.
+        """
+        self.snapshots.invalidate()
+
+    def refresh(self) -> PriceSnapshot:
+        """
+        Fetch a new snapshot now. If the fetch fails, the cached snapshot is kept.
+
+        Returns:
+            PriceSnapshot: The new snapshot
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        return self.snapshots.refresh()
+
+    @property
+    def fetch_count(self) -> int:
+        """
+        Number of snapshot fetches performed so far.
+        """
+        return self.snapshots.fetch_count
 
     def get_current_and_next_hour_prices(self) -> tuple[PricePoint, PricePoint]:
         """
         Get the current hour's price and the next hour's price.
-        Fetches all prices and filters for the current and next hour.
+        Looks up the current and next slot in the cached snapshot.
 
         Returns:
             tuple[PricePoint, PricePoint]: Tuple containing (current_price, next_price)
@@ -61,49 +132,38 @@ class PorssiSahkoApiClient(PriceRepository):
         Raises:
             ValueError: If current or next hour price cannot be found
         """
-        prices = self.get_latest_prices()
-        now = datetime.now(timezone.utc)
-        prices.sort(key=lambda price: price.start_date)
-        # Find the current price
-        current_price = next(
-            (price for price in prices if price.start_date <= now < price.end_date),
-            None
-        )
+        return self.get_snapshot().current_and_next(self.clock.now())
 
-        if not current_price:
-            raise ValueError("No current price found")
+    def get_day_index(self) -> DayIndex:
+        """
+        Get the local-day partition of the cached snapshot.
 
-        # Find the next price
-        next_price = next(
-            (price for price in prices if price.start_date == current_price.end_date),
-            None
-        )
+        Returns:
+            DayIndex: Index over the snapshot's prices sorted by start time
+        """
+        return self.get_snapshot().day_index
 
-        if not next_price:
-            raise ValueError("No next hour price found")
+    def get_prices_for_day(self, day: date) -> List[PricePoint]:
+        """
+        Get electricity prices for one local calendar day.
+
+        Args:
+            day (date): The day in Finnish local time
 
-        return current_price, next_price
+        Returns:
+            List[PricePoint]: Price points starting on that day, empty if not available
+        """
+        return list(self.get_day_index().prices_for(day))
 
     def get_daily_prices(self) -> List[PricePoint]:
         """
         Get electricity prices for the current day and next day.
-        Filters the latest prices to include only today's and tomorrow's prices.
+        Days are local (Finnish) calendar days, so DST days have 23 or 25 hours.
 
         Returns:
             List[PricePoint]: List of price points for today and tomorrow
         """
-        prices = self.get_latest_prices()
-        now = datetime.now(timezone.utc)
-        start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_today = start_of_today + timedelta(days=1) - timedelta(microseconds=1)
-        start_of_tomorrow = end_of_today + timedelta(microseconds=1)
-        end_of_tomorrow = start_of_tomorrow + timedelta(days=1) - timedelta(microseconds=1)
-
-        # Filter prices for today and tomorrow
-        daily_prices = [
-            price for price in prices
-            if (start_of_today <= price.start_date <= end_of_today) or
-               (start_of_tomorrow <= price.start_date <= end_of_tomorrow)
-        ]
-
-        return daily_prices
\ No newline at end of file
+        index = self.get_day_index()
+        today = index.local_day(self.clock.now())
+        tomorrow = today + timedelta(days=1)
+        return list(index.prices_for(today)) + list(index.prices_for(tomorrow))
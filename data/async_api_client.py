@@ -0,0 +1,177 @@
+"""
+Asynchronous API client for the Porssisahko API.
+This module implements the AsyncPriceRepository interface on asyncio, with a
+pooled HTTP session and a bound on concurrent requests, so headless and
+server integrations can serve many queries from a single thread.
+Requires the optional aiohttp package.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from typing import List, Optional
+from domain.clock import Clock, SystemClock
+from domain.day_index import DayIndex
+from domain.entities import PricePoint
+from domain.repositories import AsyncPriceRepository
+from domain.snapshot import PriceSnapshot
+from .api_client import parse_prices
+from .snapshot_cache import AsyncSnapshotCache
+
+class AsyncPorssiSahkoApiClient(AsyncPriceRepository):
+    """
+    Asyncio client for the Porssisahko electricity price API.
+    Use it as an async context manager, or call close() when done, so the
+    pooled connections are released.
+    """
+
+    def __init__(self, base_url: str = "https://api.porssisahko.net/v1", clock: Optional[Clock] = None,
+                 max_connections: int = 4, max_concurrency: int = 16, timeout: float = 10.0):
+        """
+        Initialize the client. The HTTP session is created on first use, inside the running loop.
+
+        Args:
+            base_url (str): The base URL for the Porssisahko API
+            clock (Optional[Clock]): Source of the current time, the system clock by default
+            max_connections (int): Size of the HTTP connection pool
+            max_concurrency (int): Maximum number of requests in flight at once;
+                further requests wait for a free slot
+            timeout (float): Total timeout of one request in seconds
+        """
+        self.base_url = base_url
+        self.clock = clock or SystemClock()
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.snapshots = AsyncSnapshotCache(self.get_latest_prices, self.clock)
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("The async API client requires aiohttp: pip install aiohttp") from e
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the HTTP session and its pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncPorssiSahkoApiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def get_latest_prices(self) -> List[PricePoint]:
+        """
+        Fetch the latest electricity prices from the API.
+
+        Returns:
+            List[PricePoint]: List of price points containing price and time information
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.get(f"{self.base_url}/latest-prices.json") as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+
+        return parse_prices(data)
+
+    async def get_snapshot(self) -> PriceSnapshot:
+        """
+        Get the parsed price snapshot of the current publication cycle.
+        The snapshot is fetched at most once per cycle; concurrent callers await a single fetch.
+
+        Returns:
+            PriceSnapshot: The shared snapshot
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        return await self.snapshots.get()
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached snapshot so the next query fetches fresh data.
+        """
+        self.snapshots.invalidate()
+
+    async def refresh(self) -> PriceSnapshot:
+        """
+        Fetch a new snapshot now. If the fetch fails, the cached snapshot is kept.
+
+        Returns:
+            PriceSnapshot: The new snapshot
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        return await self.snapshots.refresh()
+
+    @property
+    def fetch_count(self) -> int:
+        """
+        Number of snapshot fetches performed so far.
+        """
+        return self.snapshots.fetch_count
+
+    async def get_current_and_next_hour_prices(self) -> tuple[PricePoint, PricePoint]:
+        """
+        Get the current hour's price and the next hour's price.
+
+        Returns:
+            tuple[PricePoint, PricePoint]: Tuple containing (current_price, next_price)
+
+        Raises:
+            ValueError: If current or next hour price cannot be found
+        """
+        snapshot = await self.get_snapshot()
+        return snapshot.current_and_next(self.clock.now())
+
+    async def get_day_index(self) -> DayIndex:
+        """
+        Get the local-day partition of the cached snapshot.
+
+        Returns:
+            DayIndex: Index over the snapshot's prices sorted by start time
+        """
+        snapshot = await self.get_snapshot()
+        return snapshot.day_index
+
+    async def get_prices_for_day(self, day: date) -> List[PricePoint]:
+        """
+        Get electricity prices for one local calendar day.
+
+        Args:
+            day (date): The day in Finnish local time
+
+        Returns:
+            List[PricePoint]: Price points starting on that day, empty if not available
+        """
+        index = await self.get_day_index()
+        return list(index.prices_for(day))
+
+    async def get_daily_prices(self) -> List[PricePoint]:
+        """
+        Get electricity prices for the current day and next day.
+
+        Returns:
+            List[PricePoint]: List of price points for today and tomorrow
+        """
+        index = await self.get_day_index()
+        today = index.local_day(self.clock.now())
+        tomorrow = today + timedelta(days=1)
+        return list(index.prices_for(today)) + list(index.prices_for(tomorrow))
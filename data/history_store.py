@@ -0,0 +1,286 @@
+"""
+Columnar, compressed export and import of price history.
+
+File layout (all integers little-endian):
+    header:  b"SPH1", version (uint8), price scale (uint32)
+    blocks:  row count (uint32), compressed size (uint32), zlib data
+
+Each block holds up to block_size rows as three columns: start times as
+deltas (int64, the first delta is from zero), slot durations (int32) and
+prices quantized to 1/scale cent as deltas (int64). Delta encoding makes
+regular time series highly compressible, and decoding is a decompress plus
+array.frombytes and a C-level prefix sum per column. Reading and writing
+stream block by block, so memory use is bounded by the block size.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
+from domain.entities import PricePoint
+from domain.series import PriceSeries
+
+MAGIC = b"SPH1"
+VERSION = 1
+DEFAULT_SCALE = 1000
+_HEADER = struct.Struct("<4sBI")
+_BLOCK = struct.Struct("<II")
+_ROW_SIZE = 8 + 4 + 8  # start delta, duration, price delta
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+PathOrFile = Union[str, BinaryIO]
+
+def _open(target: PathOrFile, mode: str):
+    if isinstance(target, str):
+        return open(target, mode)
+    return _Borrowed(target)
+
+class _Borrowed:
+    """
+    Context manager that leaves a caller-owned file open.
+    """
+
+    def __init__(self, file):
+        self.file = file
+
+    def __enter__(self):
+        return self.file
+
+    def __exit__(self, *exc):
+        return False
+
+def _column_bytes(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
+
+def _read_exactly(file: BinaryIO, size: int, what: str) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError(f"Truncated price history file: incomplete {what}")
+    return data
+
+def _deltas(values) -> array:
+    previous = 0
+    deltas = array("q")
+    for value in values:
+        deltas.append(value - previous)
+        previous = value
+    return deltas
+
+def write_history(target: PathOrFile, points: Iterable[PricePoint], block_size: int = 1 << 16,
+                  scale: int = DEFAULT_SCALE, level: int = 6) -> int:
+    """
+    Export price points in the columnar format.
+
+    Args:
+        target (PathOrFile): Path or binary file to write to
+        points (Iterable[PricePoint]): Price points, normally sorted by start time
+        block_size (int): Maximum number of rows per block
+        scale (int): Prices are stored rounded to 1/scale cent
+        level (int): zlib compression level
+
+    Returns:
+        int: Number of rows written
+    """
+    rows = 0
+    with _open(target, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, scale))
+        block = []
+        for point in points:
+            block.append(point)
+            if len(block) == block_size:
+                rows += _write_block(file, block, scale, level)
+                block = []
+        if block:
+            rows += _write_block(file, block, scale, level)
+    return rows
+
+def _write_block(file: BinaryIO, block, scale: int, level: int) -> int:
+    starts = _deltas(point.start_ts for point in block)
+    durations = array("i", (point.duration for point in block))
+    prices = _deltas(round(point.price * scale) for point in block)
+    payload = zlib.compress(_column_bytes(starts) + _column_bytes(durations) + _column_bytes(prices), level)
+    file.write(_BLOCK.pack(len(block), len(payload)))
+    file.write(payload)
+    return len(block)
+
+def iter_history_blocks(source: PathOrFile) -> Iterator[Tuple[array, array, array]]:
+    """
+    Read an exported file block by block as columns.
+
+    Args:
+        source (PathOrFile): Path or binary file to read from
+
+    Returns:
+        Iterator[Tuple[array, array, array]]: (prices, start_ts, end_ts) arrays of
+            type 'd', 'q' and 'q' per block, the same layout as iter_price_blocks()
+
+    Raises:
+        ValueError: If the file is not in the expected format or is truncated or corrupt
+    """
+    with _open(source, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError("Not a price history file")
+        magic, version, scale = _HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a price history file")
+        while True:
+            header = file.read(_BLOCK.size)
+            if not header:
+                return
+            if len(header) != _BLOCK.size:
+                raise ValueError("Truncated price history file: incomplete block header")
+            rows, size = _BLOCK.unpack(header)
+            payload = _read_exactly(file, size, "block")
+            try:
+                data = memoryview(zlib.decompress(payload))
+            except zlib.error as e:
+                raise ValueError(f"Corrupt price history block: {e}") from e
+            if len(data) != rows * _ROW_SIZE:
+                raise ValueError(f"Corrupt price history block: {len(data)} bytes for {rows} rows")
+
+            columns = []
+            offset = 0
+            for typecode in ("q", "i", "q"):
+                column = array(typecode)
+                end = offset + column.itemsize * rows
+                column.frombytes(data[offset:end])
+                if not _LITTLE_ENDIAN:
+                    column.byteswap()
+                columns.append(column)
+                offset = end
+            start_deltas, durations, price_deltas = columns
+
+            starts = array("q", accumulate(start_deltas))
+            ends = array("q", map(int.__add__, starts, durations))
+            prices = array("d", (value / scale for value in accumulate(price_deltas)))
+            yield prices, starts, ends
+
+def iter_history(source: PathOrFile) -> Iterator[PricePoint]:
+    """
+    Read an exported file as price points.
+
+    Args:
+        source (PathOrFile): Path or binary file to read from
+
+    Returns:
+        Iterator[PricePoint]: Price points in file order
+
+    Raises:
+        ValueError: If the file is not in the expected format or is truncated or corrupt
+    """
+    from_epoch = PricePoint.from_epoch
+    for prices, starts, ends in iter_history_blocks(source):
+        yield from map(from_epoch, prices, starts, ends)
+
+def load_series(source: PathOrFile, series: Optional[PriceSeries] = None) -> PriceSeries:
+    """
+    Import an exported file into an in-memory price series.
+    Blocks are merged one at a time, so apart from the series itself memory use is
+    bounded by the block size; the series holds one PricePoint per row.
+
+    Args:
+        source (PathOrFile): Path or binary file to read from
+        series (Optional[PriceSeries]): Series to merge into, a new one by default
+
+    Returns:
+        PriceSeries: The series containing the imported points
+
+    Raises:
+        ValueError: If the file is not in the expected format or is truncated or corrupt
+    """
+    series = series if series is not None else PriceSeries()
+    from_epoch = PricePoint.from_epoch
+    for prices, starts, ends in iter_history_blocks(source):
+        series.merge(map(from_epoch, prices, starts, ends))
+    return series
+
+def _import_pyarrow(action: str):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(f"Parquet {action} requires pyarrow: pip install pyarrow") from e
+    return pa, pq
+
+def write_parquet_blocks(path: str, blocks: Iterable[Tuple[array, array, array]]) -> int:
+    """
+    Export column blocks as a Parquet file, one record batch per block, so only
+    one block is held in memory at a time. Requires the optional pyarrow package.
+
+    Args:
+        path (str): Path of the Parquet file
+        blocks (Iterable[Tuple[array, array, array]]): (prices, start_ts, end_ts) columns per
+            block, e.g. from iter_history_blocks()
+
+    Returns:
+        int: Number of rows written
+    """
+    pa, pq = _import_pyarrow("export")
+    schema = pa.schema([
+        ("start", pa.timestamp("s", tz="UTC")),
+        ("end", pa.timestamp("s", tz="UTC")),
+        ("price", pa.float64()),
+    ])
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for prices, starts, ends in blocks:
+            writer.write_batch(pa.record_batch([
+                pa.array(starts, type=pa.int64()).cast(pa.timestamp("s", tz="UTC")),
+                pa.array(ends, type=pa.int64()).cast(pa.timestamp("s", tz="UTC")),
+                pa.array(prices, type=pa.float64()),
+            ], schema=schema))
+            rows += len(prices)
+    return rows
+
+def _point_blocks(points: Iterable[PricePoint], block_size: int) -> Iterator[Tuple[array, array, array]]:
+    prices, starts, ends = array("d"), array("q"), array("q")
+    for point in points:
+        prices.append(point.price)
+        starts.append(point.start_ts)
+        ends.append(point.end_ts)
+        if len(prices) == block_size:
+            yield prices, starts, ends
+            prices, starts, ends = array("d"), array("q"), array("q")
+    if prices:
+        yield prices, starts, ends
+
+def write_parquet(path: str, points: Iterable[PricePoint], block_size: int = 1 << 16) -> int:
+    """
+    Export price points as a Parquet file for analytics tools, streaming them in
+    record batches of block_size rows. Requires the optional pyarrow package.
+
+    Args:
+        path (str): Path of the Parquet file
+        points (Iterable[PricePoint]): Price points to export
+        block_size (int): Maximum number of rows per record batch
+
+    Returns:
+        int: Number of rows written
+    """
+    return write_parquet_blocks(path, _point_blocks(points, block_size))
+
+def read_parquet(path: str) -> Iterator[PricePoint]:
+    """
+    Import price points from a Parquet file written by write_parquet().
+    Requires the optional pyarrow package.
+
+    Args:
+        path (str): Path of the Parquet file
+
+    Returns:
+        Iterator[PricePoint]: Price points in file order
+    """
+    pa, pq = _import_pyarrow("import")
+
+    # Parquet has no second-resolution timestamps; they are read back as milliseconds
+    seconds = pa.timestamp("s", tz="UTC")
+    for batch in pq.ParquetFile(path).iter_batches():
+        starts = batch.column("start").cast(seconds).cast(pa.int64()).to_pylist()
+        ends = batch.column("end").cast(seconds).cast(pa.int64()).to_pylist()
+        prices = batch.column("price").to_pylist()
+        yield from map(PricePoint.from_epoch, prices, starts, ends)
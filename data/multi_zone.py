@@ -0,0 +1,120 @@
+"""
+Price monitoring across several bidding zones.
+Each zone has its own repository; snapshots are fetched concurrently and
+aligned into one shared ZonePriceTable for cross-zone comparison.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Mapping, Optional, Sequence
+from domain.clock import Clock
+from domain.snapshot import PriceSnapshot
+from domain.zones import ZonePriceTable
+from .api_client import PorssiSahkoApiClient
+
+class MultiZoneRepository:
+    """
+    Fetches and aligns the prices of several zones.
+    """
+
+    def __init__(self, repositories: Mapping[str, PorssiSahkoApiClient], max_workers: Optional[int] = None):
+        """
+        Initialize the repository.
+
+        Args:
+            repositories (Mapping[str, PorssiSahkoApiClient]): Price repository per zone code;
+                any repository with get_snapshot() works
+            max_workers (Optional[int]): Maximum number of concurrent fetches, one per zone by default
+        """
+        self.repositories = dict(repositories)
+        self.errors: Dict[str, Exception] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or max(1, len(self.repositories)),
+                                            thread_name_prefix="ZoneFetch")
+        self._snapshots: Dict[str, PriceSnapshot] = {}
+        self._table: Optional[ZonePriceTable] = None
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None, clock: Optional[Clock] = None,
+                 reuse: Sequence[PorssiSahkoApiClient] = ()) -> Optional["MultiZoneRepository"]:
+        """
+        Build the repository from the PRICE_ZONES environment variable,
+        a comma-separated list of ZONE=base_url entries, e.g.
+        "FI=https://api.porssisahko.net/v1,SE3=https://prices.example/v1".
+
+        Args:
+            environ (Optional[Mapping[str, str]]): Variables to read, os.environ by default
+            clock (Optional[Clock]): Clock shared by the zone clients
+            reuse (Sequence[PorssiSahkoApiClient]): Existing clients used for zones with the same base URL
+
+        Returns:
+            Optional[MultiZoneRepository]: The repository, None if PRICE_ZONES is not set
+
+        Raises:
+            ValueError: If an entry is not of the form ZONE=base_url
+        """
+        environ = os.environ if environ is None else environ
+        raw = environ.get("PRICE_ZONES", "").strip()
+        if not raw:
+            return None
+        existing = {client.base_url: client for client in reuse}
+        repositories = {}
+        for entry in raw.split(","):
+            zone, separator, base_url = entry.partition("=")
+            zone, base_url = zone.strip(), base_url.strip()
+            if not separator or not zone or not base_url:
+                raise ValueError(f"Invalid PRICE_ZONES entry: {entry!r}")
+            repositories[zone] = existing.get(base_url) or PorssiSahkoApiClient(base_url=base_url, clock=clock)
+        return cls(repositories)
+
+    @property
+    def zones(self):
+        """
+        Configured zone codes.
+        """
+        return tuple(self.repositories)
+
+    @property
+    def table(self) -> Optional[ZonePriceTable]:
+        """
+        The table built by the last refresh(), None before the first one or if no zone has data.
+        """
+        return self._table
+
+    def refresh(self) -> Optional[ZonePriceTable]:
+        """
+        Fetch the snapshots of all zones concurrently and align them.
+        Blocks until every zone has answered; UI code should call it off the UI thread.
+        Repositories serve cached snapshots within a publication cycle, so this is
+        cheap when nothing changed; the table is only rebuilt if a snapshot did.
+        A zone whose fetch fails keeps its previous snapshot and its error is
+        recorded in self.errors.
+
+        Returns:
+            Optional[ZonePriceTable]: The aligned table, None if no zone has data
+        """
+        futures = {zone: self._executor.submit(repository.get_snapshot)
+                   for zone, repository in self.repositories.items()}
+        snapshots = {}
+        errors = {}
+        for zone, future in futures.items():
+            try:
+                snapshots[zone] = future.result()
+            except Exception as e:
+                errors[zone] = e
+                if zone in self._snapshots:
+                    snapshots[zone] = self._snapshots[zone]
+        self.errors = errors
+
+        changed = snapshots.keys() != self._snapshots.keys() or any(
+            snapshot is not self._snapshots[zone] for zone, snapshot in snapshots.items()
+        )
+        if changed:
+            self._snapshots = snapshots
+            self._table = ZonePriceTable.from_snapshots(snapshots) if snapshots else None
+        return self._table
+
+    def close(self) -> None:
+        """
+        Stop the fetch threads.
+        """
+        self._executor.shutdown(wait=False)
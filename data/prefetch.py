@@ -0,0 +1,165 @@
+"""
+Publication-aware prefetching of price data.
+Day-ahead prices appear once a day in the early afternoon. The scheduler
+stays idle outside the publication window, polls with jittered exponential
+backoff inside it until tomorrow's prices are available, and keeps the
+snapshot cache warm so user-facing reads are served from memory.
+"""
+
+import random
+import threading
+from datetime import datetime, time, timedelta, timezone
+from typing import Callable, Optional
+from domain.day_index import LOCAL_TIMEZONE
+from domain.publication import PUBLICATION_TIME, PUBLICATION_WINDOW_END
+from domain.snapshot import PriceSnapshot
+
+class PrefetchScheduler:
+    """
+    Decides when to poll the repository and performs the polls.
+    run_once() can be driven by any timer; start() runs it on a background thread.
+    """
+
+    def __init__(self, repository, clock=None,
+                 window_start: time = PUBLICATION_TIME, window_end: time = PUBLICATION_WINDOW_END,
+                 base_delay: timedelta = timedelta(minutes=2), max_delay: timedelta = timedelta(minutes=10),
+                 jitter: float = 0.2, rand: Optional[random.Random] = None,
+                 on_update: Optional[Callable[[PriceSnapshot], None]] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            repository: Repository with get_snapshot(), refresh() and a snapshots cache,
+                e.g. PorssiSahkoApiClient
+            clock (Optional[Clock]): Source of the current time, the repository's clock by default
+            window_start (time): Local time at which polling for tomorrow's prices starts
+            window_end (time): Local time after which polling stops for the day
+            base_delay (timedelta): First retry delay when tomorrow's prices are missing
+            max_delay (timedelta): Upper bound of the retry delay; keep it below the
+                snapshot cache's retry interval so reads never have to refetch
+            jitter (float): Relative random spread applied to retry delays
+            rand (Optional[random.Random]): Random generator for the jitter
+            on_update (Optional[Callable[[PriceSnapshot], None]]): Called from the polling
+                thread whenever a poll fetched a new snapshot
+        """
+        self.repository = repository
+        self.clock = clock or repository.clock
+        self.window_start = window_start
+        self.window_end = window_end
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.rand = rand or random.Random()
+        self.on_update = on_update
+        self.attempts = 0
+        self.poll_count = 0
+        self.paused = False
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _instant(self, day, moment: time) -> datetime:
+        return datetime.combine(day, moment, tzinfo=LOCAL_TIMEZONE).astimezone(timezone.utc)
+
+    def _has_tomorrow(self, snapshot: Optional[PriceSnapshot], now: datetime) -> bool:
+        if snapshot is None:
+            return False
+        tomorrow = snapshot.day_index.local_day(now) + timedelta(days=1)
+        return bool(snapshot.day_index.prices_for(tomorrow))
+
+    def _poll(self) -> Optional[PriceSnapshot]:
+        self.poll_count += 1
+        previous = self.repository.snapshots.peek()
+        try:
+            snapshot = self.repository.refresh()
+        except Exception:
+            return previous  # the cached snapshot stays in place for readers
+        if snapshot is not previous and self.on_update:
+            self.on_update(snapshot)
+        return snapshot
+
+    def run_once(self) -> timedelta:
+        """
+        Poll if tomorrow's prices are due and missing, and decide when to run next.
+
+        Returns:
+            timedelta: Delay until run_once() should be called again
+        """
+        now = self.clock.now()
+        # Local times are only used to find the day; instants are compared in UTC,
+        # since subtracting two datetimes in the same ZoneInfo ignores DST changes
+        today = now.astimezone(LOCAL_TIMEZONE).date()
+        utc_now = now.astimezone(timezone.utc)
+        window_start = self._instant(today, self.window_start)
+        window_end = self._instant(today, self.window_end)
+        next_window = self._instant(today + timedelta(days=1), self.window_start)
+
+        snapshot = self.repository.snapshots.peek()
+        polled = False
+        if snapshot is None or not snapshot.day_index.prices_for(today):
+            # Nothing usable for today yet, e.g. at startup or after midnight
+            snapshot = self._poll()
+            polled = True
+
+        if self._has_tomorrow(snapshot, now) or utc_now >= window_end:
+            self.attempts = 0
+            return next_window - utc_now
+        if utc_now < window_start:
+            self.attempts = 0
+            return window_start - utc_now
+
+        # Inside the publication window and tomorrow's prices are still missing
+        if not polled:
+            snapshot = self._poll()
+            if self._has_tomorrow(snapshot, now):
+                self.attempts = 0
+                return next_window - utc_now
+
+        delay = min(self.max_delay, self.base_delay * (2 ** self.attempts))
+        delay *= 1 + self.rand.uniform(-self.jitter, self.jitter)
+        self.attempts += 1
+        return min(delay, window_end - utc_now)
+
+    def start(self) -> None:
+        """
+        Run the scheduler on a daemon thread until stop() is called.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="PrefetchScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def pause(self) -> None:
+        """
+        Suspend polling without stopping the thread; it sleeps until resume() or stop().
+        Readers still refetch through the snapshot cache when its cycle expires.
+        """
+        self.paused = True
+        self._wake.set()
+
+    def resume(self) -> None:
+        """
+        Resume polling, starting with an immediate run_once().
+        """
+        self.paused = False
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if self.paused:
+                self._wake.wait()
+            else:
+                self._wake.wait(max(1.0, self.run_once().total_seconds()))
+            # Flags are read after clearing, so a pause or resume set meanwhile is not lost
+            self._wake.clear()
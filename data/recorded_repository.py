@@ -0,0 +1,54 @@
+"""
+Repository that serves recorded prices instead of calling the API.
+Used to replay price history through the application logic, e.g. in
+simulations driven by a ManualClock.
+"""
+
+import bisect
+from datetime import timedelta
+from typing import List, Sequence
+from domain.clock import Clock
+from domain.day_index import DayIndex
+from domain.entities import PricePoint, to_epoch
+from domain.publication import published_through
+from .api_client import PorssiSahkoApiClient
+
+class RecordedPriceRepository(PorssiSahkoApiClient):
+    """
+    Serves a window of recorded prices around the clock's current time,
+    mimicking what latest-prices.json returns at that moment: recent history
+    plus every day published so far.
+    All other queries reuse the API client's logic unchanged.
+    """
+
+    def __init__(self, prices: Sequence[PricePoint], clock: Clock,
+                 history: timedelta = timedelta(hours=24), publication_delay: timedelta = timedelta(0)):
+        """
+        Initialize the repository with recorded prices.
+
+        Args:
+            prices (Sequence[PricePoint]): Recorded price points in any order
+            clock (Clock): Source of the current time
+            history (timedelta): How far back from now prices are served
+            publication_delay (timedelta): How late after the scheduled publication
+                time the next day's prices appear
+        """
+        super().__init__(base_url="", clock=clock)
+        self._prices = sorted(prices, key=lambda price: price.start_ts)
+        self._starts = [price.start_ts for price in self._prices]
+        self._index = DayIndex(self._prices)
+        self.history = history
+        self.publication_delay = publication_delay
+
+    def get_latest_prices(self) -> List[PricePoint]:
+        """
+        Get the recorded prices visible at the clock's current time.
+
+        Returns:
+            List[PricePoint]: Price points starting within the served window
+        """
+        now = self.clock.now()
+        first = bisect.bisect_left(self._starts, to_epoch(now - self.history))
+        last_day = published_through(now - self.publication_delay) + timedelta(days=1)
+        last = bisect.bisect_left(self._starts, to_epoch(self._index.day_start(last_day)))
+        return self._prices[first:last]
@@ -0,0 +1,259 @@
+"""
+Memoized, single-flight access to price snapshots.
+Concurrent requests for the same data share one fetch, and the parsed
+snapshot is reused until the publication cycle changes or it is
+explicitly invalidated.
+"""
+
+import asyncio
+import threading
+from datetime import timedelta
+from typing import Awaitable, Callable, Iterable, Optional
+from domain.clock import Clock
+from domain.entities import PricePoint
+from domain.publication import publication_cycle
+from domain.snapshot import PriceSnapshot
+
+class _Flight:
+    """
+    A fetch in progress that other callers can wait on.
+    """
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.done = threading.Event()
+        self.snapshot = None
+        self.error = None
+
+class BaseSnapshotCache:
+    """
+    Freshness, generation and build logic shared by the synchronous and asyncio caches.
+    Subclasses decide how callers share a fetch.
+    """
+
+    def __init__(self, loader: Callable, clock: Clock,
+                 retry_interval: timedelta = timedelta(minutes=15)):
+        """
+        Initialize an empty cache.
+
+        Args:
+            loader (Callable): Fetches the raw prices
+            clock (Clock): Source of the current time
+            retry_interval (timedelta): Minimum time between refetches of a snapshot
+                that is still missing the prices published in its cycle
+        """
+        self.loader = loader
+        self.clock = clock
+        self.retry_interval = retry_interval
+        self.fetch_count = 0
+        self._snapshot: Optional[PriceSnapshot] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        # Fetches of different generations can overlap; their builds must not
+        self._build_lock = threading.Lock()
+        self._last_built: Optional[PriceSnapshot] = None
+
+    def peek(self) -> Optional[PriceSnapshot]:
+        """
+        Get the cached snapshot without fetching, even if it is stale.
+
+        Returns:
+            Optional[PriceSnapshot]: The cached snapshot, None if nothing was fetched yet
+        """
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached snapshot so the next get() fetches fresh data.
+        Fetches already in flight are not reused by later callers.
+        """
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+
+    def is_fresh(self, snapshot: PriceSnapshot) -> bool:
+        """
+        Check whether a snapshot can still be served.
+
+        Args:
+            snapshot (PriceSnapshot): The snapshot to check
+
+        Returns:
+            bool: True if it belongs to the current publication cycle and is complete,
+                or was fetched less than retry_interval ago
+        """
+        now = self.clock.now()
+        if snapshot.cycle != publication_cycle(now):
+            return False
+        return snapshot.is_complete or now - snapshot.fetched_at < self.retry_interval
+
+    def _cached(self, force: bool) -> Optional[PriceSnapshot]:
+        # Called with self._lock held. A forced fetch starts a new generation
+        # without dropping the snapshot readers are served meanwhile.
+        if force:
+            self._generation += 1
+            return None
+        if self._snapshot is not None and self.is_fresh(self._snapshot):
+            return self._snapshot
+        return None
+
+    def _store(self, snapshot: PriceSnapshot, generation: int) -> None:
+        # Called with self._lock held; fetches of an older generation are not cached
+        if generation == self._generation:
+            self._snapshot = snapshot
+
+    def _build(self, prices, fetched_at) -> PriceSnapshot:
+        # Builds are serialized so each snapshot's changes are relative to the one built before it
+        with self._build_lock:
+            snapshot = PriceSnapshot.from_prices(prices, fetched_at, previous=self._last_built)
+            self._last_built = snapshot
+            return snapshot
+
+class SnapshotCache(BaseSnapshotCache):
+    """
+    Caches the latest PriceSnapshot keyed by publication cycle.
+    Concurrent threads calling get() share one fetch.
+    """
+
+    def __init__(self, loader: Callable[[], Iterable[PricePoint]], clock: Clock,
+                 retry_interval: timedelta = timedelta(minutes=15)):
+        """
+        Initialize an empty cache.
+
+        Args:
+            loader (Callable[[], Iterable[PricePoint]]): Fetches the raw prices
+            clock (Clock): Source of the current time
+            retry_interval (timedelta): Minimum time between refetches of a snapshot
+                that is still missing the prices published in its cycle
+        """
+        super().__init__(loader, clock, retry_interval)
+        self._flight: Optional[_Flight] = None
+
+    def get(self) -> PriceSnapshot:
+        """
+        Get the current snapshot, fetching it if needed.
+        If another thread is already fetching, waits for that fetch instead of starting another.
+
+        Returns:
+            PriceSnapshot: The shared snapshot
+
+        Raises:
+            Exception: Whatever the loader raised if the fetch failed
+        """
+        return self._get(force=False)
+
+    def refresh(self) -> PriceSnapshot:
+        """
+        Fetch a new snapshot even if the cached one is fresh.
+        The cached snapshot is only replaced if the fetch succeeds, so a failed
+        refresh leaves readers with the previous data.
+
+        Returns:
+            PriceSnapshot: The new snapshot
+
+        Raises:
+            Exception: Whatever the loader raised if the fetch failed
+        """
+        return self._get(force=True)
+
+    def _get(self, force: bool) -> PriceSnapshot:
+        with self._lock:
+            cached = self._cached(force)
+            if cached is not None:
+                return cached
+            flight = self._flight
+            leader = flight is None or flight.generation != self._generation
+            if leader:
+                flight = self._flight = _Flight(self._generation)
+                self.fetch_count += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.snapshot
+
+        try:
+            fetched_at = self.clock.now()
+            flight.snapshot = self._build(list(self.loader()), fetched_at)
+            return flight.snapshot
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flight is flight:
+                    self._flight = None
+                if flight.snapshot is not None:
+                    self._store(flight.snapshot, flight.generation)
+            flight.done.set()
+
+class AsyncSnapshotCache(BaseSnapshotCache):
+    """
+    Caches the latest PriceSnapshot keyed by publication cycle, for asyncio loaders.
+    Concurrent coroutines awaiting get() share one fetch task.
+    """
+
+    def __init__(self, loader: Callable[[], Awaitable[Iterable[PricePoint]]], clock: Clock,
+                 retry_interval: timedelta = timedelta(minutes=15)):
+        """
+        Initialize an empty cache.
+
+        Args:
+            loader (Callable[[], Awaitable[Iterable[PricePoint]]]): Coroutine function fetching the raw prices
+            clock (Clock): Source of the current time
+            retry_interval (timedelta): Minimum time between refetches of an incomplete snapshot
+        """
+        super().__init__(loader, clock, retry_interval)
+        self._task: Optional[asyncio.Task] = None
+        self._task_generation = 0
+
+    async def get(self) -> PriceSnapshot:
+        """
+        Get the current snapshot, fetching it if needed.
+        If another coroutine is already fetching, awaits that fetch instead of starting another.
+        Cancelling one caller does not cancel the shared fetch.
+
+        Returns:
+            PriceSnapshot: The shared snapshot
+
+        Raises:
+            Exception: Whatever the loader raised if the fetch failed
+        """
+        return await self._get(force=False)
+
+    async def refresh(self) -> PriceSnapshot:
+        """
+        Fetch a new snapshot even if the cached one is fresh, keeping the cached one if the fetch fails.
+
+        Returns:
+            PriceSnapshot: The new snapshot
+
+        Raises:
+            Exception: Whatever the loader raised if the fetch failed
+        """
+        return await self._get(force=True)
+
+    async def _get(self, force: bool) -> PriceSnapshot:
+        with self._lock:
+            cached = self._cached(force)
+            if cached is not None:
+                return cached
+            if self._task is None or self._task_generation != self._generation:
+                self._task = asyncio.ensure_future(self._fetch(self._generation))
+                self._task_generation = self._generation
+                self.fetch_count += 1
+            task = self._task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, generation: int) -> PriceSnapshot:
+        try:
+            fetched_at = self.clock.now()
+            snapshot = self._build(list(await self.loader()), fetched_at)
+            with self._lock:
+                self._store(snapshot, generation)
+            return snapshot
+        finally:
+            with self._lock:
+                if self._task is asyncio.current_task():
+                    self._task = None
@@ -0,0 +1,193 @@
+"""
+Streaming ingestion of price payloads.
+Reads latest-prices.json style documents incrementally from an HTTP
+response or a file and yields price rows one at a time, so peak memory
+stays flat regardless of payload size.
+"""
+
+import codecs
+import json
+from array import array
+from datetime import datetime
+from typing import Iterable, Iterator, Tuple, Union
+from domain.entities import PricePoint, to_epoch
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+def parse_price(price_data: dict) -> PricePoint:
+    """
+    Convert one decoded price row into a PricePoint.
+
+    Args:
+        price_data (dict): A row with "price", "startDate" and "endDate"
+
+    Returns:
+        PricePoint: The parsed price point
+    """
+    return PricePoint.from_epoch(
+        price_data["price"],
+        to_epoch(datetime.fromisoformat(price_data["startDate"].replace("Z", "+00:00"))),
+        to_epoch(datetime.fromisoformat(price_data["endDate"].replace("Z", "+00:00")))
+    )
+
+def iter_array_items(chunks: Iterable[Union[bytes, str]], key: str = "prices") -> Iterator[object]:
+    """
+    Yield the items of an array member of the top-level object without decoding the whole document.
+    Only the item being decoded and the unread part of the current chunk are kept in memory;
+    values of members before the array are decoded one at a time and discarded.
+
+    Args:
+        chunks (Iterable[Union[bytes, str]]): The document in pieces of any size;
+            bytes are decoded as UTF-8
+        key (str): Name of the member holding the array
+
+    Returns:
+        Iterator[object]: The decoded array items in document order
+
+    Raises:
+        ValueError: If the document is malformed or ends before the array is closed
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    pieces = iter(chunks)
+    buffer = ""
+    position = 0
+    exhausted = False
+
+    def read_more() -> bool:
+        nonlocal buffer, position, exhausted
+        if exhausted:
+            return False
+        try:
+            piece = next(pieces)
+        except StopIteration:
+            exhausted = True
+            buffer = buffer[position:] + utf8.decode(b"", final=True)
+            position = 0
+            return True
+        if isinstance(piece, bytes):
+            piece = utf8.decode(piece)
+        buffer = buffer[position:] + piece
+        position = 0
+        return True
+
+    def peek() -> str:
+        # Skip whitespace and return the next character, reading more input as needed
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                raise ValueError("Unexpected end of document")
+
+    def expect(expected: str) -> None:
+        nonlocal position
+        if peek() != expected:
+            raise ValueError(f"Expected '{expected}' at offset {position}")
+        position += 1
+
+    def decode() -> object:
+        # Decode the value at the current position, which may span several chunks
+        nonlocal position
+        peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not read_more():
+                    raise
+                continue
+            if end == len(buffer) and not exhausted:
+                # A number at the end of the buffer may continue in the next chunk
+                read_more()
+                continue
+            position = end
+            return value
+
+    # Walk the members of the top-level object up to the array. Values of earlier
+    # members are decoded and discarded, so a nested member with the same name
+    # is never mistaken for the array.
+    expect("{")
+    while True:
+        if peek() == "}":
+            raise ValueError(f"No '{key}' member found")
+        name = decode()
+        if not isinstance(name, str):
+            raise ValueError(f"Expected a member name at offset {position}")
+        expect(":")
+        if name == key:
+            break
+        decode()
+        if peek() == ",":
+            position += 1
+    expect("[")
+
+    # Decode items one by one
+    while True:
+        separator = peek()
+        if separator == "]":
+            return
+        if separator == ",":
+            position += 1
+            continue
+        yield decode()
+
+def iter_price_points(chunks: Iterable[Union[bytes, str]]) -> Iterator[PricePoint]:
+    """
+    Yield price points from a latest-prices.json document read in pieces.
+
+    Args:
+        chunks (Iterable[Union[bytes, str]]): The document in pieces of any size
+
+    Returns:
+        Iterator[PricePoint]: Price points in document order
+    """
+    for price_data in iter_array_items(chunks, "prices"):
+        yield parse_price(price_data)
+
+def iter_price_file(path: str, chunk_size: int = 1 << 16) -> Iterator[PricePoint]:
+    """
+    Yield price points from a latest-prices.json style file, e.g. an archive dump.
+
+    Args:
+        path (str): Path of the JSON file
+        chunk_size (int): Number of bytes read at a time
+
+    Returns:
+        Iterator[PricePoint]: Price points in file order
+    """
+    with open(path, "rb") as file:
+        yield from iter_price_points(iter(lambda: file.read(chunk_size), b""))
+
+def iter_price_blocks(points: Iterable[PricePoint], block_size: int = 1 << 16) -> Iterator[Tuple[array, array, array]]:
+    """
+    Pack price points into preallocated columnar blocks.
+    Each yielded block owns its arrays; only one block is filled at a time.
+
+    Args:
+        points (Iterable[PricePoint]): Price points, e.g. from iter_price_file()
+        block_size (int): Number of rows per block
+
+    Returns:
+        Iterator[Tuple[array, array, array]]: (prices, start_ts, end_ts) arrays of
+            type 'd', 'q' and 'q'; the last block may be shorter
+    """
+    count = 0
+    prices = starts = ends = None
+    for point in points:
+        if count == 0:
+            prices = array("d", bytes(8 * block_size))
+            starts = array("q", bytes(8 * block_size))
+            ends = array("q", bytes(8 * block_size))
+        prices[count] = point.price
+        starts[count] = point.start_ts
+        ends[count] = point.end_ts
+        count += 1
+        if count == block_size:
+            yield prices, starts, ends
+            count = 0
+    if count:
+        del prices[count:], starts[count:], ends[count:]
+        yield prices, starts, ends
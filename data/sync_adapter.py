@@ -0,0 +1,174 @@
+"""
+Synchronous access to asynchronous price repositories.
+An asyncio event loop runs on a background thread and synchronous callers
+block on the coroutines submitted to it, so existing PriceRepository users
+can run on top of an AsyncPriceRepository unchanged.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from datetime import date
+from typing import Awaitable, List, Optional, TypeVar
+from domain.day_index import DayIndex
+from domain.entities import PricePoint
+from domain.repositories import AsyncPriceRepository, PriceRepository
+from domain.snapshot import PriceSnapshot
+
+T = TypeVar("T")
+
+class BackgroundLoop:
+    """
+    An asyncio event loop running on a daemon thread.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="BackgroundLoop", daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine: Awaitable[T]) -> "Future[T]":
+        """
+        Schedule a coroutine on the loop.
+
+        Args:
+            coroutine (Awaitable[T]): The coroutine to run
+
+        Returns:
+            Future[T]: Thread-safe future resolved with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coroutine (Awaitable[T]): The coroutine to run
+            timeout (Optional[float]): Seconds to wait, forever by default
+
+        Returns:
+            T: The coroutine's result
+
+        Raises:
+            Exception: Whatever the coroutine raised
+        """
+        return self.submit(coroutine).result(timeout)
+
+    def stop(self) -> None:
+        """
+        Stop the loop and wait for its thread to exit.
+        """
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+class SyncPriceRepository(PriceRepository):
+    """
+    Exposes an AsyncPriceRepository through the synchronous PriceRepository interface.
+    Calls from any thread are served by one shared event loop, so concurrent
+    callers still share the async repository's connection pool and single-flight cache.
+    """
+
+    def __init__(self, repository: AsyncPriceRepository, loop: Optional[BackgroundLoop] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            repository (AsyncPriceRepository): The wrapped async repository
+            loop (Optional[BackgroundLoop]): Loop to run the repository on, a new one by default
+        """
+        self.repository = repository
+        self.clock = repository.clock
+        self.background = loop or BackgroundLoop()
+
+    def get_latest_prices(self) -> List[PricePoint]:
+        """
+        Fetch the latest electricity prices from the data source.
+
+        Returns:
+            List[PricePoint]: List of price points containing price and time information
+        """
+        return self.background.run(self.repository.get_latest_prices())
+
+    def get_current_and_next_hour_prices(self) -> tuple[PricePoint, PricePoint]:
+        """
+        Get the current hour's price and the next hour's price.
+
+        Returns:
+            tuple[PricePoint, PricePoint]: Tuple containing (current_price, next_price)
+
+        Raises:
+            ValueError: If current or next hour price cannot be found
+        """
+        return self.background.run(self.repository.get_current_and_next_hour_prices())
+
+    def get_snapshot(self) -> PriceSnapshot:
+        """
+        Get the parsed price snapshot of the current publication cycle.
+
+        Returns:
+            PriceSnapshot: The shared snapshot
+        """
+        return self.background.run(self.repository.get_snapshot())
+
+    @property
+    def snapshots(self):
+        """
+        The wrapped repository's snapshot cache.
+        """
+        return self.repository.snapshots
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached snapshot so the next query fetches fresh data.
+        """
+        self.repository.invalidate()
+
+    def refresh(self) -> PriceSnapshot:
+        """
+        Fetch a new snapshot now. If the fetch fails, the cached snapshot is kept.
+
+        Returns:
+            PriceSnapshot: The new snapshot
+        """
+        return self.background.run(self.repository.refresh())
+
+    @property
+    def fetch_count(self) -> int:
+        """
+        Number of snapshot fetches performed so far.
+        """
+        return self.repository.fetch_count
+
+    def get_day_index(self) -> DayIndex:
+        """
+        Get the local-day partition of the cached snapshot.
+
+        Returns:
+            DayIndex: Index over the snapshot's prices sorted by start time
+        """
+        return self.get_snapshot().day_index
+
+    def get_prices_for_day(self, day: date) -> List[PricePoint]:
+        """
+        Get electricity prices for one local calendar day.
+
+        Args:
+            day (date): The day in Finnish local time
+
+        Returns:
+            List[PricePoint]: Price points starting on that day, empty if not available
+        """
+        return list(self.get_day_index().prices_for(day))
+
+    def close(self) -> None:
+        """
+        Close the wrapped repository, if it supports it, and stop the event loop.
+        """
+        close = getattr(self.repository, "close", None)
+        if close is not None:
+            self.background.run(close())
+        self.background.stop()
@@ -0,0 +1,235 @@
+"""
+Online price anomaly detection.
+Consumes the price series slot by slot with constant-time, constant-memory
+statistics (EWMA mean and variance, and a P² quantile sketch for the median)
+and reports relative events that fixed limits miss: negative prices, sudden
+spikes and prices far above the recent median.
+"""
+
+import math
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterable, List, Optional
+from .entities import PricePoint
+
+class AnomalyKind(Enum):
+    """
+    Types of price anomalies.
+    """
+    NEGATIVE_PRICE = "negative_price"
+    SPIKE = "spike"
+    DROP = "drop"
+    ABOVE_MEDIAN = "above_median"
+
+@dataclass(frozen=True)
+class PriceAnomaly:
+    """
+    An anomaly detected in a price slot.
+
+    Attributes:
+        kind (AnomalyKind): The type of anomaly
+        price (PricePoint): The slot the anomaly was detected in
+        value (float): The statistic that triggered it (price, z-score or median ratio)
+        message (str): Human-readable description for notifications
+    """
+    kind: AnomalyKind
+    price: PricePoint
+    value: float
+    message: str
+
+@dataclass(frozen=True)
+class DetectorConfig:
+    """
+    Sensitivity of the anomaly detector.
+
+    Attributes:
+        alpha (float): EWMA smoothing factor; 2 / (N + 1) weighs roughly the last N slots
+        z_threshold (float): Rolling z-score beyond which a spike or drop is reported
+        median_ratio (float): Ratio to the reference median above which a price is reported
+        window (int): Slots per median window (168 hourly slots = one week)
+        warmup (int): Slots consumed before any spike, drop or median event is reported
+    """
+    alpha: float = 2 / (24 + 1)
+    z_threshold: float = 3.0
+    median_ratio: float = 3.0
+    window: int = 168
+    warmup: int = 48
+
+class P2Quantile:
+    """
+    P² streaming quantile estimator (Jain & Chlamtac, 1985).
+    Tracks one quantile with five markers, in constant time and memory per sample.
+    """
+
+    def __init__(self, quantile: float = 0.5):
+        """
+        Args:
+            quantile (float): The quantile to estimate, between 0 and 1
+        """
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float) -> None:
+        """
+        Add a sample.
+
+        Args:
+            value (float): The sample value
+        """
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            self._desired[index] += self._increments[index]
+
+        for index in range(1, 4):
+            offset = self._desired[index] - positions[index]
+            if (offset >= 1 and positions[index + 1] - positions[index] > 1) or \
+               (offset <= -1 and positions[index - 1] - positions[index] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(index, step)
+                if not heights[index - 1] < height < heights[index + 1]:
+                    height = heights[index] + step * (heights[index + step] - heights[index]) / \
+                        (positions[index + step] - positions[index])
+                heights[index] = height
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[index] + step / (positions[index + 1] - positions[index - 1]) * (
+            (positions[index] - positions[index - 1] + step) * (heights[index + 1] - heights[index]) /
+            (positions[index + 1] - positions[index]) +
+            (positions[index + 1] - positions[index] - step) * (heights[index] - heights[index - 1]) /
+            (positions[index] - positions[index - 1])
+        )
+
+    @property
+    def value(self) -> Optional[float]:
+        """
+        The current estimate, None before the first sample.
+        """
+        if not self._heights:
+            return None
+        if self.count <= 5:
+            ordered = self._heights
+            return ordered[min(len(ordered) - 1, int(round(self.quantile * (len(ordered) - 1))))]
+        return self._heights[2]
+
+class AnomalyDetector:
+    """
+    Streaming detector fed one price slot at a time.
+    The median reference is the estimate of the last completed window (e.g. last
+    week), so memory stays constant while the reference follows the market.
+    """
+
+    def __init__(self, config: Optional[DetectorConfig] = None):
+        """
+        Args:
+            config (Optional[DetectorConfig]): Detector sensitivity, defaults if omitted
+        """
+        self.config = config or DetectorConfig()
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.reference_median: Optional[float] = None
+        self._window = P2Quantile(0.5)
+        self._windows_completed = 0
+
+    def update(self, point: PricePoint, price: Optional[float] = None) -> List[PriceAnomaly]:
+        """
+        Consume the next slot and report its anomalies.
+        The slot is compared with the statistics of the slots before it.
+
+        Args:
+            point (PricePoint): The price slot
+            price (Optional[float]): Price to evaluate instead of point.price, e.g. the total price
+
+        Returns:
+            List[PriceAnomaly]: Anomalies of this slot, empty if none
+        """
+        config = self.config
+        value = point.price if price is None else price
+        anomalies = []
+
+        if value < 0:
+            anomalies.append(PriceAnomaly(AnomalyKind.NEGATIVE_PRICE, point, value,
+                                          f"Negative price: {value:.3f} snt/kWh"))
+
+        if self.count >= config.warmup:
+            deviation = math.sqrt(self.variance)
+            if deviation > 0:
+                z_score = (value - self.mean) / deviation
+                if z_score >= config.z_threshold:
+                    anomalies.append(PriceAnomaly(AnomalyKind.SPIKE, point, z_score,
+                                                  f"Price spike: {value:.3f} snt/kWh is {z_score:.1f} "
+                                                  f"standard deviations above the recent average"))
+                elif z_score <= -config.z_threshold:
+                    anomalies.append(PriceAnomaly(AnomalyKind.DROP, point, z_score,
+                                                  f"Price drop: {value:.3f} snt/kWh is {-z_score:.1f} "
+                                                  f"standard deviations below the recent average"))
+            median = self.reference_median
+            if median is not None and median > 0 and value >= config.median_ratio * median:
+                ratio = value / median
+                anomalies.append(PriceAnomaly(AnomalyKind.ABOVE_MEDIAN, point, ratio,
+                                              f"Price {value:.3f} snt/kWh is {ratio:.1f}x "
+                                              f"the recent median ({median:.3f} snt/kWh)"))
+
+        # Update the statistics after evaluating, so a slot is not compared with itself
+        if self.count == 0:
+            self.mean = value
+        else:
+            difference = value - self.mean
+            increment = config.alpha * difference
+            self.mean += increment
+            self.variance = (1 - config.alpha) * (self.variance + difference * increment)
+        self.count += 1
+
+        self._window.add(value)
+        if self._window.count >= config.window:
+            self.reference_median = self._window.value
+            self._window = P2Quantile(0.5)
+            self._windows_completed += 1
+        elif not self._windows_completed and self._window.count >= config.warmup:
+            # Until the first window completes, follow the partial window
+            self.reference_median = self._window.value
+
+        return anomalies
+
+def replay(points: Iterable[PricePoint], config: Optional[DetectorConfig] = None) -> List[PriceAnomaly]:
+    """
+    Run a detector over stored history, e.g. to tune its sensitivity.
+
+    Args:
+        points (Iterable[PricePoint]): Price slots sorted by start time
+        config (Optional[DetectorConfig]): Detector sensitivity
+
+    Returns:
+        List[PriceAnomaly]: All anomalies in slot order
+    """
+    detector = AnomalyDetector(config)
+    anomalies = []
+    for point in points:
+        anomalies.extend(detector.update(point))
+    return anomalies
@@ -0,0 +1,80 @@
+"""
+Clock abstraction for the Electricity Spot Price Monitor application.
+All components ask a Clock for the current time instead of calling
+datetime.now() directly, so time can be fixed in tests or accelerated
+in simulations.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+
+class Clock(ABC):
+    """
+    Abstract source of the current time.
+    """
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """
+        Get the current time.
+
+        Returns:
+            datetime: The current timezone-aware time in UTC
+        """
+        pass
+
+class SystemClock(Clock):
+    """
+    Clock backed by the system wall clock.
+    """
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+class ManualClock(Clock):
+    """
+    Clock that only moves when told to. Used by tests and simulations.
+    """
+
+    def __init__(self, start: datetime):
+        """
+        Initialize the clock at a fixed time.
+
+        Args:
+            start (datetime): Timezone-aware start time
+        """
+        self._now = start.astimezone(timezone.utc)
+
+    def now(self) -> datetime:
+        return self._now
+
+    def set(self, moment: datetime) -> None:
+        """
+        Jump to the given time.
+
+        Args:
+            moment (datetime): Timezone-aware time to jump to
+        """
+        self._now = moment.astimezone(timezone.utc)
+
+    def advance(self, delta: timedelta) -> None:
+        """
+        Move the clock forward.
+
+        Args:
+            delta (timedelta): Amount of time to move forward
+        """
+        self._now += delta
+
+def time_until_next_hour(now: datetime) -> timedelta:
+    """
+    Get the time remaining until the start of the next hour.
+
+    Args:
+        now (datetime): The current time
+
+    Returns:
+        timedelta: Time until the next full hour, always greater than zero
+    """
+    next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+    return next_hour - now
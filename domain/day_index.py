@@ -0,0 +1,104 @@
+"""
+Local-day partition index for price series.
+Users think in Finnish local time (EET/EEST), so day-oriented views are
+partitioned by local calendar day rather than by UTC midnight.
+"""
+
+import bisect
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Sequence, Tuple
+from zoneinfo import ZoneInfo
+from .entities import PricePoint, to_epoch
+
+LOCAL_TIMEZONE = ZoneInfo("Europe/Helsinki")
+
+class DayIndex:
+    """
+    Maps local calendar days to slices of a price list sorted by start time.
+    The index is built once per fetched price list; day lookups are O(1)
+    and need no datetime arithmetic. Local midnights are resolved through
+    the time zone database, so 23- and 25-hour DST days are handled.
+    """
+
+    def __init__(self, prices: Sequence[PricePoint], tz: ZoneInfo = LOCAL_TIMEZONE):
+        """
+        Build the index.
+
+        Args:
+            prices (Sequence[PricePoint]): Price points sorted by start time
+            tz (ZoneInfo): Time zone whose calendar days are indexed
+        """
+        self.prices = prices
+        self.tz = tz
+        self._spans: Dict[date, Tuple[int, int]] = {}
+
+        if not prices:
+            return
+
+        starts = [price.start_ts for price in prices]
+        day = prices[0].start_date.astimezone(tz).date()
+        last_day = prices[-1].start_date.astimezone(tz).date()
+        offset = 0
+        while day <= last_day:
+            next_day = day + timedelta(days=1)
+            end = bisect.bisect_left(starts, to_epoch(self.day_start(next_day)), lo=offset)
+            if end > offset:
+                self._spans[day] = (offset, end)
+            offset = end
+            day = next_day
+
+    def day_start(self, day: date) -> datetime:
+        """
+        Get the UTC instant at which a local day starts.
+
+        Args:
+            day (date): The local calendar day
+
+        Returns:
+            datetime: Local midnight of the day, converted to UTC
+        """
+        return datetime.combine(day, time(), tzinfo=self.tz).astimezone(timezone.utc)
+
+    def local_day(self, moment: datetime) -> date:
+        """
+        Get the local calendar day of an instant.
+
+        Args:
+            moment (datetime): A timezone-aware instant
+
+        Returns:
+            date: The local calendar day containing the instant
+        """
+        return moment.astimezone(self.tz).date()
+
+    @property
+    def days(self) -> List[date]:
+        """
+        The local days that have at least one price, in order.
+        """
+        return list(self._spans)
+
+    def span(self, day: date) -> Tuple[int, int]:
+        """
+        Get the slice offsets of a local day.
+
+        Args:
+            day (date): The local calendar day
+
+        Returns:
+            Tuple[int, int]: (start, stop) offsets into the price list, (0, 0) if the day has no prices
+        """
+        return self._spans.get(day, (0, 0))
+
+    def prices_for(self, day: date) -> Sequence[PricePoint]:
+        """
+        Get the prices of a local day.
+
+        Args:
+            day (date): The local calendar day
+
+        Returns:
+            Sequence[PricePoint]: Price points starting on that day, empty if none
+        """
+        start, stop = self.span(day)
+        return self.prices[start:stop]
@@ -3,22 +3,136 @@ Domain entities for the Electricity Spot Price Monitor application.
 This module defines the core data structures used throughout the application.
 """
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import FrozenInstanceError, dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Optional
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SECOND = timedelta(seconds=1)
+
+def to_epoch(moment: datetime) -> int:
+    """
+    Convert a datetime to whole seconds since the Unix epoch.
+    Naive datetimes are treated as UTC. Sub-second parts are floored, so a moment
+    maps to the second that contains it.
+
+    Args:
+        moment (datetime): The datetime to convert
+
+    Returns:
+        int: Seconds since 1970-01-01T00:00:00Z
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // _SECOND
+
+def from_epoch(seconds: int) -> datetime:
+    """
+    Convert seconds since the Unix epoch to a timezone-aware UTC datetime.
+
+    Args:
+        seconds (int): Seconds since 1970-01-01T00:00:00Z
+
+    Returns:
+        datetime: The corresponding UTC datetime
+    """
+    return _EPOCH + timedelta(seconds=seconds)
+
+# Price periods have only a few distinct lengths (15 minutes, 1 hour, DST-adjusted
+# days...), so every point of the same length shares one int object
+_durations = {}
+
+def _shared_duration(seconds: int) -> int:
+    return _durations.setdefault(seconds, seconds)
 
-@dataclass
 class PricePoint:
     """
     Represents a single electricity price point with its time period.
-    
+    Immutable and compact: the period is stored in slots as the start in epoch
+    seconds plus a shared duration object, and datetimes are only created when
+    start_date or end_date is read.
+
+    Only the instant is kept, at whole-second precision: sub-second parts of the
+    given datetimes are floored (price periods start on whole minutes), naive
+    datetimes are taken as UTC, and start_date and end_date always return UTC
+    datetimes whatever timezone they were given in. Convert them with
+    astimezone() for display; they compare equal to the original instants.
+
     Attributes:
         price (float): The electricity price in cents per kilowatt-hour
-        start_date (datetime): The start time of the price period
-        end_date (datetime): The end time of the price period
+        start_date (datetime): The start time of the price period, in UTC
+        end_date (datetime): The end time of the price period, in UTC
+        start_ts (int): The start time in seconds since the Unix epoch
+        end_ts (int): The end time in seconds since the Unix epoch
+        duration (int): The length of the price period in seconds
     """
-    price: float
-    start_date: datetime
-    end_date: datetime
+    __slots__ = ("price", "start_ts", "duration")
+
+    def __init__(self, price: float, start_date: datetime, end_date: datetime):
+        start_ts = to_epoch(start_date)
+        object.__setattr__(self, "price", price)
+        object.__setattr__(self, "start_ts", start_ts)
+        object.__setattr__(self, "duration", _shared_duration(to_epoch(end_date) - start_ts))
+
+    @classmethod
+    def from_epoch(cls, price: float, start_ts: int, end_ts: int) -> "PricePoint":
+        """
+        Create a price point directly from epoch seconds, without datetime objects.
+
+        Args:
+            price (float): The electricity price in cents per kilowatt-hour
+            start_ts (int): The start time in seconds since the Unix epoch
+            end_ts (int): The end time in seconds since the Unix epoch
+
+        Returns:
+            PricePoint: The new price point
+        """
+        point = cls.__new__(cls)
+        object.__setattr__(point, "price", price)
+        object.__setattr__(point, "start_ts", start_ts)
+        object.__setattr__(point, "duration", _shared_duration(end_ts - start_ts))
+        return point
+
+    @property
+    def end_ts(self) -> int:
+        return self.start_ts + self.duration
+
+    @property
+    def start_date(self) -> datetime:
+        return from_epoch(self.start_ts)
+
+    @property
+    def end_date(self) -> datetime:
+        return from_epoch(self.end_ts)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.price, self.start_ts, self.duration) == (other.price, other.start_ts, other.duration)
+
+    def __hash__(self):
+        return hash((self.price, self.start_ts, self.duration))
+
+    def __reduce__(self):
+        return (PricePoint.from_epoch, (self.price, self.start_ts, self.end_ts))
+
+    def __repr__(self):
+        return f"PricePoint(price={self.price!r}, start_date={self.start_date!r}, end_date={self.end_date!r})"
+
+class NotifyMode(Enum):
+    """
+    Which limit breaches the user wants to be notified about.
+    """
+    LOWER = "lower"
+    HIGHER = "higher"
+    BOTH = "both"
 
 @dataclass
 class PriceLimits:
@@ -43,4 +157,21 @@ class PriceLimits:
         Returns:
             bool: True if the price is within limits, False otherwise
         """
-        return self.lower_limit <= price <= self.upper_limit 
\ No newline at end of file
+        return self.lower_limit <= price <= self.upper_limit 
+
+    def limit_breached(self, price: float, mode: NotifyMode) -> Optional[str]:
+        """
+        Check which limit, if any, a price breaches for the given notification mode.
+
+        Args:
+            price (float): The price to check in cents per kilowatt-hour
+            mode (NotifyMode): The user's notification preference
+
+        Returns:
+            Optional[str]: "lower" or "higher" if a notification is due, None otherwise
+        """
+        if mode in (NotifyMode.LOWER, NotifyMode.BOTH) and price < self.lower_limit:
+            return "lower"
+        if mode in (NotifyMode.HIGHER, NotifyMode.BOTH) and price > self.upper_limit:
+            return "higher"
+        return None
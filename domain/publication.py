@@ -0,0 +1,56 @@
+"""
+Day-ahead publication schedule.
+Spot prices for the next day are published once a day in the early
+afternoon (Finnish local time). Cached price data stays valid for one
+publication cycle.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from .day_index import LOCAL_TIMEZONE
+
+# Local time after which the next day's prices are normally available
+PUBLICATION_TIME = time(14, 0)
+
+# Local time after which a late publication is no longer polled for
+PUBLICATION_WINDOW_END = time(18, 0)
+
+def publication_instant(day: date) -> datetime:
+    """
+    Get the instant at which the prices for the day after the given day are published.
+
+    Args:
+        day (date): The local calendar day of publication
+
+    Returns:
+        datetime: The publication time in UTC
+    """
+    return datetime.combine(day, PUBLICATION_TIME, tzinfo=LOCAL_TIMEZONE).astimezone(timezone.utc)
+
+def publication_cycle(now: datetime) -> datetime:
+    """
+    Get the publication cycle an instant belongs to.
+    A cycle starts at a daily publication and lasts until the next one.
+
+    Args:
+        now (datetime): A timezone-aware instant
+
+    Returns:
+        datetime: The most recent publication instant at or before now, in UTC
+    """
+    today = now.astimezone(LOCAL_TIMEZONE).date()
+    instant = publication_instant(today)
+    if instant > now:
+        instant = publication_instant(today - timedelta(days=1))
+    return instant
+
+def published_through(now: datetime) -> date:
+    """
+    Get the last local day whose prices are expected to be published.
+
+    Args:
+        now (datetime): A timezone-aware instant
+
+    Returns:
+        date: The day after the current cycle's publication day
+    """
+    return publication_cycle(now).astimezone(LOCAL_TIMEZONE).date() + timedelta(days=1)
@@ -7,6 +7,7 @@ price data access implementations.
 from abc import ABC, abstractmethod
 from typing import List
 from .entities import PricePoint
+from .snapshot import PriceSnapshot
 
 class PriceRepository(ABC):
     """
@@ -36,4 +37,91 @@ class PriceRepository(ABC):
         Raises:
             ValueError: If current or next hour price cannot be found
         """
-        pass 
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_snapshot(self) -> PriceSnapshot:
+        """
+        Get the parsed price snapshot of the current publication cycle,
+        fetching it only if the cached one is missing or stale.
+
+        Returns:
+            PriceSnapshot: The shared snapshot
+        """
+        pass
+
+    @abstractmethod
+    def refresh(self) -> PriceSnapshot:
+        """
+        Fetch a new snapshot now. If the fetch fails, the cached snapshot is kept.
+
+        Returns:
+            PriceSnapshot: The new snapshot
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """
+        Drop the cached snapshot so the next query fetches fresh data.
+        """
+        pass
+
+
+class AsyncPriceRepository(ABC):
+    """
+    Asynchronous counterpart of PriceRepository.
+    Implementations run on an asyncio event loop, so many queries can be
+    served concurrently from a single thread.
+    """
+
+    @abstractmethod
+    async def get_latest_prices(self) -> List[PricePoint]:
+        """
+        Fetch the latest electricity prices from the data source.
+
+        Returns:
+            List[PricePoint]: List of price points containing price and time information
+        """
+        pass
+
+    @abstractmethod
+    async def get_current_and_next_hour_prices(self) -> tuple[PricePoint, PricePoint]:
+        """
+        Get the current hour's price and the next hour's price.
+
+        Returns:
+            tuple[PricePoint, PricePoint]: Tuple containing (current_price, next_price)
+
+        Raises:
+            ValueError: If current or next hour price cannot be found
+        """
+        pass
+
+    @abstractmethod
+    async def get_snapshot(self) -> PriceSnapshot:
+        """
+        Get the parsed price snapshot of the current publication cycle,
+        fetching it only if the cached one is missing or stale.
+
+        Returns:
+            PriceSnapshot: The shared snapshot
+        """
+        pass
+
+    @abstractmethod
+    async def refresh(self) -> PriceSnapshot:
+        """
+        Fetch a new snapshot now. If the fetch fails, the cached snapshot is kept.
+
+        Returns:
+            PriceSnapshot: The new snapshot
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """
+        Drop the cached snapshot so the next query fetches fresh data.
+        """
+        pass
@@ -0,0 +1,155 @@
+"""
+Sorted in-memory price series with incremental merging.
+Refreshed prices are merged into the existing series as an append/upsert,
+and each merge reports which slots were added, revised or left unchanged
+so consumers can update only what changed.
+"""
+
+import bisect
+import heapq
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+from .entities import PricePoint
+
+def _ranges(indexes: Sequence[int]) -> Tuple[range, ...]:
+    """
+    Coalesce sorted indexes into contiguous ranges.
+    """
+    ranges = []
+    for index in indexes:
+        if ranges and ranges[-1].stop == index:
+            ranges[-1] = range(ranges[-1].start, index + 1)
+        else:
+            ranges.append(range(index, index + 1))
+    return tuple(ranges)
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """
+    Which slots changed between two versions of a price sequence.
+    Ranges index the new version: the series right after PriceSeries.merge(),
+    or the current sequence passed to diff().
+
+    Attributes:
+        added (Tuple[range, ...]): Slots that did not exist before
+        revised (Tuple[range, ...]): Existing slots whose price or period changed
+        unchanged (Tuple[range, ...]): Slots left as they were
+        removed (Tuple[range, ...]): Slots of the previous sequence missing from the
+            current one, as indexes into the previous sequence (diff() only)
+    """
+    added: Tuple[range, ...] = ()
+    revised: Tuple[range, ...] = ()
+    unchanged: Tuple[range, ...] = ()
+    removed: Tuple[range, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Whether nothing changed.
+        """
+        return not self.added and not self.revised and not self.removed
+
+    @property
+    def added_count(self) -> int:
+        return sum(len(r) for r in self.added)
+
+    @property
+    def revised_count(self) -> int:
+        return sum(len(r) for r in self.revised)
+
+def diff(previous: Sequence[PricePoint], current: Sequence[PricePoint]) -> ChangeSet:
+    """
+    Compare two price sequences sorted by start time.
+
+    Args:
+        previous (Sequence[PricePoint]): The older sequence
+        current (Sequence[PricePoint]): The newer sequence
+
+    Returns:
+        ChangeSet: Added, revised and unchanged slots of current, and the slots of
+            previous that current no longer contains
+    """
+    added, revised, unchanged, removed = [], [], [], []
+    old = 0
+    for index, point in enumerate(current):
+        while old < len(previous) and previous[old].start_ts < point.start_ts:
+            removed.append(old)
+            old += 1
+        if old < len(previous) and previous[old].start_ts == point.start_ts:
+            (unchanged if previous[old] == point else revised).append(index)
+            old += 1
+        else:
+            added.append(index)
+    removed.extend(range(old, len(previous)))
+    return ChangeSet(added=_ranges(added), revised=_ranges(revised),
+                     unchanged=_ranges(unchanged), removed=_ranges(removed))
+
+class PriceSeries:
+    """
+    Price points kept sorted by start time, one point per start time.
+    """
+
+    def __init__(self, points: Iterable[PricePoint] = ()):
+        """
+        Initialize the series.
+
+        Args:
+            points (Iterable[PricePoint]): Initial price points in any order
+        """
+        self.points: List[PricePoint] = []
+        self.starts: List[int] = []
+        self.merge(points)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __getitem__(self, index):
+        return self.points[index]
+
+    def merge(self, points: Iterable[PricePoint]) -> ChangeSet:
+        """
+        Merge price points into the series.
+        Points with a new start time are inserted (appended in the common case of
+        newer data), points replacing an existing start time are upserted only if
+        they differ; the rest of the series is not touched.
+
+        Args:
+            points (Iterable[PricePoint]): Fetched price points in any order
+
+        Returns:
+            ChangeSet: Which slots were added, revised or unchanged
+        """
+        incoming = {}
+        for point in points:
+            incoming[point.start_ts] = point
+        incoming = [incoming[start] for start in sorted(incoming)]
+
+        revised_starts = []
+        new_points = []
+        for point in incoming:
+            index = bisect.bisect_left(self.starts, point.start_ts)
+            if index < len(self.starts) and self.starts[index] == point.start_ts:
+                if self.points[index] != point:
+                    self.points[index] = point
+                    revised_starts.append(point.start_ts)
+            else:
+                new_points.append(point)
+
+        if new_points:
+            if not self.starts or new_points[0].start_ts > self.starts[-1]:
+                self.points.extend(new_points)
+                self.starts.extend(point.start_ts for point in new_points)
+            else:
+                self.points = list(heapq.merge(self.points, new_points, key=lambda point: point.start_ts))
+                self.starts = [point.start_ts for point in self.points]
+
+        added = [bisect.bisect_left(self.starts, point.start_ts) for point in new_points]
+        revised = [bisect.bisect_left(self.starts, start) for start in revised_starts]
+        unchanged = []
+        position = 0
+        for changed in _ranges(sorted(added + revised)) + (range(len(self.points), len(self.points)),):
+            if changed.start > position:
+                unchanged.append(range(position, changed.start))
+            position = changed.stop
+
+        return ChangeSet(added=_ranges(added), revised=_ranges(revised), unchanged=tuple(unchanged))
@@ -0,0 +1,180 @@
+"""
+Immutable snapshot of fetched price data.
+A snapshot holds one parsed, sorted price list together with the indexes
+derived from it, so every consumer reads the same instance.
+"""
+
+import bisect
+import itertools
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Iterable, Optional, Set, Tuple
+from .day_index import DayIndex
+from .entities import PricePoint, to_epoch
+from .publication import publication_cycle, published_through
+from .series import ChangeSet, diff
+from .tariffs import TariffConfig, apply_tariffs
+
+_sequence = itertools.count(1)
+
+@dataclass(frozen=True)
+class PriceSnapshot:
+    """
+    Price data fetched during one publication cycle.
+
+    Attributes:
+        prices (Tuple[PricePoint, ...]): Price points sorted by start time
+        cycle (datetime): The publication cycle the data was fetched in
+        fetched_at (datetime): When the data was fetched
+        day_index (DayIndex): Local-day partition of the prices
+        starts (Tuple[int, ...]): Start times of the prices in epoch seconds, for bisection
+        changes (Optional[ChangeSet]): What changed since the previous snapshot, indexed into
+            prices (removed slots index the previous snapshot's prices); None for a first snapshot
+        sequence (int): Unique number of this snapshot
+        base_sequence (Optional[int]): Sequence number of the snapshot changes are relative to
+    """
+    prices: Tuple[PricePoint, ...]
+    cycle: datetime
+    fetched_at: datetime
+    day_index: DayIndex = field(compare=False, repr=False)
+    starts: Tuple[int, ...] = field(compare=False, repr=False)
+    changes: Optional[ChangeSet] = field(default=None, compare=False, repr=False)
+    sequence: int = field(default=0, compare=False)
+    base_sequence: Optional[int] = field(default=None, compare=False)
+    _totals: dict = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_prices(cls, prices: Iterable[PricePoint], fetched_at: datetime,
+                    previous: Optional["PriceSnapshot"] = None) -> "PriceSnapshot":
+        """
+        Build a snapshot from fetched prices.
+
+        Args:
+            prices (Iterable[PricePoint]): Price points in any order
+            fetched_at (datetime): When the prices were fetched
+            previous (Optional[PriceSnapshot]): The snapshot this one replaces; changes are
+                computed relative to it and its cached totals of unchanged slots are reused
+
+        Returns:
+            PriceSnapshot: The snapshot with its indexes built
+        """
+        ordered = tuple(sorted(prices, key=lambda price: price.start_ts))
+        changes = diff(previous.prices, ordered) if previous is not None else None
+        snapshot = cls(
+            prices=ordered,
+            cycle=publication_cycle(fetched_at),
+            fetched_at=fetched_at,
+            day_index=DayIndex(ordered),
+            starts=tuple(price.start_ts for price in ordered),
+            changes=changes,
+            sequence=next(_sequence),
+            base_sequence=previous.sequence if previous is not None else None,
+        )
+        if previous is not None:
+            snapshot._inherit_totals(previous)
+        return snapshot
+
+    def _inherit_totals(self, previous: "PriceSnapshot") -> None:
+        # Unchanged slots keep their totals; only added and revised slots are recomputed
+        changed = [index for ranges in (self.changes.added, self.changes.revised) for r in ranges for index in r]
+        for tariffs, previous_totals in previous._totals.items():
+            by_start = dict(zip(previous.starts, previous_totals))
+            totals = [by_start.get(start) for start in self.starts]
+            for index, total in zip(changed, apply_tariffs([self.prices[index] for index in changed], tariffs)):
+                totals[index] = total
+            self._totals[tariffs] = tuple(totals)
+
+    def changes_since(self, previous: Optional["PriceSnapshot"]) -> Optional[ChangeSet]:
+        """
+        Get the changes relative to a given snapshot.
+
+        Args:
+            previous (Optional[PriceSnapshot]): The snapshot a consumer last saw
+
+        Returns:
+            Optional[ChangeSet]: The changes, None if they are not relative to that snapshot
+                and the consumer has to treat everything as changed
+        """
+        if previous is None or self.changes is None or self.base_sequence != previous.sequence:
+            return None
+        return self.changes
+
+    def changed_days(self, previous: Optional["PriceSnapshot"]) -> Optional[Set[date]]:
+        """
+        Get the local days whose slots were added, revised or removed since a given snapshot.
+
+        Args:
+            previous (Optional[PriceSnapshot]): The snapshot a consumer last saw
+
+        Returns:
+            Optional[Set[date]]: The changed days, None if the changes are not relative to that snapshot
+        """
+        changes = self.changes_since(previous)
+        if changes is None:
+            return None
+        days = set()
+        for ranges, snapshot in ((changes.added, self), (changes.revised, self), (changes.removed, previous)):
+            for r in ranges:
+                for index in r:
+                    days.add(snapshot.day_index.local_day(snapshot.prices[index].start_date))
+        return days
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        Whether the snapshot already contains the prices published in its cycle.
+        """
+        return bool(self.day_index.prices_for(published_through(self.fetched_at)))
+
+    def total_prices(self, tariffs: TariffConfig) -> Tuple[float, ...]:
+        """
+        Get the total retail price of every slot.
+        Computed once per snapshot and tariff configuration, then cached.
+
+        Args:
+            tariffs (TariffConfig): The tariff configuration
+
+        Returns:
+            Tuple[float, ...]: Total prices aligned with prices
+        """
+        totals = self._totals.get(tariffs)
+        if totals is None:
+            totals = self._totals[tariffs] = apply_tariffs(self.prices, tariffs)
+        return totals
+
+    def total_price(self, price: PricePoint, tariffs: TariffConfig) -> float:
+        """
+        Get the total retail price of one of the snapshot's slots.
+
+        Args:
+            price (PricePoint): A price point of this snapshot
+            tariffs (TariffConfig): The tariff configuration
+
+        Returns:
+            float: The slot's total price in cents per kilowatt-hour
+        """
+        return self.total_prices(tariffs)[bisect.bisect_left(self.starts, price.start_ts)]
+
+    def current_and_next(self, now: datetime) -> Tuple[PricePoint, PricePoint]:
+        """
+        Get the price slot containing the given instant and the slot after it.
+
+        Args:
+            now (datetime): A timezone-aware instant
+
+        Returns:
+            Tuple[PricePoint, PricePoint]: Tuple containing (current_price, next_price)
+
+        Raises:
+            ValueError: If current or next hour price cannot be found
+        """
+        now_ts = to_epoch(now)
+        position = bisect.bisect_right(self.starts, now_ts) - 1
+        if position < 0 or not now_ts < self.prices[position].end_ts:
+            raise ValueError("No current price found")
+
+        current_price = self.prices[position]
+        if position + 1 >= len(self.prices) or self.prices[position + 1].start_ts != current_price.end_ts:
+            raise ValueError("No next hour price found")
+
+        return current_price, self.prices[position + 1]
@@ -0,0 +1,135 @@
+"""
+Bulk alert evaluation for many subscribers.
+Each subscriber registers their own price limits and notification mode.
+Thresholds are kept in sorted arrays, so the subscribers triggered by a
+price are found by bisection in O(log n + hits) instead of checking every rule.
+"""
+
+import bisect
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+from .entities import NotifyMode, PriceLimits, PricePoint
+
+@dataclass(frozen=True)
+class TriggeredAlert:
+    """
+    A subscriber whose limit a price breached.
+
+    Attributes:
+        subscriber_id (str): The subscriber to notify
+        breached (str): "lower" or "higher", as returned by PriceLimits.limit_breached
+        price (float): The price that triggered the alert
+    """
+    subscriber_id: str
+    breached: str
+    price: float
+
+class SubscriptionIndex:
+    """
+    Registry of subscriber alert rules with sorted threshold indexes.
+    Registrations are cheap; the sorted arrays are rebuilt lazily on the
+    next evaluation after a change.
+    """
+
+    def __init__(self):
+        self._rules: Dict[str, Tuple[PriceLimits, NotifyMode]] = {}
+        self._lower_limits: List[float] = []
+        self._lower_ids: List[str] = []
+        self._upper_limits: List[float] = []
+        self._upper_ids: List[str] = []
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def register(self, subscriber_id: str, limits: PriceLimits, mode: NotifyMode) -> None:
+        """
+        Add or replace a subscriber's rule.
+
+        Args:
+            subscriber_id (str): Unique subscriber identifier
+            limits (PriceLimits): The subscriber's price limits
+            mode (NotifyMode): The subscriber's notification preference
+        """
+        self._rules[subscriber_id] = (limits, mode)
+        self._dirty = True
+
+    def unregister(self, subscriber_id: str) -> None:
+        """
+        Remove a subscriber's rule if it exists.
+
+        Args:
+            subscriber_id (str): The subscriber to remove
+        """
+        if self._rules.pop(subscriber_id, None) is not None:
+            self._dirty = True
+
+    def _rebuild(self) -> None:
+        lower = sorted(
+            (limits.lower_limit, subscriber_id)
+            for subscriber_id, (limits, mode) in self._rules.items()
+            if mode in (NotifyMode.LOWER, NotifyMode.BOTH)
+        )
+        upper = sorted(
+            (limits.upper_limit, subscriber_id)
+            for subscriber_id, (limits, mode) in self._rules.items()
+            if mode in (NotifyMode.HIGHER, NotifyMode.BOTH)
+        )
+        self._lower_limits = [limit for limit, _ in lower]
+        self._lower_ids = [subscriber_id for _, subscriber_id in lower]
+        self._upper_limits = [limit for limit, _ in upper]
+        self._upper_ids = [subscriber_id for _, subscriber_id in upper]
+        self._dirty = False
+
+    def triggered(self, price: float) -> Tuple[List[str], List[str]]:
+        """
+        Find the subscribers a price triggers.
+
+        Args:
+            price (float): The price in cents per kilowatt-hour
+
+        Returns:
+            Tuple[List[str], List[str]]: (subscribers whose lower limit is above the price,
+                subscribers whose upper limit is below the price)
+        """
+        if self._dirty:
+            self._rebuild()
+        below = self._lower_ids[bisect.bisect_right(self._lower_limits, price):]
+        above = self._upper_ids[:bisect.bisect_left(self._upper_limits, price)]
+        return below, above
+
+    def evaluate(self, price: float) -> List[TriggeredAlert]:
+        """
+        Get the alerts a price triggers.
+        Gives the same result as calling PriceLimits.limit_breached for every subscriber
+        whose lower limit does not exceed their upper limit.
+
+        Args:
+            price (float): The price in cents per kilowatt-hour
+
+        Returns:
+            List[TriggeredAlert]: One alert per triggered subscriber
+        """
+        below, above = self.triggered(price)
+        return (
+            [TriggeredAlert(subscriber_id, "lower", price) for subscriber_id in below] +
+            [TriggeredAlert(subscriber_id, "higher", price) for subscriber_id in above]
+        )
+
+    def evaluate_slots(self, prices: Iterable[PricePoint]) -> Dict[int, List[TriggeredAlert]]:
+        """
+        Evaluate a series of price slots.
+
+        Args:
+            prices (Iterable[PricePoint]): Price slots to evaluate
+
+        Returns:
+            Dict[int, List[TriggeredAlert]]: Alerts keyed by slot start in epoch seconds,
+                only for slots that triggered something
+        """
+        alerts = {}
+        for price in prices:
+            triggered = self.evaluate(price.price)
+            if triggered:
+                alerts[price.start_ts] = triggered
+        return alerts
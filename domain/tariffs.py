@@ -0,0 +1,124 @@
+"""
+Retail price pipeline for the Electricity Spot Price Monitor application.
+Turns raw spot prices into the total price paid: spot price plus retailer
+margin, electricity tax and time-of-use network (transmission) tariffs,
+with VAT applied.
+"""
+
+import os
+from dataclasses import dataclass, fields
+from typing import Mapping, Optional, Sequence, Tuple
+from .day_index import LOCAL_TIMEZONE
+from .entities import PricePoint, from_epoch
+
+# Months in which the seasonal winter-day tariff applies (November to March)
+WINTER_MONTHS = frozenset((11, 12, 1, 2, 3))
+
+@dataclass(frozen=True)
+class TariffConfig:
+    """
+    Price components added on top of the spot price. All amounts are in
+    cents per kilowatt-hour without VAT. The defaults leave the spot price unchanged.
+
+    Attributes:
+        vat_rate (float): VAT rate applied to the added components (0.255 = 25.5 %)
+        spot_includes_vat (bool): Whether the spot prices already include VAT,
+            as the Porssisahko prices do
+        margin (float): Retailer margin
+        electricity_tax (float): Electricity tax
+        day_transfer (float): Network tariff during the day
+        night_transfer (float): Network tariff during the night
+        winter_day_transfer (Optional[float]): Seasonal network tariff for winter
+            days (November-March, Monday-Saturday, outside night hours); None disables it
+        night_start (int): Local hour at which the night tariff starts
+        night_end (int): Local hour at which the night tariff ends
+    """
+    vat_rate: float = 0.255
+    spot_includes_vat: bool = True
+    margin: float = 0.0
+    electricity_tax: float = 0.0
+    day_transfer: float = 0.0
+    night_transfer: float = 0.0
+    winter_day_transfer: Optional[float] = None
+    night_start: int = 22
+    night_end: int = 7
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "TariffConfig":
+        """
+        Read the configuration from environment variables such as TARIFF_MARGIN
+        or TARIFF_NIGHT_TRANSFER (one per attribute, upper-cased with a TARIFF_ prefix).
+        Missing variables keep their defaults.
+
+        Args:
+            environ (Optional[Mapping[str, str]]): Variables to read, os.environ by default
+
+        Returns:
+            TariffConfig: The configuration
+        """
+        environ = os.environ if environ is None else environ
+        values = {}
+        for field in fields(cls):
+            raw = environ.get(f"TARIFF_{field.name.upper()}")
+            if raw is None or raw == "":
+                continue
+            if field.name == "spot_includes_vat":
+                values[field.name] = raw.strip().lower() in ("1", "true", "yes")
+            elif field.name in ("night_start", "night_end"):
+                values[field.name] = int(raw)
+            else:
+                values[field.name] = float(raw)
+        return cls(**values)
+
+    def transfer_for(self, start_ts: int) -> float:
+        """
+        Get the network tariff of the slot starting at the given time.
+        Time-of-use rules are evaluated in Finnish local time.
+
+        Args:
+            start_ts (int): Slot start in epoch seconds
+
+        Returns:
+            float: Network tariff without VAT
+        """
+        local = from_epoch(start_ts).astimezone(LOCAL_TIMEZONE)
+        if self.night_start > self.night_end:
+            night = local.hour >= self.night_start or local.hour < self.night_end
+        else:
+            night = self.night_start <= local.hour < self.night_end
+        if night:
+            return self.night_transfer
+        if self.winter_day_transfer is not None and local.month in WINTER_MONTHS and local.weekday() < 6:
+            return self.winter_day_transfer
+        return self.day_transfer
+
+def apply_tariffs(prices: Sequence[PricePoint], config: TariffConfig) -> Tuple[float, ...]:
+    """
+    Compute the total price of every slot in a single pass.
+
+    Args:
+        prices (Sequence[PricePoint]): Spot price points
+        config (TariffConfig): The tariff configuration
+
+    Returns:
+        Tuple[float, ...]: Total prices in cents per kilowatt-hour, aligned with prices
+    """
+    vat = 1 + config.vat_rate
+    spot_factor = 1.0 if config.spot_includes_vat else vat
+    fixed = config.margin + config.electricity_tax
+    time_of_use = config.day_transfer != config.night_transfer or config.winter_day_transfer is not None
+
+    if not time_of_use:
+        added = (fixed + config.day_transfer) * vat
+        return tuple(price.price * spot_factor + added for price in prices)
+
+    # Finnish UTC offsets are whole hours, so sub-hour slots share their hour's tariff
+    transfers = {}
+    totals = []
+    for price in prices:
+        hour = price.start_ts - price.start_ts % 3600
+        transfer = transfers.get(hour)
+        if transfer is None:
+            transfer = transfers[hour] = config.transfer_for(hour)
+        totals.append(price.price * spot_factor + (fixed + transfer) * vat)
+    return tuple(totals)
@@ -0,0 +1,167 @@
+"""
+Cross-zone price comparison.
+Prices of several bidding zones are held in one columnar table: a shared
+slot timeline plus one float array per zone. Comparisons such as the
+spread and the cheapest zone per slot run column-wise over all zones at
+once when the table is built, so memory and work grow linearly with the
+number of zones and lookups afterwards are constant time.
+"""
+
+import bisect
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from operator import sub
+from typing import Dict, List, Mapping, Optional, Tuple
+from .entities import to_epoch
+from .snapshot import PriceSnapshot
+
+MISSING = math.nan
+
+def _available(row: Tuple[float, ...]) -> List[float]:
+    return [value for value in row if value == value]  # NaN marks a missing slot
+
+def _spread(columns: Tuple[array, ...], complete: bool) -> array:
+    if complete:
+        return array("d", map(sub, map(max, zip(*columns)), map(min, zip(*columns))))
+    return array("d", (
+        max(row) - min(row) if row else MISSING
+        for row in map(_available, zip(*columns))
+    ))
+
+def _cheapest(zones: Tuple[str, ...], columns: Tuple[array, ...], complete: bool) -> List[Optional[str]]:
+    if complete:
+        rows = zip(*columns)
+        return [zones[row.index(low)] for row, low in zip(rows, map(min, zip(*columns)))]
+    cheapest = []
+    for row in zip(*columns):
+        available = _available(row)
+        cheapest.append(zones[row.index(min(available))] if available else None)
+    return cheapest
+
+@dataclass(frozen=True)
+class ZonePriceTable:
+    """
+    Prices of several zones aligned on one slot timeline.
+
+    Attributes:
+        zones (Tuple[str, ...]): Zone codes, in column order
+        starts (array): Slot start times in epoch seconds, sorted
+        ends (array): Slot end times in epoch seconds
+        columns (Tuple[array, ...]): One price column per zone, NaN where a zone has no price
+        complete (bool): Whether every zone has a price for every slot
+        spreads (array): Difference between the most and least expensive zone per slot,
+            NaN where no zone has a price
+        cheapest_zones (List[Optional[str]]): Cheapest zone per slot, None where no zone has a price
+    """
+    zones: Tuple[str, ...]
+    starts: array
+    ends: array
+    columns: Tuple[array, ...]
+    complete: bool
+    spreads: array
+    cheapest_zones: List[Optional[str]]
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Mapping[str, PriceSnapshot]) -> "ZonePriceTable":
+        """
+        Align the snapshots of several zones into one table.
+
+        Args:
+            snapshots (Mapping[str, PriceSnapshot]): Latest snapshot of each zone
+
+        Returns:
+            ZonePriceTable: The aligned table
+        """
+        zones = tuple(snapshots)
+        timelines = [snapshots[zone].starts for zone in zones]
+        if all(timeline == timelines[0] for timeline in timelines):
+            # Zones normally share the same slots, so no per-slot alignment is needed
+            starts = timelines[0] if timelines else ()
+        else:
+            starts = tuple(sorted(set().union(*timelines)))
+
+        ends = {}
+        columns = []
+        complete = True
+        for zone, timeline in zip(zones, timelines):
+            prices = snapshots[zone].prices
+            if timeline == starts:
+                columns.append(array("d", [price.price for price in prices]))
+            else:
+                positions = {start: index for index, start in enumerate(starts)}
+                column = array("d", [MISSING]) * len(starts)
+                for price in prices:
+                    column[positions[price.start_ts]] = price.price
+                columns.append(column)
+                complete = complete and len(timeline) == len(starts)
+            if len(ends) < len(starts):
+                for price in prices:
+                    ends.setdefault(price.start_ts, price.end_ts)
+
+        columns = tuple(columns)
+        return cls(
+            zones=zones,
+            starts=array("q", starts),
+            ends=array("q", [ends[start] for start in starts]),
+            columns=columns,
+            complete=complete,
+            spreads=_spread(columns, complete),
+            cheapest_zones=_cheapest(zones, columns, complete),
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def slot_index(self, moment: datetime) -> Optional[int]:
+        """
+        Find the slot containing a moment.
+
+        Args:
+            moment (datetime): Timezone-aware moment
+
+        Returns:
+            Optional[int]: Slot index, None if no slot contains the moment
+        """
+        timestamp = to_epoch(moment)
+        index = bisect.bisect_right(self.starts, timestamp) - 1
+        if index < 0 or timestamp >= self.ends[index]:
+            return None
+        return index
+
+    def prices_at(self, index: int) -> Dict[str, float]:
+        """
+        Get the price of every zone that has one in a slot.
+
+        Args:
+            index (int): Slot index
+
+        Returns:
+            Dict[str, float]: Price per zone code
+        """
+        return {
+            zone: column[index]
+            for zone, column in zip(self.zones, self.columns)
+            if column[index] == column[index]
+        }
+
+    def spread(self) -> array:
+        """
+        Get the difference between the most and least expensive zone in every slot.
+
+        Returns:
+            array: Spread per slot, NaN where no zone has a price; computed when the
+                table was built and shared, so callers must not modify it
+        """
+        return self.spreads
+
+    def cheapest(self) -> List[Optional[str]]:
+        """
+        Get the cheapest zone in every slot. Ties go to the zone listed first.
+
+        Returns:
+            List[Optional[str]]: Zone code per slot, None where no zone has a price; computed
+                when the table was built and shared, so callers must not modify it
+        """
+        return self.cheapest_zones
@@ -3,19 +3,79 @@ Main entry point for the Electricity Spot Price Monitor application.
 This module initializes the PyQt6 application and creates the main window.
 """
 
+import argparse
+import os
 import sys
+from datetime import datetime
 from PyQt6.QtWidgets import QApplication
 from presentation.main_window import MainWindow
 
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv is optional; TARIFF_* can also be set in the environment
+    load_dotenv = None
+
+# Entry points of a refresh cycle: the hourly timer, the manual refresh button and
+# direct label updates (startup, theme changes). Nested calls fold into the outer one.
+PROFILED_REFRESH = ("on_hour_timer", "refresh_prices", "update_prices")
+PROFILED_DIALOGS = ("show_daily_prices", "show_next_day_prices")
+
+def parse_args(argv):
+    """
+    Parse the application's own command line options.
+    Unknown options are left for Qt.
+
+    Args:
+        argv (list): The full command line including the program name
+
+    Returns:
+        tuple: (options, remaining argv for QApplication)
+    """
+    parser = argparse.ArgumentParser(description="Electricity Spot Price Monitor")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile startup and each refresh cycle and monitor event-loop stalls")
+    parser.add_argument("--profile-dir", default="profiles",
+                        help="Directory the profiling reports are written to")
+    parser.add_argument("--stall-threshold", type=int, default=200,
+                        help="Event-loop stall threshold in milliseconds")
+    options, remaining = parser.parse_known_args(argv[1:])
+    return options, argv[:1] + remaining
+
 def main():
     """
     Initialize and run the main application window.
     Creates a QApplication instance and shows the main window.
+    With --profile, reports are written to a timestamped directory under --profile-dir.
     """
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec())
+    options, qt_argv = parse_args(sys.argv)
+    if load_dotenv:
+        load_dotenv()
+    app = QApplication(qt_argv)
+
+    if not options.profile:
+        window = MainWindow()
+        window.show()
+        sys.exit(app.exec())
+
+    from presentation.profiling import EventLoopWatchdog, ProfileSession
+
+    output_dir = os.path.join(options.profile_dir, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    session = ProfileSession(output_dir)
+    session.wrap(MainWindow, "refresh", *PROFILED_REFRESH)
+    session.wrap(MainWindow, "dialog", *PROFILED_DIALOGS)
+    watchdog = EventLoopWatchdog(os.path.join(output_dir, "event_loop.log"),
+                                 stall_threshold_ms=options.stall_threshold)
+
+    with session.profile("startup"):
+        window = MainWindow()
+        window.show()
+    watchdog.start()
+    window.background_tasks.append(watchdog)
+    print(f"Profiling reports are written to {output_dir}")
+
+    exit_code = app.exec()
+    watchdog.stop()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,75 @@
+"""
+Bridge between asyncio coroutines and the Qt event loop.
+Coroutines run on a background asyncio loop; their results are delivered
+back to the Qt main thread through a queued signal, so callbacks can update
+widgets directly and the UI never blocks on network I/O.
+"""
+
+import logging
+from typing import Awaitable, Callable, Optional
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from data.sync_adapter import BackgroundLoop
+
+logger = logging.getLogger(__name__)
+
+class AsyncBridge(QObject):
+    """
+    Runs coroutines off the UI thread and calls back on the Qt thread the bridge lives in.
+    """
+
+    _completed = pyqtSignal(object, object, object)
+
+    def __init__(self, loop: Optional[BackgroundLoop] = None, parent=None):
+        """
+        Initialize the bridge.
+
+        Args:
+            loop (Optional[BackgroundLoop]): Loop the coroutines run on, a new one by default
+        """
+        super().__init__(parent)
+        self.background = loop or BackgroundLoop()
+        self.pending = 0
+        self._completed.connect(self._deliver)
+
+    def submit(self, coroutine: Awaitable, on_result: Optional[Callable[[object], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None) -> Future:
+        """
+        Run a coroutine on the background loop.
+
+        Args:
+            coroutine (Awaitable): The coroutine to run
+            on_result (Optional[Callable[[object], None]]): Called on the Qt thread with the result
+            on_error (Optional[Callable[[Exception], None]]): Called on the Qt thread if the
+                coroutine raised; errors are logged when no handler is given
+
+        Returns:
+            Future: Thread-safe future of the coroutine's result
+        """
+        self.pending += 1
+        future = self.background.submit(coroutine)
+        # Emitted from the loop thread; the queued connection hops back to this object's thread
+        future.add_done_callback(lambda done: self._completed.emit(done, on_result, on_error))
+        return future
+
+    @pyqtSlot(object, object, object)
+    def _deliver(self, future: Future, on_result, on_error) -> None:
+        self.pending -= 1
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error:
+                on_error(error)
+            else:
+                logger.error("Async task failed", exc_info=error)
+        elif on_result:
+            on_result(future.result())
+
+    def stop(self) -> None:
+        """
+        Stop the background loop. Results that have not been delivered yet are dropped.
+        """
+        self.background.stop()
@@ -9,13 +9,27 @@ from PyQt6.QtWidgets import (
     QLabel, QPushButton, QDoubleSpinBox, QMessageBox, QRadioButton, QTextEdit, QDialog,
     QComboBox, QFrame, QSizeGrip
 )
-from PyQt6.QtCore import QTimer, Qt, QPoint
+from PyQt6.QtCore import QEvent, QTimer, Qt, QPoint
 from PyQt6.QtGui import QPalette, QColor, QFont, QIcon
 import winsound
+import asyncio
+import bisect
+import logging
 import os
-from domain.entities import PriceLimits
+from typing import Optional
+from domain.anomaly import AnomalyDetector
+from domain.clock import Clock, SystemClock, time_until_next_hour
+from domain.day_index import LOCAL_TIMEZONE
+from domain.entities import NotifyMode, PriceLimits
+from domain.tariffs import TariffConfig
+from domain.repositories import PriceRepository
 from data.api_client import PorssiSahkoApiClient
-from datetime import datetime, timezone, timedelta
+from data.multi_zone import MultiZoneRepository
+from data.prefetch import PrefetchScheduler
+from presentation.async_bridge import AsyncBridge
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
 
 class TitleBar(QFrame):
     def __init__(self, parent, theme):
@@ -109,8 +123,13 @@ class StyledDialog(QDialog):
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowStaysOnTopHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setup_ui()
-        
-        # Center the dialog on the parent window
+        self.center_on_parent()
+
+    def center_on_parent(self):
+        """
+        Center the dialog on its parent window and raise it to the top.
+        """
+        parent = self.parentWidget()
         if parent:
             parent_geometry = parent.geometry()
             x = parent_geometry.x() + (parent_geometry.width() - self.width()) // 2
@@ -160,6 +179,38 @@ class StyledDialog(QDialog):
         layout.addWidget(container)
         self.content_layout = content_layout
 
+class PriceDialog(StyledDialog):
+    """
+    Styled dialog showing a read-only price list.
+    Created once per theme and reused; only the text is replaced between openings.
+    """
+
+    def __init__(self, parent, theme):
+        super().__init__(parent, theme)
+        self.setMinimumSize(400, 300)
+
+        self.text_edit = QTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setStyleSheet(f"""
+            QTextEdit {{
+                background-color: {theme["background"]};
+                color: {theme["primary"]};
+                border: 1px solid {theme["primary"]};
+                border-radius: 5px;
+                padding: 5px;
+            }}
+        """)
+        self.content_layout.addWidget(self.text_edit)
+        self._text = None
+
+    def set_text(self, text: str):
+        """
+        Replace the displayed text, skipping the re-layout if it is unchanged.
+        """
+        if text != self._text:
+            self.text_edit.setPlainText(text)
+            self._text = text
+
 class MainWindow(QMainWindow):
     """
     Main window class that handles the GUI and price monitoring functionality.
@@ -167,10 +218,21 @@ class MainWindow(QMainWindow):
     and configuring notifications.
     """
 
-    def __init__(self):
+    def __init__(self, api_client: Optional[PriceRepository] = None, clock: Optional[Clock] = None,
+                 tariffs: Optional[TariffConfig] = None, zones: Optional[MultiZoneRepository] = None):
         """
         Initialize the main window with default settings and UI components.
         Sets up the API client, price limits, and starts the price update timer.
+        With the default API client, a background prefetcher keeps tomorrow's
+        prices loaded as soon as they are published.
+
+        Args:
+            api_client (Optional[PriceRepository]): Price source, the Porssisahko API by default
+            clock (Optional[Clock]): Source of the current time, the system clock by default
+            tariffs (Optional[TariffConfig]): Price components added to the spot price,
+                read from TARIFF_* environment variables by default
+            zones (Optional[MultiZoneRepository]): Bidding zones to compare, read from the
+                PRICE_ZONES environment variable when the default API client is used
         """
         super().__init__()
         self.setWindowTitle("Electricity Spot Price Monitor")
@@ -178,7 +240,15 @@ class MainWindow(QMainWindow):
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-        self.api_client = PorssiSahkoApiClient()
+        self.clock = clock or SystemClock()
+        self.api_client = api_client or PorssiSahkoApiClient(clock=self.clock)
+        self.tariffs = tariffs or TariffConfig.from_env()
+        if zones is None and api_client is None:
+            zones = MultiZoneRepository.from_env(clock=self.clock, reuse=[self.api_client])
+        self.zones = zones
+        # Zone fetches run off the UI thread and report back through the bridge
+        self.zone_bridge = AsyncBridge(parent=self) if zones else None
+        self.zone_refresh_pending = False
         self.price_limits = PriceLimits(lower_limit=0.0, upper_limit=10.0)
         
         # Theme colors
@@ -189,11 +259,27 @@ class MainWindow(QMainWindow):
             "Sunset": {"primary": "#ff6600", "secondary": "#ff3300", "background": "rgba(0, 0, 0, 180)"}
         }
         self.current_theme = "Neon Green"
+        self.last_alert = None
+        self.anomaly_detector = AnomalyDetector()
+        self.anomaly_checked_until = None
+        self.price_dialogs = {}
+        self.message_box = None
+        self.price_text_cache = {}
+        self.price_text_snapshot = None
+        self.idle_enabled = True
+        self.idle = False
 
         self.setup_ui()
         self.setup_timer()
         self.update_prices()  # Call to show prices on startup
 
+        # Periodic work with pause() and resume(), suspended while the window is idle
+        self.background_tasks = []
+        self.prefetcher = PrefetchScheduler(self.api_client) if api_client is None else None
+        if self.prefetcher:
+            self.prefetcher.start()
+            self.background_tasks.append(self.prefetcher)
+
     def setup_ui(self):
         """
         Set up the user interface components including price displays,
@@ -275,6 +361,12 @@ class MainWindow(QMainWindow):
         price_layout.addWidget(next_price_container)
         container_layout.addLayout(price_layout)
 
+        # Zone comparison, shown when several bidding zones are monitored
+        self.zone_label = QLabel("--")
+        self.zone_label.setStyleSheet(f"color: {self.themes[self.current_theme]['primary']}; font-size: 14px;")
+        self.zone_label.setVisible(self.zones is not None)
+        container_layout.addWidget(self.zone_label)
+
         # Price limits
         limits_layout = QHBoxLayout()
         limits_layout.setSpacing(20)
@@ -394,7 +486,7 @@ class MainWindow(QMainWindow):
             """)
             button_layout.addWidget(button)
         
-        self.update_button.clicked.connect(self.update_prices)
+        self.update_button.clicked.connect(self.refresh_prices)
         self.show_daily_prices_button.clicked.connect(self.show_daily_prices)
         self.show_next_day_prices_button.clicked.connect(self.show_next_day_prices)
         
@@ -421,6 +513,7 @@ class MainWindow(QMainWindow):
             theme_name (str): Name of the selected theme
         """
         self.current_theme = theme_name
+        self.discard_dialogs()  # Rebuilt with the new theme when next opened
         self.setup_ui()  # Rebuild UI with new theme
         self.update_prices()  # Update prices to apply new styling
 
@@ -431,99 +524,24 @@ class MainWindow(QMainWindow):
         """
         try:
             print("Fetching daily prices...")  # Debug log
-            prices = self.api_client.get_daily_prices()
-            print(f"Got {len(prices)} prices")  # Debug log
-            
-            now = datetime.now(timezone.utc)
-            start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_today = start_of_today + timedelta(days=1) - timedelta(microseconds=1)
-
-            # Filter prices for today
-            today_prices = [
-                price for price in prices
-                if start_of_today <= price.start_date <= end_of_today
-            ]
-            print(f"Filtered to {len(today_prices)} prices for today")  # Debug log
-
-            if not today_prices:
+            snapshot = self.api_client.get_snapshot()
+            print(f"Got {len(snapshot.prices)} prices")  # Debug log
+
+            # Prices for today in local time
+            price_text = self.cached_day_price_text(snapshot, snapshot.day_index.local_day(self.clock.now()))
+
+            if not price_text:
                 print("No prices available for today")  # Debug log
-                msg = QMessageBox(self)
-                msg.setWindowTitle("Daily Prices")
-                msg.setText("No prices available for today.")
-                msg.setStyleSheet(f"""
-                    QMessageBox {{
-                        background-color: {self.themes[self.current_theme]["background"]};
-                    }}
-                    QMessageBox QLabel {{
-                        color: {self.themes[self.current_theme]["primary"]};
-                    }}
-                    QPushButton {{
-                        background-color: {self.themes[self.current_theme]["background"]};
-                        color: {self.themes[self.current_theme]["primary"]};
-                        border: 1px solid {self.themes[self.current_theme]["primary"]};
-                        border-radius: 5px;
-                        padding: 5px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {self.themes[self.current_theme]["primary"]};
-                        color: {self.themes[self.current_theme]["background"]};
-                    }}
-                """)
-                msg.exec()
+                self.show_message("Daily Prices", "No prices available for today.")
                 return
 
-            price_text = "\n\n".join(
-                f"{price.start_date.strftime('%Y-%m-%d %H:%M:%S')}: {price.price:.3f} snt/kWh" 
-                for price in today_prices
-            )
-            print("Created price text")  # Debug log
-
-            dialog = StyledDialog(self, self.themes[self.current_theme])
-            dialog.setMinimumSize(400, 300)
-            
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setText(price_text)
-            text_edit.setStyleSheet(f"""
-                QTextEdit {{
-                    background-color: {self.themes[self.current_theme]["background"]};
-                    color: {self.themes[self.current_theme]["primary"]};
-                    border: 1px solid {self.themes[self.current_theme]["primary"]};
-                    border-radius: 5px;
-                    padding: 5px;
-                }}
-            """)
-            dialog.content_layout.addWidget(text_edit)
-
             print("Showing dialog...")  # Debug log
-            dialog.exec()
+            self.show_price_dialog("daily", price_text)
             print("Dialog closed")  # Debug log
 
         except Exception as e:
             print(f"Error in show_daily_prices: {str(e)}")  # Debug log
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Error")
-            msg.setText(f"Failed to fetch daily prices: {str(e)}")
-            msg.setStyleSheet(f"""
-                QMessageBox {{
-                    background-color: {self.themes[self.current_theme]["background"]};
-                }}
-                QMessageBox QLabel {{
-                    color: {self.themes[self.current_theme]["primary"]};
-                }}
-                QPushButton {{
-                    background-color: {self.themes[self.current_theme]["background"]};
-                    color: {self.themes[self.current_theme]["primary"]};
-                    border: 1px solid {self.themes[self.current_theme]["primary"]};
-                    border-radius: 5px;
-                    padding: 5px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.themes[self.current_theme]["primary"]};
-                    color: {self.themes[self.current_theme]["background"]};
-                }}
-            """)
-            msg.exec()
+            self.show_message("Error", f"Failed to fetch daily prices: {str(e)}")
 
     def show_next_day_prices(self):
         """
@@ -531,118 +549,286 @@ class MainWindow(QMainWindow):
         Shows a message if prices are not available yet.
         """
         try:
-            prices = self.api_client.get_daily_prices()
-            now = datetime.now(timezone.utc)
-            start_of_tomorrow = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            end_of_tomorrow = start_of_tomorrow + timedelta(days=1) - timedelta(microseconds=1)
-
-            # Filter prices for tomorrow
-            tomorrow_prices = [
-                price for price in prices
-                if start_of_tomorrow <= price.start_date <= end_of_tomorrow
-            ]
-
-            if not tomorrow_prices:
-                msg = QMessageBox(self)
-                msg.setWindowTitle("Next Day Prices")
-                msg.setText("Prices for next day are not available yet.")
-                msg.setStyleSheet(f"""
-                    QMessageBox {{
-                        background-color: {self.themes[self.current_theme]["background"]};
-                    }}
-                    QMessageBox QLabel {{
-                        color: {self.themes[self.current_theme]["primary"]};
-                    }}
-                    QPushButton {{
-                        background-color: {self.themes[self.current_theme]["background"]};
-                        color: {self.themes[self.current_theme]["primary"]};
-                        border: 1px solid {self.themes[self.current_theme]["primary"]};
-                        border-radius: 5px;
-                        padding: 5px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {self.themes[self.current_theme]["primary"]};
-                        color: {self.themes[self.current_theme]["background"]};
-                    }}
-                """)
-                msg.exec()
-                return
+            snapshot = self.api_client.get_snapshot()
 
-            price_text = "\n\n".join(
-                f"{price.start_date.strftime('%Y-%m-%d %H:%M:%S')}: {price.price:.3f} snt/kWh" 
-                for price in tomorrow_prices
-            )
+            # Prices for tomorrow in local time
+            tomorrow = snapshot.day_index.local_day(self.clock.now()) + timedelta(days=1)
+            price_text = self.cached_day_price_text(snapshot, tomorrow)
 
-            dialog = StyledDialog(self, self.themes[self.current_theme])
-            dialog.setMinimumSize(400, 300)
-            
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setText(price_text)
-            text_edit.setStyleSheet(f"""
-                QTextEdit {{
-                    background-color: {self.themes[self.current_theme]["background"]};
-                    color: {self.themes[self.current_theme]["primary"]};
-                    border: 1px solid {self.themes[self.current_theme]["primary"]};
-                    border-radius: 5px;
-                    padding: 5px;
-                }}
-            """)
-            dialog.content_layout.addWidget(text_edit)
+            if not price_text:
+                self.show_message("Next Day Prices", "Prices for next day are not available yet.")
+                return
 
-            dialog.exec()
+            self.show_price_dialog("next_day", price_text)
         except Exception as e:
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Error")
-            msg.setText(f"Failed to fetch next day prices: {str(e)}")
-            msg.setStyleSheet(f"""
-                QMessageBox {{
-                    background-color: {self.themes[self.current_theme]["background"]};
-                }}
-                QMessageBox QLabel {{
-                    color: {self.themes[self.current_theme]["primary"]};
-                }}
-                QPushButton {{
-                    background-color: {self.themes[self.current_theme]["background"]};
-                    color: {self.themes[self.current_theme]["primary"]};
-                    border: 1px solid {self.themes[self.current_theme]["primary"]};
-                    border-radius: 5px;
-                    padding: 5px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.themes[self.current_theme]["primary"]};
-                    color: {self.themes[self.current_theme]["background"]};
-                }}
-            """)
-            msg.exec()
+            self.show_message("Error", f"Failed to fetch next day prices: {str(e)}")
+
+    def show_price_dialog(self, name: str, text: str):
+        """
+        Show a price list in a reusable dialog.
+        Each named dialog is created once per theme and only its text is updated.
+
+        Args:
+            name (str): Which dialog to show, e.g. "daily"
+            text (str): The price list to display
+        """
+        dialog = self.price_dialogs.get(name)
+        if dialog is None:
+            dialog = self.price_dialogs[name] = PriceDialog(self, self.themes[self.current_theme])
+        else:
+            dialog.center_on_parent()
+        dialog.set_text(text)
+        dialog.exec()
+
+    def show_message(self, title: str, text: str, icon: QMessageBox.Icon = QMessageBox.Icon.NoIcon):
+        """
+        Show a themed message box. The box is created once per theme and reused.
+
+        Args:
+            title (str): Window title
+            text (str): Message text
+            icon (QMessageBox.Icon): Icon shown next to the text
+        """
+        msg = self.message_box
+        if msg is None:
+            msg = self.message_box = self.build_message_box()
+        elif msg.isVisible():
+            # A message raised while another is open (e.g. an alert over an error) gets its own box
+            msg = self.build_message_box()
+            msg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        msg.setWindowTitle(title)
+        msg.setText(text)
+        msg.setIcon(icon)
+        msg.exec()
+
+    def build_message_box(self) -> QMessageBox:
+        """
+        Create a message box styled with the current theme.
+
+        Returns:
+            QMessageBox: The new message box
+        """
+        msg = QMessageBox(self)
+        msg.setStyleSheet(f"""
+            QMessageBox {{
+                background-color: {self.themes[self.current_theme]["background"]};
+            }}
+            QMessageBox QLabel {{
+                color: {self.themes[self.current_theme]["primary"]};
+            }}
+            QPushButton {{
+                background-color: {self.themes[self.current_theme]["background"]};
+                color: {self.themes[self.current_theme]["primary"]};
+                border: 1px solid {self.themes[self.current_theme]["primary"]};
+                border-radius: 5px;
+                padding: 5px;
+            }}
+            QPushButton:hover {{
+                background-color: {self.themes[self.current_theme]["primary"]};
+                color: {self.themes[self.current_theme]["background"]};
+            }}
+        """)
+        return msg
+
+    def discard_dialogs(self):
+        """
+        Drop the reusable dialogs so they are rebuilt with the current theme.
+        """
+        for dialog in self.price_dialogs.values():
+            dialog.deleteLater()
+        self.price_dialogs = {}
+        if self.message_box is not None:
+            self.message_box.deleteLater()
+            self.message_box = None
+
+    def cached_day_price_text(self, snapshot, day) -> str:
+        """
+        Get the formatted prices of one local day, rendering each day once per snapshot.
+        When a new snapshot arrives, only the days it changed are rendered again.
+
+        Args:
+            snapshot (PriceSnapshot): The price snapshot to read from
+            day (date): The local calendar day
+
+        Returns:
+            str: One line per slot, empty if the day has no prices
+        """
+        if snapshot is not self.price_text_snapshot:
+            changed_days = snapshot.changed_days(self.price_text_snapshot)
+            if changed_days is None:
+                self.price_text_cache = {}
+            else:
+                for changed_day in changed_days:
+                    self.price_text_cache.pop(changed_day, None)
+            self.price_text_snapshot = snapshot
+        text = self.price_text_cache.get(day)
+        if text is None:
+            text = self.price_text_cache[day] = self.day_price_text(snapshot, day)
+        return text
+
+    def day_price_text(self, snapshot, day) -> str:
+        """
+        Format the total prices of one local day for display.
+
+        Args:
+            snapshot (PriceSnapshot): The price snapshot to read from
+            day (date): The local calendar day
+
+        Returns:
+            str: One line per slot, empty if the day has no prices
+        """
+        start, stop = snapshot.day_index.span(day)
+        totals = snapshot.total_prices(self.tariffs)
+        return "\n\n".join(
+            f"{price.start_date.astimezone(LOCAL_TIMEZONE).strftime('%Y-%m-%d %H:%M:%S')}: {total:.3f} snt/kWh"
+            for price, total in zip(snapshot.prices[start:stop], totals[start:stop])
+        )
 
     def setup_timer(self):
         """
         Set up a timer to update prices at the start of each hour.
-        Calculates the time until the next hour and starts the timer.
+        The timer is single-shot and re-armed after every update, so it stays
+        aligned to the hour instead of repeating the first (partial) interval.
         """
-        now = datetime.now(timezone.utc)
-        next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
-        time_until_next_hour = int((next_hour - now).total_seconds() * 1000)  # Convert to milliseconds and cast to int
-
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_prices)
-        self.timer.start(time_until_next_hour)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.on_hour_timer)
+        self.schedule_next_update()
+
+    def schedule_next_update(self):
+        """
+        Arm the timer to fire at the start of the next hour.
+        """
+        delay = time_until_next_hour(self.clock.now())
+        self.timer.start(int(delay.total_seconds() * 1000))  # Convert to milliseconds and cast to int
+
+    def on_hour_timer(self):
+        """
+        Refresh prices at the start of the hour and re-arm the timer.
+        """
+        self.update_prices()
+        self.schedule_next_update()
+
+    def changeEvent(self, event):
+        """
+        Enter or leave idle mode when the window is minimized or restored.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.update_idle_state()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_idle_state()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_idle_state()
+
+    def update_idle_state(self):
+        """
+        Switch to idle mode while the window is minimized or hidden, and back when it is shown.
+        """
+        hidden = self.isMinimized() or not self.isVisible()
+        if hidden and not self.idle and self.idle_enabled:
+            self.enter_idle()
+        elif not hidden and self.idle:
+            self.leave_idle()
+
+    def enter_idle(self):
+        """
+        Stop rendering, pause the background tasks and leave only the hourly timer
+        running, as a very coarse timer the system can coalesce with other wakeups.
+        It keeps evaluating alerts, and its snapshot reads fetch newly published
+        prices in place of the paused prefetcher.
+        """
+        self.idle = True
+        self.setUpdatesEnabled(False)
+        for task in self.background_tasks:
+            task.pause()
+        self.timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self.schedule_next_update()
+
+    def leave_idle(self):
+        """
+        Resume rendering and the background tasks, and repaint once from the cached snapshot.
+        """
+        self.idle = False
+        for task in self.background_tasks:
+            task.resume()
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.setUpdatesEnabled(True)
+        self.update_prices()
+        self.schedule_next_update()
+
+    def closeEvent(self, event):
+        """
+        Stop background prefetching and zone fetches when the window is closed.
+        """
+        if self.prefetcher:
+            self.prefetcher.stop()
+        if self.zone_bridge:
+            self.zone_bridge.stop()
+        if self.zones:
+            self.zones.close()
+        super().closeEvent(event)
+
+    def notify_mode(self) -> NotifyMode:
+        """
+        Get the notification mode selected with the radio buttons.
+
+        Returns:
+            NotifyMode: The selected notification mode
+        """
+        if self.both_prices_radio.isChecked():
+            return NotifyMode.BOTH
+        if self.higher_price_radio.isChecked():
+            return NotifyMode.HIGHER
+        return NotifyMode.LOWER
+
+    def refresh_prices(self):
+        """
+        Fetch new prices and update the displayed prices.
+        If the fetch fails, the previously fetched prices stay in use.
+        """
+        try:
+            self.api_client.refresh()
+        except Exception as e:
+            self.show_message("Error", f"Failed to refresh prices: {str(e)}", QMessageBox.Icon.Critical)
+            return
+        self.update_prices()
+
+    def set_label_text(self, label: QLabel, text: str):
+        """
+        Set a label's text only if it differs, so unchanged labels are not re-laid out or repainted.
+        """
+        if label.text() != text:
+            label.setText(text)
 
     def update_prices(self):
         """
         Update the displayed prices and check if notifications are needed.
-        Fetches current and next hour prices from the API and updates the UI.
-        Triggers notifications if prices are outside the set limits.
+        Reads current and next hour prices from the shared snapshot and updates
+        only the labels whose text changed. Displayed prices and limit checks use
+        the total price including tariffs. Triggers a notification if the price
+        is outside the set limits, unless the same alert was already shown.
+        In idle mode only the alerts are evaluated.
         """
         try:
-            current_price, next_price = self.api_client.get_current_and_next_hour_prices()
+            snapshot = self.api_client.get_snapshot()
+            current_price, next_price = snapshot.current_and_next(self.clock.now())
 
-            current_price_cents = current_price.price
-            next_price_cents = next_price.price
+            current_price_cents = snapshot.total_price(current_price, self.tariffs)
+            next_price_cents = snapshot.total_price(next_price, self.tariffs)
 
-            self.current_price_label.setText(f"Current Price: {current_price_cents:.3f} snt/kWh")
-            self.next_price_label.setText(f"Next Hour Price: {next_price_cents:.3f} snt/kWh")
+            # While idle nothing is rendered; leave_idle() repaints from the cached snapshot
+            if not self.idle:
+                self.set_label_text(self.current_price_label, f"Current Price: {current_price_cents:.3f} snt/kWh")
+                self.set_label_text(self.next_price_label, f"Next Hour Price: {next_price_cents:.3f} snt/kWh")
+                if self.zones:
+                    self.update_zone_comparison()
+
+            self.check_anomalies(snapshot, current_price)
 
             # Update price limits
             self.price_limits = PriceLimits(
@@ -650,21 +836,94 @@ class MainWindow(QMainWindow):
                 upper_limit=self.upper_limit_spin.value()
             )
 
-            # Check if prices are within limits and notify accordingly
-            notify_lower = self.lower_price_radio.isChecked() or self.both_prices_radio.isChecked()
-            notify_higher = self.higher_price_radio.isChecked() or self.both_prices_radio.isChecked()
-
-            if (notify_lower and current_price.price < self.price_limits.lower_limit) or \
-               (notify_higher and current_price.price > self.price_limits.upper_limit):
-                self.show_notification(current_price.price)
+            # Check if prices are within limits and notify accordingly.
+            # Repeated updates of the same slot (theme changes, refreshes) do not re-alert.
+            mode = self.notify_mode()
+            alert = (current_price, current_price_cents, self.price_limits, mode)
+            if alert == self.last_alert:
+                return
+            self.last_alert = alert
+            if self.price_limits.limit_breached(current_price_cents, mode):
+                self.show_notification(current_price_cents)
 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to update prices: {str(e)}")
+            self.show_message("Error", f"Failed to update prices: {str(e)}", QMessageBox.Icon.Critical)
+
+    def update_zone_comparison(self):
+        """
+        Show the zone comparison from the last fetched table and refresh the zones in the
+        background; the label is updated again when the refresh completes.
+        """
+        if self.zones.table is not None:
+            self.show_zone_comparison(self.zones.table)
+        if self.zone_refresh_pending:
+            return
+        self.zone_refresh_pending = True
+        self.zone_bridge.submit(asyncio.to_thread(self.zones.refresh),
+                                on_result=self.on_zones_refreshed, on_error=self.on_zones_refresh_failed)
+
+    def on_zones_refreshed(self, table):
+        """
+        Show the refreshed zone table, unless the window went idle meanwhile.
+
+        Args:
+            table (Optional[ZonePriceTable]): The table returned by the refresh
+        """
+        self.zone_refresh_pending = False
+        if not self.idle:
+            self.show_zone_comparison(table)
+
+    def on_zones_refresh_failed(self, error: Exception):
+        """
+        Keep showing the last table when a zone refresh fails.
+
+        Args:
+            error (Exception): The error raised by the refresh
+        """
+        self.zone_refresh_pending = False
+        logger.warning("Zone refresh failed", exc_info=error)
+
+    def show_zone_comparison(self, table):
+        """
+        Show the current spot price of every monitored zone, the cheapest zone and the spread.
+
+        Args:
+            table (Optional[ZonePriceTable]): The zone table to read from
+        """
+        index = table.slot_index(self.clock.now()) if table else None
+        if index is None:
+            self.set_label_text(self.zone_label, "Zone prices not available")
+            return
+        prices = "  |  ".join(f"{zone} {price:.3f}" for zone, price in table.prices_at(index).items())
+        cheapest = table.cheapest_zones[index]
+        spread = table.spreads[index]
+        self.set_label_text(self.zone_label, f"Spot: {prices}  ·  cheapest {cheapest}, spread {spread:.3f} snt/kWh")
+
+    def check_anomalies(self, snapshot, current_price):
+        """
+        Feed the anomaly detector every slot up to the current one it has not seen yet.
+        Earlier slots only warm up the statistics; anomalies of the current slot are notified.
+
+        Args:
+            snapshot (PriceSnapshot): The price snapshot to read from
+            current_price (PricePoint): The current slot
+        """
+        if self.anomaly_checked_until is not None and current_price.start_ts <= self.anomaly_checked_until:
+            return
+        totals = snapshot.total_prices(self.tariffs)
+        first = 0
+        if self.anomaly_checked_until is not None:
+            first = bisect.bisect_right(snapshot.starts, self.anomaly_checked_until)
+        last = bisect.bisect_right(snapshot.starts, current_price.start_ts)
+        for price, total in zip(snapshot.prices[first:last], totals[first:last]):
+            anomalies = self.anomaly_detector.update(price, total)
+            if price.start_ts == current_price.start_ts and anomalies:
+                self.show_alert("\n".join(anomaly.message for anomaly in anomalies))
+        self.anomaly_checked_until = current_price.start_ts
 
     def show_notification(self, price: float):
         """
         Show a notification when prices are outside the set limits.
-        Plays a system sound and displays a message box with the price alert.
 
         Args:
             price (float): The current electricity price that triggered the notification
@@ -674,7 +933,16 @@ class MainWindow(QMainWindow):
             message = f"Current price ({price:.3f} snt/kWh) is lower than the set lower limit!"
         elif price > self.price_limits.upper_limit:
             message = f"Current price ({price:.3f} snt/kWh) is higher than the set upper limit!"
+        self.show_alert(message)
 
+    def show_alert(self, message: str):
+        """
+        Show a price alert.
+        Plays a system sound and displays a message box with the alert.
+
+        Args:
+            message (str): The alert text
+        """
         # Play notification sound
         try:
             winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
@@ -682,27 +950,4 @@ class MainWindow(QMainWindow):
             pass  # Ignore if sound fails
 
         # Show themed popup
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Price Alert")
-        msg.setText(message)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {self.themes[self.current_theme]["background"]};
-            }}
-            QMessageBox QLabel {{
-                color: {self.themes[self.current_theme]["primary"]};
-            }}
-            QPushButton {{
-                background-color: {self.themes[self.current_theme]["background"]};
-                color: {self.themes[self.current_theme]["primary"]};
-                border: 1px solid {self.themes[self.current_theme]["primary"]};
-                border-radius: 5px;
-                padding: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.themes[self.current_theme]["primary"]};
-                color: {self.themes[self.current_theme]["background"]};
-            }}
-        """)
-        msg.exec()
\ No newline at end of file
+        self.show_message("Price Alert", message, QMessageBox.Icon.Warning)
\ No newline at end of file
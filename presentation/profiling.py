@@ -0,0 +1,241 @@
+"""
+Profiling support for the Electricity Spot Price Monitor application.
+Captures cProfile traces of startup and of each refresh cycle, and watches
+the Qt event loop for stalls, logging the main thread's call stack when a
+slot blocks for too long. All reports are written to disk for offline analysis.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import os
+import pstats
+import random
+import statistics
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+class ProfileSession:
+    """
+    Writes cProfile traces (.prof for snakeviz/pstats, .txt summary) into one directory.
+    """
+
+    def __init__(self, output_dir: str):
+        """
+        Initialize the session and create its output directory.
+
+        Args:
+            output_dir (str): Directory the reports are written to
+        """
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self._counts = {}
+        self._active = False
+
+    @contextmanager
+    def profile(self, name: str):
+        """
+        Profile the enclosed block.
+        Nested blocks are folded into the outer profile, since only one
+        profiler can be active at a time.
+
+        Args:
+            name (str): Report name, numbered per occurrence (e.g. "refresh-003")
+        """
+        if self._active:
+            yield
+            return
+
+        self._counts[name] = self._counts.get(name, 0) + 1
+        report_name = f"{name}-{self._counts[name]:03d}"
+        profiler = cProfile.Profile()
+        self._active = True
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            self._active = False
+            self._write(report_name, profiler, elapsed)
+
+    def wrap(self, cls, name: str, *methods: str) -> None:
+        """
+        Profile every call of the given methods of a class.
+        Must be called before instances connect the methods to signals.
+
+        Args:
+            cls: The class whose methods are wrapped
+            name (str): Report name used for every call
+            *methods (str): Names of the methods to wrap
+        """
+        for method_name in methods:
+            method = getattr(cls, method_name)
+            parameters = inspect.signature(method).parameters.values()
+            if any(parameter.kind == parameter.VAR_POSITIONAL for parameter in parameters):
+                max_args = None
+            else:
+                max_args = sum(parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+                               for parameter in parameters)
+
+            # PyQt drops extra signal arguments (e.g. clicked's "checked") only for
+            # callables that cannot take them, so the wrapper drops them itself
+            @functools.wraps(method)
+            def profiled(*args, _method=method, _max_args=max_args, **kwargs):
+                with self.profile(name):
+                    return _method(*args[:_max_args], **kwargs)
+
+            setattr(cls, method_name, profiled)
+
+    def _write(self, report_name: str, profiler: cProfile.Profile, elapsed: float) -> None:
+        path = os.path.join(self.output_dir, report_name)
+        profiler.dump_stats(path + ".prof")
+        summary = io.StringIO()
+        summary.write(f"{report_name}: {elapsed * 1000:.1f} ms wall time\n\n")
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(40)
+        with open(path + ".txt", "w", encoding="utf-8") as file:
+            file.write(summary.getvalue())
+
+class EventLoopWatchdog(QObject):
+    """
+    Measures event-loop responsiveness.
+    A timer on the main thread records how late each tick fires; a background
+    thread notices ticks that stop arriving and logs the main thread's stack
+    while it is still stuck.
+    """
+
+    def __init__(self, log_path: str, interval_ms: int = 50, stall_threshold_ms: int = 200,
+                 sample_size: int = 4096, parent=None):
+        """
+        Initialize the watchdog without starting it.
+
+        Args:
+            log_path (str): File the stall reports and summary are written to
+            interval_ms (int): Tick interval of the heartbeat timer
+            stall_threshold_ms (int): Blocking time after which a stall is reported
+            sample_size (int): Number of lateness samples kept for the percentiles; ticks
+                beyond it are reservoir-sampled, so memory stays bounded in long sessions
+        """
+        super().__init__(parent)
+        self.log_path = log_path
+        self.interval = interval_ms / 1000
+        self.stall_threshold = stall_threshold_ms / 1000
+        self.sample_size = sample_size
+        self.ticks = 0
+        self.max_lateness = 0.0
+        self.lateness: List[float] = []
+        self.stalls = 0
+        self._rand = random.Random()
+        self._main_thread = threading.get_ident()
+        self._last_tick = time.perf_counter()
+        self._stall_reported = False
+        self._stop = threading.Event()
+        self._running = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self) -> None:
+        """
+        Start the heartbeat timer and the monitoring thread.
+        """
+        self._last_tick = time.perf_counter()
+        self._timer.start()
+        self._running.set()
+        self._thread = threading.Thread(target=self._monitor, name="EventLoopWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop monitoring and append a lateness summary to the log.
+        """
+        self._timer.stop()
+        self._stop.set()
+        self._running.set()
+        if self._thread:
+            self._thread.join()
+        self._log(self.summary())
+
+    def pause(self) -> None:
+        """
+        Stop the heartbeat and the stall checks, e.g. while the window is idle.
+        """
+        self._running.clear()
+        self._timer.stop()
+
+    def resume(self) -> None:
+        """
+        Restart the heartbeat and the stall checks after pause().
+        """
+        with self._lock:
+            self._last_tick = time.perf_counter()
+        self._timer.start()
+        self._running.set()
+
+    def summary(self) -> str:
+        """
+        Summarize the measured timer lateness and stalls.
+        The percentiles are estimated from the sampled ticks; the maximum is exact.
+        """
+        if not self.lateness:
+            return "Event loop: no ticks recorded\n"
+        ordered = sorted(self.lateness)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return (
+            f"Event loop: {self.ticks} ticks, lateness ms "
+            f"median={statistics.median(ordered) * 1000:.1f} "
+            f"p99={p99 * 1000:.1f} max={self.max_lateness * 1000:.1f}, "
+            f"{self.stalls} stalls over {self.stall_threshold * 1000:.0f} ms\n"
+        )
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            lateness = max(0.0, now - self._last_tick - self.interval)
+            self._last_tick = now
+            stalled = self._stall_reported
+            self._stall_reported = False
+        self.ticks += 1
+        self.max_lateness = max(self.max_lateness, lateness)
+        if len(self.lateness) < self.sample_size:
+            self.lateness.append(lateness)
+        else:
+            # Reservoir sampling keeps a uniform sample of all ticks
+            slot = self._rand.randrange(self.ticks)
+            if slot < self.sample_size:
+                self.lateness[slot] = lateness
+        if stalled:
+            self._log(f"Stall ended after {(lateness + self.interval) * 1000:.0f} ms\n\n")
+
+    def _monitor(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self._running.is_set():
+                self._running.wait()  # paused: sleep until resume() or stop()
+                continue
+            with self._lock:
+                blocked = time.perf_counter() - self._last_tick - self.interval
+                if blocked < self.stall_threshold or self._stall_reported:
+                    continue
+                self._stall_reported = True
+                self.stalls += 1
+            frame = sys._current_frames().get(self._main_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame else "  <no stack>\n"
+            self._log(
+                f"[{datetime.now().isoformat(timespec='milliseconds')}] "
+                f"Event loop blocked for {blocked * 1000:.0f} ms in:\n{stack}"
+            )
+
+    def _log(self, text: str) -> None:
+        with open(self.log_path, "a", encoding="utf-8") as file:
+            file.write(text)
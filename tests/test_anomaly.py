@@ -0,0 +1,40 @@
+import random
+from datetime import datetime, timezone
+from domain.anomaly import AnomalyDetector, AnomalyKind, DetectorConfig, P2Quantile, replay
+from domain.entities import PricePoint
+from tools.simulate import synthesize_prices
+
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+def slots(values):
+    return [PricePoint.from_epoch(value, START + 3600 * index, START + 3600 * (index + 1))
+            for index, value in enumerate(values)]
+
+def test_p2_quantile_estimates_median():
+    rand = random.Random(3)
+    values = [rand.gauss(10, 2) for _ in range(5000)]
+    sketch = P2Quantile(0.5)
+    for value in values:
+        sketch.add(value)
+
+    assert abs(sketch.value - sorted(values)[2500]) < 0.1
+
+def test_detects_negative_price_spike_and_median_ratio():
+    rand = random.Random(5)
+    values = [5 + rand.uniform(-0.5, 0.5) for _ in range(100)] + [30.0, -1.0]
+    anomalies = replay(slots(values), DetectorConfig(warmup=24))
+    found = {((anomaly.price.start_ts - START) // 3600, anomaly.kind) for anomaly in anomalies}
+
+    # The spike inflates the variance, so the negative slot is not also a z-score drop
+    assert found == {
+        (100, AnomalyKind.SPIKE),
+        (100, AnomalyKind.ABOVE_MEDIAN),
+        (101, AnomalyKind.NEGATIVE_PRICE),
+    }
+
+def test_regular_daily_pattern_is_quiet():
+    detector = AnomalyDetector(DetectorConfig(z_threshold=4.0, median_ratio=4.0))
+    events = [event for point in synthesize_prices(datetime(2024, 1, 1, tzinfo=timezone.utc), 24 * 28)
+              for event in detector.update(point)]
+
+    assert events == []
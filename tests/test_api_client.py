@@ -1,38 +1,9 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 from data.api_client import PorssiSahkoApiClient
+from domain.clock import ManualClock
 from domain.entities import PricePoint
 
-class MockDateTime:
-    """
-    A mock datetime class used for testing time-dependent functionality.
-    This class provides a fixed datetime value to ensure consistent test results.
-    """
-    @classmethod
-    def now(cls, tz=None):
-        """
-        Returns a fixed datetime for testing purposes.
-        This ensures that time-dependent tests are deterministic.
-        """
-        return datetime(2024, 3, 25, 12, 30, tzinfo=timezone.utc)
-    
-    @classmethod
-    def fromisoformat(cls, date_string):
-        """
-        Parses an ISO format date string into a datetime object.
-        Handles the 'Z' timezone designator by converting it to '+00:00'.
-        
-        Args:
-            date_string (str): ISO format date string, optionally ending with 'Z'
-            
-        Returns:
-            datetime: Parsed datetime object
-        """
-        # Handle the 'Z' timezone designator
-        if date_string.endswith('Z'):
-            date_string = date_string[:-1] + '+00:00'
-        return datetime.fromisoformat(date_string)
-
 def test_get_latest_prices(mocker):
     """
     Test the get_latest_prices method of PorssiSahkoApiClient.
@@ -107,12 +78,12 @@ def test_get_current_and_next_hour_prices(mocker):
     mock_response_obj.json.return_value = mock_response
     mock_response_obj.raise_for_status.return_value = None
     
-    # Mock both the API request and datetime for consistent testing
+    # Mock the API request and fix the clock for consistent testing
     mocker.patch('requests.get', return_value=mock_response_obj)
-    mocker.patch('data.api_client.datetime', MockDateTime)
+    clock = ManualClock(datetime(2024, 3, 25, 12, 30, tzinfo=timezone.utc))
     
     # Create client instance and fetch current and next hour prices
-    client = PorssiSahkoApiClient()
+    client = PorssiSahkoApiClient(clock=clock)
     current_price, next_price = client.get_current_and_next_hour_prices()
     
     # Verify the correct prices are returned
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+import time
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from presentation.async_bridge import AsyncBridge
+
+@pytest.fixture
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+def _wait_until(app, predicate, timeout=2.0):
+    """
+    Process Qt events until the predicate holds or the timeout passes.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    return predicate()
+
+def test_bridge_delivers_results_on_qt_thread(app):
+    bridge = AsyncBridge()
+    main_thread = threading.get_ident()
+    delivered = []
+
+    async def work(value):
+        await asyncio.sleep(0.01)
+        if value < 0:
+            raise ValueError("negative")
+        return value * 2
+
+    bridge.submit(work(21), on_result=lambda result: delivered.append((result, threading.get_ident())))
+    bridge.submit(work(-1), on_error=lambda error: delivered.append((str(error), threading.get_ident())))
+    assert _wait_until(app, lambda: bridge.pending == 0)
+    bridge.stop()
+
+    assert (42, main_thread) in delivered
+    assert ("negative", main_thread) in delivered
+
+def test_bridge_logs_unhandled_errors(app, caplog):
+    bridge = AsyncBridge()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    bridge.submit(fail())
+    assert _wait_until(app, lambda: bridge.pending == 0)
+    bridge.stop()
+
+    assert any(record.exc_info and "boom" in str(record.exc_info[1]) for record in caplog.records)
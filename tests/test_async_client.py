@@ -0,0 +1,56 @@
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from data.async_api_client import AsyncPorssiSahkoApiClient
+from data.sync_adapter import SyncPriceRepository
+from domain.clock import ManualClock
+from tools.replay_server import FaultProfile, ReplayServer, build_payload
+
+START = datetime(2024, 3, 30, 22, 0, tzinfo=timezone.utc)
+NOW = datetime(2024, 3, 31, 9, 30, tzinfo=timezone.utc)
+
+def test_concurrent_async_queries_share_one_fetch():
+    pytest.importorskip("aiohttp")
+
+    async def query(base_url):
+        async with AsyncPorssiSahkoApiClient(base_url=base_url, clock=ManualClock(NOW)) as client:
+            results = await asyncio.gather(*(client.get_current_and_next_hour_prices() for _ in range(50)))
+            return results, client.fetch_count
+
+    with ReplayServer({"latest-prices.json": build_payload(START, 48)}) as server:
+        results, fetch_count = asyncio.run(query(server.base_url))
+
+    assert fetch_count == 1
+    assert server.request_count == 1
+    current, following = results[0]
+    assert current.start_date == datetime(2024, 3, 31, 9, tzinfo=timezone.utc)
+    assert following.start_date == datetime(2024, 3, 31, 10, tzinfo=timezone.utc)
+    assert all(result == results[0] for result in results)
+
+def test_connections_are_pooled():
+    pytest.importorskip("aiohttp")
+
+    async def fetch_many(base_url):
+        async with AsyncPorssiSahkoApiClient(base_url=base_url, max_connections=2) as client:
+            return await asyncio.gather(*(client.get_latest_prices() for _ in range(6)))
+
+    with ReplayServer({"latest-prices.json": build_payload(START, 48)}, faults=FaultProfile(latency=0.05)) as server:
+        results = asyncio.run(fetch_many(server.base_url))
+
+    assert all(len(prices) == 48 for prices in results)
+    assert server.request_count == 6
+    assert server.connection_count <= 2
+
+def test_sync_adapter_serves_sync_callers():
+    pytest.importorskip("aiohttp")
+
+    with ReplayServer({"latest-prices.json": build_payload(START, 48)}) as server:
+        repository = SyncPriceRepository(AsyncPorssiSahkoApiClient(base_url=server.base_url, clock=ManualClock(NOW)))
+        try:
+            current, _ = repository.get_current_and_next_hour_prices()
+            assert len(repository.get_prices_for_day(datetime(2024, 3, 31).date())) == 23  # DST day
+        finally:
+            repository.close()
+
+    assert current.start_date == datetime(2024, 3, 31, 9, tzinfo=timezone.utc)
+    assert repository.fetch_count == 1
@@ -0,0 +1,33 @@
+from datetime import date, datetime, timedelta, timezone
+from data.recorded_repository import RecordedPriceRepository
+from domain.clock import ManualClock
+from domain.day_index import DayIndex
+from tools.simulate import synthesize_prices
+
+def test_day_index_uses_local_midnight():
+    # 2024-03-25 is EET (UTC+2): the local day starts at 22:00 UTC the day before
+    prices = synthesize_prices(datetime(2024, 3, 24, 12, tzinfo=timezone.utc), 48)
+    index = DayIndex(prices)
+    day = index.prices_for(date(2024, 3, 25))
+
+    assert len(day) == 24
+    assert day[0].start_date == datetime(2024, 3, 24, 22, tzinfo=timezone.utc)
+    assert day[-1].start_date == datetime(2024, 3, 25, 21, tzinfo=timezone.utc)
+
+def test_day_index_handles_dst_days():
+    spring = DayIndex(synthesize_prices(datetime(2024, 3, 29, tzinfo=timezone.utc), 96))
+    autumn = DayIndex(synthesize_prices(datetime(2024, 10, 25, tzinfo=timezone.utc), 96))
+
+    assert len(spring.prices_for(date(2024, 3, 31))) == 23
+    assert len(autumn.prices_for(date(2024, 10, 27))) == 25
+    assert spring.prices_for(date(2025, 1, 1)) == []
+
+def test_get_daily_prices_returns_local_today_and_tomorrow():
+    clock = ManualClock(datetime(2024, 3, 31, 12, 30, tzinfo=timezone.utc))  # 15:30 local, after publication
+    prices = synthesize_prices(datetime(2024, 3, 28, tzinfo=timezone.utc), 5 * 24)
+    repository = RecordedPriceRepository(prices, clock, history=timedelta(days=2))
+
+    daily = repository.get_daily_prices()
+
+    assert len(daily) == 23 + 24
+    assert daily[0].start_date == datetime(2024, 3, 30, 22, tzinfo=timezone.utc)
@@ -1,6 +1,9 @@
+import pickle
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
-from domain.entities import PricePoint, PriceLimits
+from zoneinfo import ZoneInfo
+from domain.entities import NotifyMode, PricePoint, PriceLimits
 
 def test_price_point():
     start_date = datetime(2022, 11, 14, 22, 0, tzinfo=timezone.utc)
@@ -12,6 +15,29 @@ def test_price_point():
     assert price_point.start_date == start_date
     assert price_point.end_date == end_date
 
+def test_price_point_is_compact_and_frozen():
+    start_date = datetime(2022, 11, 14, 22, 0, tzinfo=timezone.utc)
+    end_date = datetime(2022, 11, 14, 23, 0, tzinfo=timezone.utc)
+    price_point = PricePoint(price=13.494, start_date=start_date, end_date=end_date)
+
+    assert not hasattr(price_point, "__dict__")
+    assert price_point.start_ts == 1668463200
+    assert price_point.end_ts == 1668466800
+    assert PricePoint.from_epoch(13.494, 1668463200, 1668466800) == price_point
+    assert pickle.loads(pickle.dumps(price_point)) == price_point
+    with pytest.raises(FrozenInstanceError):
+        price_point.price = 1.0
+
+def test_price_point_keeps_whole_second_utc_instants():
+    helsinki = ZoneInfo("Europe/Helsinki")
+    start_date = datetime(2022, 11, 15, 0, 0, 0, 750000, tzinfo=helsinki)
+    price_point = PricePoint(price=1.0, start_date=start_date, end_date=datetime(2022, 11, 15, 1, 0, tzinfo=helsinki))
+
+    assert price_point.start_date == start_date.replace(microsecond=0)  # floored to the second
+    assert price_point.start_date.tzinfo == timezone.utc
+    assert price_point.end_date.astimezone(helsinki) == datetime(2022, 11, 15, 1, 0, tzinfo=helsinki)
+    assert price_point.start_ts == 1668463200
+
 def test_price_limits():
     limits = PriceLimits(lower_limit=10.0, upper_limit=20.0)
     
@@ -19,4 +45,15 @@ def test_price_limits():
     assert limits.is_price_within_limits(10.0) == True
     assert limits.is_price_within_limits(20.0) == True
     assert limits.is_price_within_limits(9.99) == False
-    assert limits.is_price_within_limits(20.01) == False 
\ No newline at end of file
+    assert limits.is_price_within_limits(20.01) == False 
+
+def test_price_limits_breach_by_mode():
+    limits = PriceLimits(lower_limit=10.0, upper_limit=20.0)
+
+    assert limits.limit_breached(5.0, NotifyMode.LOWER) == "lower"
+    assert limits.limit_breached(25.0, NotifyMode.LOWER) is None
+    assert limits.limit_breached(25.0, NotifyMode.HIGHER) == "higher"
+    assert limits.limit_breached(5.0, NotifyMode.HIGHER) is None
+    assert limits.limit_breached(5.0, NotifyMode.BOTH) == "lower"
+    assert limits.limit_breached(25.0, NotifyMode.BOTH) == "higher"
+    assert limits.limit_breached(15.0, NotifyMode.BOTH) is None
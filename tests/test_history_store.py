@@ -0,0 +1,69 @@
+import io
+import pytest
+from datetime import datetime, timezone
+from data.history_store import (
+    iter_history, iter_history_blocks, load_series, read_parquet, write_history, write_parquet, write_parquet_blocks,
+)
+from domain.entities import PricePoint
+from tools.simulate import synthesize_prices
+
+PRICES = synthesize_prices(datetime(2024, 1, 1, tzinfo=timezone.utc), 1000) + [
+    PricePoint.from_epoch(-0.123, 1709251200, 1709252100),  # negative 15-minute slot
+]
+
+def test_round_trip_across_blocks():
+    buffer = io.BytesIO()
+    assert write_history(buffer, PRICES, block_size=300) == len(PRICES)
+
+    buffer.seek(0)
+    restored = list(iter_history(buffer))
+    assert restored == [PricePoint.from_epoch(round(p.price, 3), p.start_ts, p.end_ts) for p in PRICES]
+
+    buffer.seek(0)
+    assert [len(prices) for prices, _, _ in iter_history_blocks(buffer)] == [300, 300, 300, 101]
+
+def test_load_series_and_compression(tmp_path):
+    path = str(tmp_path / "history.sph")
+    write_history(path, PRICES)
+    series = load_series(path)
+
+    assert len(series) == len(PRICES)
+    assert (tmp_path / "history.sph").stat().st_size < len(PRICES) * 8
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        list(iter_history(io.BytesIO(b"{\"prices\": []}")))
+
+def test_rejects_truncated_and_corrupt_files():
+    buffer = io.BytesIO()
+    write_history(buffer, PRICES, block_size=300)
+    data = buffer.getvalue()
+    first_block_end = 9 + 8 + int.from_bytes(data[13:17], "little")
+
+    broken = [
+        data[:5],  # short header
+        data[:first_block_end + 3],  # short block header
+        data[:first_block_end - 10],  # truncated block
+        data[:17] + bytes(len(data) - 17),  # corrupt compressed data
+        data[:9] + (301).to_bytes(4, "little") + data[13:],  # row count larger than the block
+    ]
+    for content in broken:
+        with pytest.raises(ValueError):
+            list(iter_history(io.BytesIO(content)))
+    with pytest.raises(ValueError):
+        load_series(io.BytesIO(data[:first_block_end - 10]))
+
+def test_parquet_export_writes_one_batch_per_block(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    buffer = io.BytesIO()
+    write_history(buffer, PRICES, block_size=300)
+    buffer.seek(0)
+    path = str(tmp_path / "history.parquet")
+
+    assert write_parquet_blocks(path, iter_history_blocks(buffer)) == len(PRICES)
+    assert pq.ParquetFile(path).metadata.num_rows == len(PRICES)
+    buffer.seek(0)
+    assert list(read_parquet(path)) == list(iter_history(buffer))
+
+    assert write_parquet(str(tmp_path / "points.parquet"), iter(PRICES), block_size=100) == len(PRICES)
+    assert list(read_parquet(str(tmp_path / "points.parquet"))) == PRICES
@@ -0,0 +1,280 @@
+import os
+import sys
+import threading
+import time
+import types
+from datetime import date, datetime, timedelta, timezone
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+# winsound only exists on Windows; alerts are replaced in these tests anyway
+sys.modules.setdefault("winsound", types.SimpleNamespace(PlaySound=lambda *args: None, SND_ALIAS=0))
+
+from data.multi_zone import MultiZoneRepository
+from data.recorded_repository import RecordedPriceRepository
+from domain.clock import ManualClock
+from domain.entities import PricePoint
+from domain.repositories import PriceRepository
+from domain.snapshot import PriceSnapshot
+from domain.tariffs import TariffConfig
+from presentation.main_window import MainWindow, PriceDialog
+from tools.simulate import synthesize_prices
+
+PRICES = synthesize_prices(datetime(2024, 2, 28, 22, tzinfo=timezone.utc), 24 * 5)
+
+# Created at collection, before other tests can create a plain QCoreApplication that widgets cannot use
+APP = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+APP.setQuitOnLastWindowClosed(False)  # closing a test window must not end later tests' event loops
+
+class Task:
+    def __init__(self):
+        self.calls = []
+
+    def pause(self):
+        self.calls.append("pause")
+
+    def resume(self):
+        self.calls.append("resume")
+
+@pytest.fixture
+def app():
+    return APP
+
+@pytest.fixture
+def clock():
+    return ManualClock(datetime(2024, 3, 1, 14, 30, tzinfo=timezone.utc))  # tomorrow's prices are out
+
+@pytest.fixture
+def shown(monkeypatch):
+    """
+    Record modal dialogs instead of running their event loops.
+    """
+    shown = []
+    monkeypatch.setattr(PriceDialog, "exec", lambda dialog: shown.append(dialog))
+    monkeypatch.setattr(QtWidgets.QMessageBox, "exec", lambda box: shown.append(box))
+    return shown
+
+@pytest.fixture
+def make_window(app, clock):
+    windows = []
+
+    def make_window(**kwargs):
+        kwargs.setdefault("tariffs", TariffConfig())
+        window = MainWindow(api_client=RecordedPriceRepository(PRICES, clock), clock=clock, **kwargs)
+        window.alerts = []
+        window.show_alert = window.alerts.append
+        windows.append(window)
+        return window
+
+    yield make_window
+    for window in windows:
+        window.close()
+        window.deleteLater()
+
+@pytest.fixture
+def window(make_window):
+    return make_window()
+
+def test_idle_mode_pauses_background_tasks_and_rendering(app, clock, window):
+    task = Task()
+    window.background_tasks.append(task)
+    window.show()
+    app.processEvents()
+    assert not window.idle
+
+    window.showMinimized()
+    app.processEvents()
+    assert window.idle
+    assert task.calls == ["pause"]
+    assert not window.updatesEnabled()
+
+    label = window.current_price_label.text()
+    clock.advance(timedelta(hours=2))
+    window.on_hour_timer()
+    assert window.current_price_label.text() == label  # nothing is rendered while idle
+
+    window.showNormal()
+    app.processEvents()
+    assert not window.idle
+    assert task.calls == ["pause", "resume"]
+    assert window.current_price_label.text() != label
+
+def test_idle_mode_can_be_disabled(app, window):
+    task = Task()
+    window.background_tasks.append(task)
+    window.idle_enabled = False
+    window.show()
+    window.showMinimized()
+    app.processEvents()
+
+    assert not window.idle
+    assert task.calls == []
+
+def test_window_consumers_share_one_fetch(window, shown):
+    repository = window.api_client
+    assert repository.fetch_count == 1  # startup
+
+    window.change_theme("Cyber Blue")
+    window.show_daily_prices()
+    window.show_next_day_prices()
+
+    assert [type(dialog) for dialog in shown] == [PriceDialog, PriceDialog]
+    assert repository.fetch_count == 1
+
+def test_labels_and_limits_use_total_prices(make_window, clock):
+    tariffs = TariffConfig(vat_rate=0.25, margin=1.0, day_transfer=4.0, night_transfer=4.0)
+    window = make_window(tariffs=tariffs)
+    snapshot = window.api_client.get_snapshot()
+    current, _ = snapshot.current_and_next(clock.now())
+    total = snapshot.total_price(current, tariffs)
+
+    assert total == pytest.approx(current.price + 6.25)
+    assert window.current_price_label.text() == f"Current Price: {total:.3f} snt/kWh"
+
+    window.higher_price_radio.setChecked(True)
+    window.upper_limit_spin.setValue(current.price + 3.0)  # above the spot price, below the total
+    window.update_prices()
+    assert any("higher than the set upper limit" in alert for alert in window.alerts)
+
+class RecordingDetector:
+    def __init__(self, anomalous_ts=None):
+        self.fed = []
+        self.anomalous_ts = anomalous_ts
+
+    def update(self, point, price=None):
+        self.fed.append((point.start_ts, price))
+        if point.start_ts == self.anomalous_ts:
+            return [types.SimpleNamespace(message="Price spike")]
+        return []
+
+def test_anomaly_detector_sees_each_slot_once(window, clock):
+    snapshot = window.api_client.get_snapshot()
+    current, _ = snapshot.current_and_next(clock.now())
+    assert window.anomaly_checked_until == current.start_ts
+
+    clock.advance(timedelta(hours=2))
+    later, _ = snapshot.current_and_next(clock.now())
+    window.anomaly_detector = RecordingDetector(anomalous_ts=later.start_ts)
+    window.update_prices()
+    window.update_prices()  # same slot again
+
+    assert window.anomaly_detector.fed == [
+        (price.start_ts, snapshot.total_price(price, window.tariffs))
+        for price in snapshot.prices if current.start_ts < price.start_ts <= later.start_ts
+    ]
+    assert len(window.anomaly_detector.fed) == 2
+    assert window.alerts == ["Price spike"]
+
+def test_price_dialogs_are_reused_and_rendered_once_per_day(window, clock, shown, monkeypatch):
+    rendered = []
+    day_price_text = window.day_price_text
+    monkeypatch.setattr(window, "day_price_text", lambda snapshot, day: rendered.append(day) or day_price_text(snapshot, day))
+
+    window.show_daily_prices()
+    window.show_daily_prices()
+    window.show_next_day_prices()
+    assert shown[0] is shown[1] is window.price_dialogs["daily"]
+    assert shown[2] is window.price_dialogs["next_day"]
+    assert rendered == [date(2024, 3, 1), date(2024, 3, 2)]
+
+    window.change_theme("Sunset")
+    window.show_daily_prices()
+    assert shown[3] is not shown[0]  # rebuilt with the new theme
+    assert len(rendered) == 2
+
+    # A new snapshot only re-renders the days it changed
+    clock.advance(timedelta(days=1))
+    window.refresh_prices()
+    window.show_daily_prices()
+    window.show_next_day_prices()
+    assert rendered[2:] == [date(2024, 3, 3)]
+
+def test_zone_comparison_refreshes_off_the_ui_thread(app, make_window, clock):
+    release = threading.Event()
+    se3 = RecordedPriceRepository([PricePoint.from_epoch(p.price / 2, p.start_ts, p.end_ts) for p in PRICES], clock)
+    get_snapshot = se3.get_snapshot
+    se3.get_snapshot = lambda: release.wait(5) and get_snapshot()
+    zones = MultiZoneRepository({"FI": RecordedPriceRepository(PRICES, clock), "SE3": se3})
+
+    window = make_window(zones=zones)  # the first refresh is blocked in the background
+    assert window.zone_refresh_pending
+    assert window.zone_label.text() == "--"
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while window.zone_refresh_pending and time.monotonic() < deadline:
+        app.processEvents()
+    assert "cheapest SE3" in window.zone_label.text()
+
+class StaticRepository(PriceRepository):
+    """
+    Minimal PriceRepository serving one fixed snapshot.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.snapshot = PriceSnapshot.from_prices(PRICES, clock.now())
+
+    def get_latest_prices(self):
+        return list(self.snapshot.prices)
+
+    def get_current_and_next_hour_prices(self):
+        return self.snapshot.current_and_next(self.clock.now())
+
+    def get_snapshot(self):
+        return self.snapshot
+
+    def refresh(self):
+        return self.snapshot
+
+    def invalidate(self):
+        pass
+
+def test_window_works_with_any_price_repository(app, clock, shown):
+    window = MainWindow(api_client=StaticRepository(clock), clock=clock, tariffs=TariffConfig())
+    window.show_alert = lambda message: None
+    window.refresh_prices()
+    window.show_daily_prices()
+
+    current, _ = window.api_client.get_current_and_next_hour_prices()
+    assert window.current_price_label.text() == f"Current Price: {current.price:.3f} snt/kWh"
+    assert [type(dialog) for dialog in shown] == [PriceDialog]
+    window.close()
+    window.deleteLater()
+
+def test_failed_zone_refresh_is_logged(app, make_window, clock, caplog):
+    zones = MultiZoneRepository({"FI": RecordedPriceRepository(PRICES, clock)})
+
+    def fail():
+        raise ConnectionError("zones down")
+    zones.refresh = fail
+
+    window = make_window(zones=zones)
+    deadline = time.monotonic() + 5
+    while window.zone_refresh_pending and time.monotonic() < deadline:
+        app.processEvents()
+
+    assert not window.zone_refresh_pending
+    assert any("Zone refresh failed" in record.message for record in caplog.records)
+
+def test_profile_mode_traces_every_refresh_cycle(app, make_window, clock, tmp_path, monkeypatch):
+    from main import PROFILED_REFRESH
+    from presentation.profiling import ProfileSession
+
+    for method in PROFILED_REFRESH:
+        monkeypatch.setattr(MainWindow, method, getattr(MainWindow, method))  # restored after the test
+    session = ProfileSession(str(tmp_path))
+    session.wrap(MainWindow, "refresh", *PROFILED_REFRESH)
+
+    window = make_window()  # startup update
+    window.refresh_prices()  # manual refresh, including its fetch
+    clock.advance(timedelta(hours=1))
+    window.timer.timeout.emit()  # hourly cycle
+
+    reports = sorted(name for name in os.listdir(tmp_path) if name.endswith(".txt"))
+    assert reports == ["refresh-001.txt", "refresh-002.txt", "refresh-003.txt"]
+    with open(tmp_path / "refresh-002.txt", encoding="utf-8") as file:
+        assert "get_latest_prices" in file.read()  # the fetch itself is inside the trace
+    with open(tmp_path / "refresh-003.txt", encoding="utf-8") as file:
+        assert "schedule_next_update" in file.read()
@@ -0,0 +1,114 @@
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from data.prefetch import PrefetchScheduler
+from data.recorded_repository import RecordedPriceRepository
+from domain.clock import ManualClock
+from tools.simulate import synthesize_prices
+
+PRICES = synthesize_prices(datetime(2024, 3, 9, 22, tzinfo=timezone.utc), 24 * 10)
+
+def run_days(scheduler, clock, days):
+    end = clock.now() + timedelta(days=days)
+    while clock.now() < end:
+        clock.advance(scheduler.run_once())
+
+def test_prefetch_polls_a_handful_of_times_per_day():
+    clock = ManualClock(datetime(2024, 3, 10, 6, 0, tzinfo=timezone.utc))
+    repository = RecordedPriceRepository(PRICES, clock, history=timedelta(days=2))
+    scheduler = PrefetchScheduler(repository, rand=random.Random(1))
+
+    run_days(scheduler, clock, 5)
+
+    # One startup fetch, then one poll per publication
+    assert repository.fetch_count <= 6
+    assert scheduler.attempts == 0
+
+def test_prefetch_backs_off_until_late_publication():
+    clock = ManualClock(datetime(2024, 3, 10, 6, 0, tzinfo=timezone.utc))
+    repository = RecordedPriceRepository(PRICES, clock, history=timedelta(days=2),
+                                         publication_delay=timedelta(minutes=45))
+    scheduler = PrefetchScheduler(repository, rand=random.Random(1))
+
+    clock.advance(scheduler.run_once())
+    assert clock.now() == datetime(2024, 3, 10, 12, 0, tzinfo=timezone.utc)  # 14:00 local
+
+    delays = []
+    while True:
+        delay = scheduler.run_once()
+        if scheduler.attempts == 0:
+            break
+        delays.append(delay)
+        clock.advance(delay)
+
+    assert clock.now() >= datetime(2024, 3, 10, 12, 45, tzinfo=timezone.utc)
+    assert all(delay <= timedelta(minutes=12) for delay in delays)
+    assert delays[1] > delays[0]
+    assert len(delays) < 10
+
+def test_prefetch_gives_up_after_window():
+    clock = ManualClock(datetime(2024, 3, 10, 12, 0, tzinfo=timezone.utc))
+    repository = RecordedPriceRepository(PRICES, clock, history=timedelta(days=2),
+                                         publication_delay=timedelta(hours=12))
+    scheduler = PrefetchScheduler(repository, rand=random.Random(1))
+
+    run_days(scheduler, clock, 0.5)
+
+    # Polls stop at the end of the window instead of running all evening
+    assert repository.fetch_count < 30
+    assert scheduler.attempts == 0
+
+def test_failed_poll_keeps_cached_snapshot():
+    clock = ManualClock(datetime(2024, 3, 10, 12, 0, tzinfo=timezone.utc))
+    repository = RecordedPriceRepository(PRICES, clock, history=timedelta(days=2),
+                                         publication_delay=timedelta(hours=1))
+    scheduler = PrefetchScheduler(repository, rand=random.Random(1))
+    cached = repository.get_snapshot()
+
+    def fail():
+        raise ConnectionError("down")
+    repository.get_latest_prices = fail
+    repository.snapshots.loader = fail
+
+    scheduler.run_once()
+    assert repository.snapshots.peek() is cached
+    assert scheduler.attempts == 1
+
+def test_prefetch_wakes_at_window_start_across_dst_change():
+    # 20:00 EET on the evening before the spring DST change
+    clock = ManualClock(datetime(2024, 3, 30, 18, 0, tzinfo=timezone.utc))
+    prices = synthesize_prices(datetime(2024, 3, 28, 22, tzinfo=timezone.utc), 24 * 5)
+    repository = RecordedPriceRepository(prices, clock, history=timedelta(days=2))
+    scheduler = PrefetchScheduler(repository, rand=random.Random(1))
+
+    clock.advance(scheduler.run_once())
+    assert clock.now() == datetime(2024, 3, 31, 11, 0, tzinfo=timezone.utc)  # 14:00 EEST
+
+    # 20:00 EEST before the autumn change
+    clock.set(datetime(2024, 10, 26, 17, 0, tzinfo=timezone.utc))
+    prices = synthesize_prices(datetime(2024, 10, 24, 21, tzinfo=timezone.utc), 24 * 5)
+    repository = RecordedPriceRepository(prices, clock, history=timedelta(days=2))
+    scheduler = PrefetchScheduler(repository, rand=random.Random(1))
+
+    clock.advance(scheduler.run_once())
+    assert clock.now() == datetime(2024, 10, 27, 12, 0, tzinfo=timezone.utc)  # 14:00 EET
+
+def test_paused_scheduler_sleeps_until_resumed():
+    clock = ManualClock(datetime(2024, 3, 10, 6, 0, tzinfo=timezone.utc))
+    scheduler = PrefetchScheduler(RecordedPriceRepository(PRICES, clock))
+    runs = threading.Semaphore(0)
+    run_once = scheduler.run_once
+
+    def counted_run_once():
+        runs.release()
+        return run_once()
+
+    scheduler.run_once = counted_run_once
+    scheduler.start()
+    assert runs.acquire(timeout=5)
+    scheduler.pause()
+    assert not runs.acquire(timeout=0.2)
+
+    scheduler.resume()
+    assert runs.acquire(timeout=5)  # resuming polls right away instead of waiting out the delay
+    scheduler.stop()
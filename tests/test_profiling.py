@@ -0,0 +1,76 @@
+import os
+import time
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from presentation.profiling import EventLoopWatchdog, ProfileSession
+
+class Window:
+    def refresh(self):
+        return sum(range(1000))
+
+def test_profile_session_writes_reports(tmp_path):
+    session = ProfileSession(str(tmp_path))
+    session.wrap(Window, "refresh", "refresh")
+
+    window = Window()
+    assert window.refresh(False) == 499500  # extra signal arguments are dropped
+    with session.profile("startup"):
+        window.refresh()  # nested, folded into the startup report
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "refresh-001.prof", "refresh-001.txt", "startup-001.prof", "startup-001.txt"
+    ]
+
+def test_watchdog_logs_stall_with_stack(tmp_path):
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    log_path = str(tmp_path / "event_loop.log")
+    watchdog = EventLoopWatchdog(log_path, interval_ms=20, stall_threshold_ms=100)
+
+    def blocking_slot():
+        time.sleep(0.3)
+
+    watchdog.start()
+    QtCore.QTimer.singleShot(50, blocking_slot)
+    QtCore.QTimer.singleShot(500, app.quit)
+    app.exec()
+    watchdog.stop()
+
+    with open(log_path, encoding="utf-8") as file:
+        log = file.read()
+    assert watchdog.stalls == 1
+    assert "blocking_slot" in log
+    assert "1 stalls" in log
+
+def test_watchdog_pause_stops_heartbeat(tmp_path):
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    watchdog = EventLoopWatchdog(str(tmp_path / "event_loop.log"), interval_ms=10, stall_threshold_ms=50)
+
+    def run(milliseconds):
+        QtCore.QTimer.singleShot(milliseconds, app.quit)
+        app.exec()
+
+    watchdog.start()
+    watchdog.pause()
+    run(200)
+    assert watchdog.ticks == 0
+    assert watchdog.stalls == 0  # a paused heartbeat is not a stall
+
+    watchdog.resume()
+    run(200)
+    watchdog.stop()
+    assert watchdog.ticks > 5
+
+def test_watchdog_keeps_bounded_lateness_sample(tmp_path):
+    QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    watchdog = EventLoopWatchdog(str(tmp_path / "event_loop.log"), interval_ms=10, sample_size=100)
+    for _ in range(5000):
+        watchdog._tick()
+    watchdog._last_tick -= 0.5  # one late tick
+    watchdog._tick()
+
+    assert watchdog.ticks == 5001
+    assert len(watchdog.lateness) == 100
+    assert watchdog.max_lateness >= 0.49
+    assert watchdog.summary().startswith("Event loop: 5001 ticks")
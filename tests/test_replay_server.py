@@ -0,0 +1,46 @@
+import pytest
+import requests
+from datetime import datetime, timezone
+from data.api_client import PorssiSahkoApiClient
+from tools.replay_server import FaultProfile, ReplayServer, build_payload
+from tools.soak import run_soak
+
+START = datetime(2024, 3, 30, 22, 0, tzinfo=timezone.utc)
+
+def test_replay_server_serves_recorded_prices():
+    with ReplayServer({"latest-prices.json": build_payload(START, 48)}) as server:
+        client = PorssiSahkoApiClient(base_url=server.base_url)
+        prices = client.get_latest_prices()
+
+    assert len(prices) == 48
+    assert min(price.start_date for price in prices) == START
+    assert server.request_count == 1
+
+def test_replay_server_error_burst():
+    faults = FaultProfile(error_probability=1.0, error_burst_length=2, seed=1)
+    with ReplayServer({"latest-prices.json": build_payload(START, 2)}, faults=faults) as server:
+        client = PorssiSahkoApiClient(base_url=server.base_url)
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_latest_prices()
+
+def test_soak_report_counts_errors():
+    faults = FaultProfile(truncate_probability=0.5, seed=3)
+    with ReplayServer({"latest-prices.json": build_payload(START, 48)}, faults=faults) as server:
+        client = PorssiSahkoApiClient(base_url=server.base_url)
+        report = run_soak([client.get_latest_prices], iterations=20, warmup=0)
+
+    assert report.requests == 20
+    assert 0 < report.error_count < 20
+    assert report.percentile(50) <= report.percentile(99)
+    assert "Error rate" in report.format()
+
+def test_streamed_prices_match_buffered_prices():
+    with ReplayServer({"latest-prices.json": build_payload(START, 48)}) as server:
+        client = PorssiSahkoApiClient(base_url=server.base_url)
+        assert list(client.iter_latest_prices(chunk_size=100)) == client.get_latest_prices()
+
+def test_soak_harness_does_not_count_its_own_memory():
+    report = run_soak([lambda: None], iterations=100_000, warmup=0)
+
+    assert report.requests == 100_000
+    assert report.memory_growth < 64 * 1024
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from domain.entities import PricePoint
+from domain.series import PriceSeries, diff
+from tools.simulate import synthesize_prices
+
+PRICES = synthesize_prices(datetime(2024, 3, 24, 22, tzinfo=timezone.utc), 48)
+
+def test_merge_appends_new_slots():
+    series = PriceSeries(PRICES[:24])
+    changes = series.merge(PRICES[12:])
+
+    assert len(series) == 48
+    assert changes.added == (range(24, 48),)
+    assert changes.revised == ()
+    assert changes.unchanged == (range(0, 24),)
+
+def test_merge_upserts_revised_and_inserts_gaps():
+    series = PriceSeries(PRICES[:10] + PRICES[20:30])
+    revised = PricePoint.from_epoch(99.0, PRICES[25].start_ts, PRICES[25].end_ts)
+    changes = series.merge(PRICES[10:12] + [revised, PRICES[26]])
+
+    assert [point.start_ts for point in series] == sorted(point.start_ts for point in series)
+    assert len(series) == 22
+    assert series[17] == revised
+    assert changes.added == (range(10, 12),)
+    assert changes.revised == (range(17, 18),)
+    assert changes.unchanged == (range(0, 10), range(12, 17), range(18, 22))
+
+def test_merge_of_identical_data_is_empty():
+    series = PriceSeries(PRICES)
+    changes = series.merge(reversed(PRICES))
+
+    assert changes.is_empty
+    assert changes.unchanged == (range(0, 48),)
+
+def test_diff_reports_added_revised_and_removed_slots():
+    revised = PricePoint.from_epoch(99.0, PRICES[30].start_ts, PRICES[30].end_ts)
+    changes = diff(PRICES[:36], PRICES[12:30] + [revised] + PRICES[31:])
+
+    assert changes.removed == (range(0, 12),)
+    assert changes.unchanged == (range(0, 18), range(19, 24))
+    assert changes.revised == (range(18, 19),)
+    assert changes.added == (range(24, 36),)
+    assert diff(PRICES, PRICES).is_empty
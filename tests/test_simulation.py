@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta, timezone
+from domain.clock import ManualClock, time_until_next_hour
+from domain.entities import NotifyMode, PriceLimits
+from tools.simulate import simulate, synthesize_prices
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def test_manual_clock_and_next_hour_delay():
+    clock = ManualClock(datetime(2024, 3, 31, 0, 59, 30, tzinfo=timezone.utc))
+
+    assert time_until_next_hour(clock.now()) == timedelta(seconds=30)
+    clock.advance(timedelta(seconds=30))
+    assert time_until_next_hour(clock.now()) == timedelta(hours=1)
+
+def test_simulation_refreshes_every_hour_and_counts_alerts():
+    prices = synthesize_prices(START, 7 * 24)
+    report = simulate(
+        prices,
+        PriceLimits(lower_limit=3.0, upper_limit=15.0),
+        NotifyMode.BOTH,
+        end=START + timedelta(days=6),
+    )
+
+    assert report.refreshes == 6 * 24
+    assert report.late_refreshes == 0
+    assert not report.failures
+    assert report.alerts["lower"] > 0
+    assert report.alerts["higher"] > 0
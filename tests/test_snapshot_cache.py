@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import pytest
+from datetime import datetime, timedelta, timezone
+from data.snapshot_cache import AsyncSnapshotCache, BaseSnapshotCache, SnapshotCache
+from domain.clock import ManualClock
+from tools.simulate import synthesize_prices
+
+PRICES = synthesize_prices(datetime(2024, 3, 24, 22, tzinfo=timezone.utc), 48)
+
+def test_snapshot_is_reused_within_publication_cycle():
+    clock = ManualClock(datetime(2024, 3, 25, 13, 0, tzinfo=timezone.utc))  # 15:00 local
+    cache = SnapshotCache(lambda: PRICES, clock)
+
+    first = cache.get()
+    clock.advance(timedelta(hours=8))
+    assert cache.get() is first
+    assert cache.fetch_count == 1
+
+    cache.invalidate()
+    assert cache.get() is not first
+    assert cache.fetch_count == 2
+
+    clock.advance(timedelta(hours=24))  # next publication cycle
+    cache.get()
+    assert cache.fetch_count == 3
+
+def test_concurrent_requests_share_one_fetch():
+    clock = ManualClock(datetime(2024, 3, 25, 13, 0, tzinfo=timezone.utc))
+    release = threading.Event()
+
+    def slow_loader():
+        release.wait(5)
+        return PRICES
+
+    cache = SnapshotCache(slow_loader, clock)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert cache.fetch_count == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+def test_incomplete_snapshot_is_refetched_after_retry_interval():
+    clock = ManualClock(datetime(2024, 3, 25, 13, 0, tzinfo=timezone.utc))
+    cache = SnapshotCache(lambda: PRICES[:24], clock, retry_interval=timedelta(minutes=15))
+
+    first = cache.get()
+    assert not first.is_complete
+    clock.advance(timedelta(minutes=10))
+    assert cache.get() is first
+    clock.advance(timedelta(minutes=10))
+    assert cache.get() is not first
+
+def test_failed_refresh_keeps_cached_snapshot():
+    clock = ManualClock(datetime(2024, 3, 25, 13, 0, tzinfo=timezone.utc))
+    responses = [PRICES, ConnectionError("down"), PRICES]
+
+    def loader():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    cache = SnapshotCache(loader, clock)
+    first = cache.get()
+    try:
+        cache.refresh()
+    except ConnectionError:
+        pass
+    assert cache.peek() is first
+    assert cache.get() is first  # still fresh, served without a fetch
+    assert cache.refresh() is not first
+    assert cache.fetch_count == 3
+
+def test_consecutive_snapshots_carry_relative_changes():
+    clock = ManualClock(datetime(2024, 3, 25, 10, 0, tzinfo=timezone.utc))
+    batches = iter([PRICES[:24], PRICES])
+    cache = SnapshotCache(lambda: next(batches), clock)
+
+    first = cache.get()
+    assert first.changes is None
+    second = cache.refresh()
+    assert second.changes_since(first).added == (range(24, 48),)
+    assert second.changes_since(first).unchanged == (range(0, 24),)
+
+def test_async_cache_shares_freshness_and_keeps_snapshot_on_failed_refresh():
+    clock = ManualClock(datetime(2024, 3, 25, 10, 0, tzinfo=timezone.utc))
+    batches = [PRICES[:24], PRICES]
+
+    async def loader():
+        await asyncio.sleep(0)
+        if not batches:
+            raise ConnectionError("down")
+        return batches.pop(0)
+
+    async def scenario():
+        cache = AsyncSnapshotCache(loader, clock)
+        first, again = await asyncio.gather(cache.get(), cache.get())
+        assert first is again and cache.fetch_count == 1
+        second = await cache.refresh()
+        assert second.changes_since(first).added == (range(24, 48),)
+        with pytest.raises(ConnectionError):
+            await cache.refresh()
+        assert await cache.get() is second
+
+    asyncio.run(scenario())
+    assert not issubclass(AsyncSnapshotCache, SnapshotCache)
+    assert issubclass(AsyncSnapshotCache, BaseSnapshotCache) and issubclass(SnapshotCache, BaseSnapshotCache)
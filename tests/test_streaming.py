@@ -0,0 +1,72 @@
+import json
+import pytest
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from data.api_client import parse_prices
+from data.streaming import iter_array_items, iter_price_blocks, iter_price_points
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+def generate_payload(rows, chunk_size=4096):
+    """
+    Generate a latest-prices.json document in chunks without building it in memory.
+    """
+    def pieces():
+        yield '{"meta": {"note": "äö"}, "prices": ['
+        for index in range(rows):
+            start = START + timedelta(minutes=15 * index)
+            yield ("," if index else "") + json.dumps({
+                "price": index / 1000,
+                "startDate": start.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "endDate": (start + timedelta(minutes=15)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            })
+        yield "]}"
+
+    buffer = b""
+    for piece in pieces():
+        buffer += piece.encode("utf-8")
+        while len(buffer) >= chunk_size:
+            yield buffer[:chunk_size]
+            buffer = buffer[chunk_size:]
+    if buffer:
+        yield buffer
+
+def test_streaming_matches_full_parse_for_any_chunking():
+    document = b"".join(generate_payload(50))
+    expected = parse_prices(json.loads(document))
+
+    for size in (1, 7, 64, len(document)):
+        chunks = [document[i:i + size] for i in range(0, len(document), size)]
+        assert list(iter_price_points(chunks)) == expected
+
+def test_streaming_keeps_memory_flat():
+    tracemalloc.start()
+    count = 0
+    for _ in iter_price_points(generate_payload(20_000)):
+        count += 1
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert count == 20_000
+    assert peak < 1 << 20  # the payload itself is about 2 MB
+
+def test_array_items_of_numbers_split_across_chunks():
+    assert list(iter_array_items([b'{"prices": [12', b'3, 4', b'5]}'])) == [123, 45]
+
+def test_array_items_ignore_nested_member_with_same_name():
+    chunks = [b'{"meta": {"pri', b'ces": []}, "prices": [1, 2]}']
+    assert list(iter_array_items(chunks)) == [1, 2]
+
+def test_array_items_ignore_string_value_equal_to_key():
+    assert list(iter_array_items([b'{"kind": "prices", "prices": [{"a": 1}]}'])) == [{"a": 1}]
+
+def test_array_items_missing_member():
+    with pytest.raises(ValueError):
+        list(iter_array_items([b'{"meta": {"prices": [1]}}']))
+
+def test_price_blocks():
+    points = iter_price_points(generate_payload(10))
+    blocks = list(iter_price_blocks(points, block_size=4))
+
+    assert [len(prices) for prices, _, _ in blocks] == [4, 4, 2]
+    assert blocks[2][1][1] - blocks[2][1][0] == 900
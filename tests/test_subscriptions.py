@@ -0,0 +1,35 @@
+import random
+from domain.entities import NotifyMode, PriceLimits
+from domain.subscriptions import SubscriptionIndex
+
+def test_index_matches_per_subscriber_check():
+    rand = random.Random(7)
+    index = SubscriptionIndex()
+    rules = {}
+    for number in range(500):
+        lower = round(rand.uniform(-2, 10), 1)
+        limits = PriceLimits(lower_limit=lower, upper_limit=round(lower + rand.uniform(0, 20), 1))
+        mode = rand.choice(list(NotifyMode))
+        rules[f"sub-{number}"] = (limits, mode)
+        index.register(f"sub-{number}", limits, mode)
+
+    for price in [-5.0, 0.0, 3.5, 10.0, 12.3, 40.0]:
+        expected = {
+            (subscriber_id, limits.limit_breached(price, mode))
+            for subscriber_id, (limits, mode) in rules.items()
+            if limits.limit_breached(price, mode)
+        }
+        assert {(alert.subscriber_id, alert.breached) for alert in index.evaluate(price)} == expected
+
+def test_register_replace_and_unregister():
+    index = SubscriptionIndex()
+    index.register("a", PriceLimits(lower_limit=5.0, upper_limit=20.0), NotifyMode.LOWER)
+    assert index.triggered(4.0) == (["a"], [])
+
+    index.register("a", PriceLimits(lower_limit=5.0, upper_limit=20.0), NotifyMode.HIGHER)
+    assert index.triggered(4.0) == ([], [])
+    assert index.triggered(25.0) == ([], ["a"])
+
+    index.unregister("a")
+    assert len(index) == 0
+    assert index.triggered(25.0) == ([], [])
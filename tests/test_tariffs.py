@@ -0,0 +1,76 @@
+import pytest
+from datetime import date, datetime, timezone
+from domain.snapshot import PriceSnapshot
+from domain.tariffs import TariffConfig, apply_tariffs
+from tools.simulate import synthesize_prices
+
+TIME_OF_USE = TariffConfig(vat_rate=0.25, margin=0.4, day_transfer=4.0, night_transfer=2.0)
+
+def transfers_by_utc_hour(start, hours, config=TIME_OF_USE):
+    prices = synthesize_prices(start, hours)
+    totals = apply_tariffs(prices, config)
+    return {
+        price.start_date.hour: round((total - price.price) / (1 + config.vat_rate) - config.margin, 6)
+        for price, total in zip(prices, totals)
+    }
+
+def test_night_tariff_follows_local_time_in_winter():
+    # EET (UTC+2): night 22-07 local is 20:00-05:00 UTC
+    transfers = transfers_by_utc_hour(datetime(2024, 1, 15, tzinfo=timezone.utc), 24)
+
+    assert transfers[4] == 2.0
+    assert transfers[5] == 4.0
+    assert transfers[19] == 4.0
+    assert transfers[20] == 2.0
+
+def test_night_tariff_boundaries_across_dst_changes():
+    # Spring forward on 2024-03-31: night ends at 07:00 EEST = 04:00 UTC
+    spring = transfers_by_utc_hour(datetime(2024, 3, 31, tzinfo=timezone.utc), 24)
+    assert spring[3] == 2.0
+    assert spring[4] == 4.0
+    assert spring[18] == 4.0
+    assert spring[19] == 2.0  # 22:00 EEST
+
+    # Fall back on 2024-10-27: night ends at 07:00 EET = 05:00 UTC
+    autumn = transfers_by_utc_hour(datetime(2024, 10, 27, tzinfo=timezone.utc), 24)
+    assert autumn[4] == 2.0
+    assert autumn[5] == 4.0
+    assert autumn[19] == 4.0
+    assert autumn[20] == 2.0  # 22:00 EET
+
+def test_seasonal_winter_day_tariff():
+    config = TariffConfig(day_transfer=1.5, night_transfer=1.5, winter_day_transfer=5.0)
+
+    assert config.transfer_for(int(datetime(2024, 1, 15, 10, tzinfo=timezone.utc).timestamp())) == 5.0  # Monday
+    assert config.transfer_for(int(datetime(2024, 1, 14, 10, tzinfo=timezone.utc).timestamp())) == 1.5  # Sunday
+    assert config.transfer_for(int(datetime(2024, 6, 17, 10, tzinfo=timezone.utc).timestamp())) == 1.5  # summer
+    assert config.transfer_for(int(datetime(2024, 1, 15, 21, tzinfo=timezone.utc).timestamp())) == 1.5  # night
+
+def test_default_config_keeps_spot_price_and_totals_are_cached():
+    prices = synthesize_prices(datetime(2024, 3, 25, tzinfo=timezone.utc), 48)
+    snapshot = PriceSnapshot.from_prices(prices, datetime(2024, 3, 25, 13, tzinfo=timezone.utc))
+
+    assert snapshot.total_prices(TariffConfig()) == tuple(price.price for price in snapshot.prices)
+    assert snapshot.total_prices(TIME_OF_USE) is snapshot.total_prices(TIME_OF_USE)
+    assert snapshot.total_price(snapshot.prices[5], TIME_OF_USE) == snapshot.total_prices(TIME_OF_USE)[5]
+
+def test_snapshot_changes_are_relative_to_previous_snapshot():
+    prices = synthesize_prices(datetime(2024, 3, 24, 22, tzinfo=timezone.utc), 48)  # 25th and 26th local
+    first = PriceSnapshot.from_prices(prices[:24], datetime(2024, 3, 25, 10, tzinfo=timezone.utc))
+    first_totals = first.total_prices(TIME_OF_USE)
+    second = PriceSnapshot.from_prices(prices, datetime(2024, 3, 25, 13, tzinfo=timezone.utc), previous=first)
+
+    assert second.changes_since(first).added == (range(24, 48),)
+    assert second.changed_days(first) == {date(2024, 3, 26)}
+    assert first.changed_days(None) is None
+    assert second.changes_since(second) is None
+    assert second.total_prices(TIME_OF_USE)[:24] == first_totals
+    assert second.total_prices(TIME_OF_USE) == tuple(apply_tariffs(second.prices, TIME_OF_USE))
+
+def test_config_from_env():
+    config = TariffConfig.from_env({"TARIFF_MARGIN": "0.49", "TARIFF_SPOT_INCLUDES_VAT": "false", "TARIFF_NIGHT_START": "23"})
+
+    assert config.margin == pytest.approx(0.49)
+    assert config.spot_includes_vat is False
+    assert config.night_start == 23
+    assert config.day_transfer == 0.0
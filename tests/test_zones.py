@@ -0,0 +1,93 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from data.multi_zone import MultiZoneRepository
+from data.recorded_repository import RecordedPriceRepository
+from domain.clock import ManualClock
+from domain.entities import PricePoint
+from domain.snapshot import PriceSnapshot
+from domain.zones import ZonePriceTable
+
+START = datetime(2024, 3, 25, 22, tzinfo=timezone.utc)
+NOW = datetime(2024, 3, 26, 9, 30, tzinfo=timezone.utc)
+
+def points(prices, skip=()):
+    return [
+        PricePoint(price=price, start_date=START + timedelta(hours=hour), end_date=START + timedelta(hours=hour + 1))
+        for hour, price in enumerate(prices) if hour not in skip
+    ]
+
+def snapshot(prices, skip=()):
+    return PriceSnapshot.from_prices(points(prices, skip), NOW)
+
+def test_spread_and_cheapest_zone_per_slot():
+    table = ZonePriceTable.from_snapshots({
+        "FI": snapshot([5.0, 1.0, 7.0]),
+        "SE3": snapshot([3.0, 2.0, 7.0]),
+        "EE": snapshot([4.0, 6.0, 9.0]),
+    })
+
+    assert table.complete
+    assert list(table.spread()) == [2.0, 5.0, 2.0]
+    assert table.cheapest() == ["SE3", "FI", "FI"]  # ties go to the first zone
+    assert table.spread() is table.spreads and table.cheapest() is table.cheapest_zones  # computed once
+    assert table.prices_at(1) == {"FI": 1.0, "SE3": 2.0, "EE": 6.0}
+
+def test_zones_with_missing_slots_are_aligned():
+    table = ZonePriceTable.from_snapshots({
+        "FI": snapshot([5.0, 1.0, 7.0]),
+        "SE3": snapshot([3.0, 2.0, 7.0, 8.0], skip={1}),
+    })
+
+    assert not table.complete
+    assert len(table) == 4
+    assert table.prices_at(1) == {"FI": 1.0}
+    assert table.cheapest() == ["SE3", "FI", "FI", "SE3"]
+    spread = table.spread()
+    assert list(spread[:3]) == [2.0, 0.0, 0.0]
+    assert spread[3] == 0.0
+    assert table.slot_index(START + timedelta(hours=3, minutes=10)) == 3
+    assert table.slot_index(START + timedelta(hours=4)) is None
+
+def test_multi_zone_repository_reuses_table_until_data_changes():
+    clock = ManualClock(NOW)
+    base = points([float(hour % 24) for hour in range(48)])
+    repositories = {
+        "FI": RecordedPriceRepository(base, clock),
+        "SE3": RecordedPriceRepository([PricePoint.from_epoch(p.price / 2, p.start_ts, p.end_ts) for p in base], clock),
+    }
+    zones = MultiZoneRepository(repositories)
+
+    table = zones.refresh()
+    assert table.zones == ("FI", "SE3")
+    assert zones.refresh() is table
+
+    repositories["SE3"].invalidate()
+    refreshed = zones.refresh()
+    assert refreshed is not table
+    index = refreshed.slot_index(NOW)
+    assert refreshed.cheapest()[index] == "SE3"
+    assert refreshed.spread()[index] == pytest.approx(refreshed.prices_at(index)["FI"] / 2)
+    zones.close()
+
+def test_failed_zone_keeps_previous_snapshot():
+    clock = ManualClock(NOW)
+    failing = RecordedPriceRepository(points([1.0, 2.0]), clock)
+    zones = MultiZoneRepository({"FI": RecordedPriceRepository(points([3.0, 4.0]), clock), "SE3": failing})
+    zones.refresh()
+
+    def fail():
+        raise ConnectionError("down")
+    failing.get_snapshot = fail
+
+    table = zones.refresh()
+    assert set(zones.errors) == {"SE3"}
+    assert table.cheapest() == ["SE3", "SE3"]
+    zones.close()
+
+def test_zones_from_env():
+    assert MultiZoneRepository.from_env({}) is None
+    zones = MultiZoneRepository.from_env({"PRICE_ZONES": "FI=http://a/v1, SE3=http://b/v1"})
+    assert zones.zones == ("FI", "SE3")
+    assert zones.repositories["SE3"].base_url == "http://b/v1"
+    with pytest.raises(ValueError):
+        MultiZoneRepository.from_env({"PRICE_ZONES": "FI"})
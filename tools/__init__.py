@@ -0,0 +1,3 @@
+"""
+Developer tooling package.
+"""
@@ -0,0 +1,50 @@
+"""
+Replay stored price history through the anomaly detector to tune its sensitivity.
+
+Usage:
+    python -m tools.anomalies history.sph --z-threshold 3 --median-ratio 3
+    python -m tools.anomalies archive.json --window 672 --list
+"""
+
+import argparse
+import time
+from collections import Counter
+
+from data.history_store import iter_history
+from data.streaming import iter_price_file
+from domain.anomaly import DetectorConfig, replay
+from domain.day_index import LOCAL_TIMEZONE
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay price history through the anomaly detector")
+    parser.add_argument("history", help="Columnar history file (.sph) or latest-prices.json style JSON file")
+    parser.add_argument("--alpha", type=float, default=DetectorConfig.alpha)
+    parser.add_argument("--z-threshold", type=float, default=DetectorConfig.z_threshold)
+    parser.add_argument("--median-ratio", type=float, default=DetectorConfig.median_ratio)
+    parser.add_argument("--window", type=int, default=DetectorConfig.window, help="Slots per median window")
+    parser.add_argument("--warmup", type=int, default=DetectorConfig.warmup)
+    parser.add_argument("--list", action="store_true", help="Print every anomaly")
+    args = parser.parse_args(argv)
+
+    if args.history.endswith(".json"):
+        points = sorted(iter_price_file(args.history), key=lambda point: point.start_ts)
+    else:
+        points = list(iter_history(args.history))
+
+    config = DetectorConfig(alpha=args.alpha, z_threshold=args.z_threshold, median_ratio=args.median_ratio,
+                            window=args.window, warmup=args.warmup)
+    started = time.perf_counter()
+    anomalies = replay(points, config)
+    elapsed = time.perf_counter() - started
+
+    if args.list:
+        for anomaly in anomalies:
+            local = anomaly.price.start_date.astimezone(LOCAL_TIMEZONE)
+            print(f"{local:%Y-%m-%d %H:%M} {anomaly.kind.value:<15} {anomaly.message}")
+    counts = Counter(anomaly.kind.value for anomaly in anomalies)
+    print(f"{len(points):,} slots replayed in {elapsed:.2f} s, {len(anomalies)} anomalies: {dict(counts)}")
+
+
+if __name__ == "__main__":
+    main()
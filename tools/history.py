@@ -0,0 +1,55 @@
+"""
+Command line conversion of price history files.
+
+Usage:
+    python -m tools.history pack archive.json history.sph
+    python -m tools.history unpack history.sph archive.json
+    python -m tools.history parquet history.sph history.parquet
+"""
+
+import argparse
+import json
+
+from data.history_store import iter_history, iter_history_blocks, write_history, write_parquet_blocks
+from data.streaming import iter_price_file
+
+
+def unpack(source: str, target: str) -> int:
+    """
+    Write a columnar history file as a latest-prices.json style document, one row at a time.
+
+    Returns:
+        int: Number of rows written
+    """
+    rows = 0
+    with open(target, "w", encoding="utf-8") as file:
+        file.write('{"prices": [')
+        for point in iter_history(source):
+            file.write(("," if rows else "") + json.dumps({
+                "price": point.price,
+                "startDate": point.start_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "endDate": point.end_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            }))
+            rows += 1
+        file.write("]}")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert price history between JSON, columnar and Parquet files")
+    parser.add_argument("command", choices=["pack", "unpack", "parquet"])
+    parser.add_argument("source")
+    parser.add_argument("target")
+    args = parser.parse_args(argv)
+
+    if args.command == "pack":
+        rows = write_history(args.target, iter_price_file(args.source))
+    elif args.command == "unpack":
+        rows = unpack(args.source, args.target)
+    else:
+        rows = write_parquet_blocks(args.target, iter_history_blocks(args.source))
+    print(f"Wrote {rows} rows to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
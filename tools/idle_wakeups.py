@@ -0,0 +1,184 @@
+"""
+Idle wakeup measurement for the main window.
+Runs the window against synthesized prices and reports, per phase, the
+event-loop wakeups, paint events, thread context switches (Linux only) and
+CPU time per minute:
+
+    visible            window shown normally
+    minimized (before) window minimized with idle mode disabled
+    minimized (after)  window minimized with idle mode enabled
+
+To make refresh work visible within a short run, a helper timer advances a
+ManualClock by one hour and fires the hourly refresh every --tick seconds.
+That timer adds the same wakeups to every phase; use --tick 0 to measure a
+truly idle window. Like the application, the window runs a prefetcher, and
+with --watchdog also the profiling watchdog; both are paused in idle mode.
+
+Usage:
+    python -m tools.idle_wakeups --seconds 60 --tick 1
+"""
+
+import argparse
+import glob
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from PyQt6.QtCore import QAbstractEventDispatcher, QEvent, QEventLoop, QObject, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from data.prefetch import PrefetchScheduler
+from data.recorded_repository import RecordedPriceRepository
+from domain.clock import ManualClock
+from presentation.main_window import MainWindow
+from tools.simulate import synthesize_prices
+
+
+def context_switches() -> Optional[int]:
+    """
+    Sum the context switches of all threads of this process.
+
+    Returns:
+        Optional[int]: Voluntary plus involuntary switches, None where /proc is not available
+    """
+    paths = glob.glob("/proc/self/task/*/status")
+    if not paths:
+        return None
+    total = 0
+    for path in paths:
+        try:
+            with open(path, encoding="ascii") as file:
+                for line in file:
+                    if line.startswith(("voluntary_ctxt_switches", "nonvoluntary_ctxt_switches")):
+                        total += int(line.split(":")[1])
+        except OSError:
+            pass  # the thread exited while reading
+    return total
+
+
+class WakeupCounter(QObject):
+    """
+    Counts event-loop wakeups of the main thread and paint events of all widgets.
+    """
+
+    def __init__(self, app: QApplication):
+        super().__init__()
+        self.wakeups = 0
+        self.paints = 0
+        QAbstractEventDispatcher.instance().awake.connect(self._awake)
+        app.installEventFilter(self)
+
+    def _awake(self):
+        self.wakeups += 1
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            self.paints += 1
+        return False
+
+
+@dataclass
+class PhaseReport:
+    """
+    Measurements of one phase, normalized to one minute.
+    """
+    name: str
+    wakeups: float
+    paints: float
+    switches: Optional[float]
+    cpu_ms: float
+
+    def format(self) -> str:
+        switches = f"{self.switches:10.0f}" if self.switches is not None else f"{'n/a':>10}"
+        return f"{self.name:20} {self.wakeups:10.0f} {self.paints:10.0f} {switches} {self.cpu_ms:10.1f}"
+
+
+def measure(app: QApplication, counter: WakeupCounter, name: str, seconds: float) -> PhaseReport:
+    """
+    Run the event loop for a while and measure the activity.
+
+    Args:
+        app (QApplication): The application
+        counter (WakeupCounter): Counter installed on the application
+        name (str): Phase name for the report
+        seconds (float): Measurement duration
+
+    Returns:
+        PhaseReport: Activity per minute
+    """
+    app.processEvents()  # settle pending work from the state change
+    wakeups, paints, switches = counter.wakeups, counter.paints, context_switches()
+    cpu = time.process_time()
+    # A local loop, since QApplication.quit() closes all windows in Qt 6
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+    scale = 60 / seconds
+    end_switches = context_switches()
+    return PhaseReport(
+        name=name,
+        wakeups=(counter.wakeups - wakeups) * scale,
+        paints=(counter.paints - paints) * scale,
+        switches=(end_switches - switches) * scale if switches is not None else None,
+        cpu_ms=(time.process_time() - cpu) * 1000 * scale,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure idle wakeups of the main window")
+    parser.add_argument("--seconds", type=float, default=60, help="Duration of each phase")
+    parser.add_argument("--tick", type=float, default=1.0,
+                        help="Seconds per simulated hour, 0 to disable simulated refreshes")
+    parser.add_argument("--watchdog", action="store_true",
+                        help="Run the profiling event-loop watchdog as with --profile")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    clock = ManualClock(datetime(2024, 3, 1, 10, 30, tzinfo=timezone.utc))
+    prices = synthesize_prices(datetime(2024, 2, 28, 22, tzinfo=timezone.utc), 24 * 60)
+    repository = RecordedPriceRepository(prices, clock)
+    window = MainWindow(api_client=repository, clock=clock)
+    window.show_alert = lambda message: None  # alerts would block the event loop
+    prefetcher = PrefetchScheduler(repository)
+    prefetcher.start()
+    window.background_tasks.append(prefetcher)
+    if args.watchdog:
+        from presentation.profiling import EventLoopWatchdog
+        watchdog = EventLoopWatchdog(os.devnull)
+        watchdog.start()
+        window.background_tasks.append(watchdog)
+    counter = WakeupCounter(app)
+
+    if args.tick > 0:
+        def simulated_hour():
+            clock.advance(timedelta(hours=1))
+            window.on_hour_timer()
+
+        ticker = QTimer()
+        ticker.timeout.connect(simulated_hour)
+        ticker.start(int(args.tick * 1000))
+
+    reports = []
+    window.show()
+    reports.append(measure(app, counter, "visible", args.seconds))
+
+    window.idle_enabled = False
+    window.showMinimized()
+    reports.append(measure(app, counter, "minimized (before)", args.seconds))
+
+    window.showNormal()
+    window.idle_enabled = True
+    window.showMinimized()
+    reports.append(measure(app, counter, "minimized (after)", args.seconds))
+
+    print(f"{'per minute':20} {'wakeups':>10} {'paints':>10} {'switches':>10} {'cpu ms':>10}")
+    for report in reports:
+        print(report.format())
+    window.close()
+    prefetcher.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Local stand-in for the Porssisahko API used for offline testing.
+This module serves recorded (or synthesized) API responses over real HTTP
+and can inject faults such as slow responses, truncated bodies, server error
+bursts and dropped connections.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+import requests
+
+
+@dataclass
+class FaultProfile:
+    """
+    Describes which faults the replay server injects and how often.
+
+    Attributes:
+        latency (float): Fixed delay in seconds added to every response
+        latency_jitter (float): Maximum random extra delay in seconds
+        slow_probability (float): Probability of a slow response
+        slow_latency (float): Delay in seconds used for slow responses
+        truncate_probability (float): Probability of cutting the body short
+        error_probability (float): Probability of starting a 5xx burst
+        error_burst_length (int): Number of consecutive 5xx responses in a burst
+        drop_probability (float): Probability of closing the connection without a response
+        seed (Optional[int]): Seed for the fault random generator
+    """
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    slow_probability: float = 0.0
+    slow_latency: float = 2.0
+    truncate_probability: float = 0.0
+    error_probability: float = 0.0
+    error_burst_length: int = 1
+    drop_probability: float = 0.0
+    seed: Optional[int] = None
+
+
+def build_payload(start: datetime, slots: int, slot_length: timedelta = timedelta(hours=1),
+                  base_price: float = 10.0) -> bytes:
+    """
+    Synthesize a latest-prices.json response body.
+    Useful for covering clock edges such as midnight and DST changes that are
+    hard to catch in real recordings.
+
+    Args:
+        start (datetime): Timezone-aware start of the first price slot
+        slots (int): Number of price slots to generate
+        slot_length (timedelta): Length of one price slot
+        base_price (float): Price of the first slot in cents per kilowatt-hour
+
+    Returns:
+        bytes: JSON body in the same shape as the real API response
+    """
+    start = start.astimezone(timezone.utc)
+    prices = []
+    for index in range(slots):
+        slot_start = start + slot_length * index
+        prices.append({
+            "price": round(base_price + (index % 24) * 0.5, 3),
+            "startDate": slot_start.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "endDate": (slot_start + slot_length).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        })
+    # The real API lists the newest price first
+    prices.reverse()
+    return json.dumps({"prices": prices}).encode("utf-8")
+
+
+def record(base_url: str, directory: str, endpoints=("latest-prices.json",)) -> None:
+    """
+    Record live API responses into a directory for later replay.
+
+    Args:
+        base_url (str): The base URL of the API to record from
+        directory (str): Directory where the response bodies are written
+        endpoints: Endpoint paths to record, relative to the base URL
+    """
+    os.makedirs(directory, exist_ok=True)
+    for endpoint in endpoints:
+        response = requests.get(f"{base_url}/{endpoint}", timeout=30)
+        response.raise_for_status()
+        with open(os.path.join(directory, endpoint), "wb") as file:
+            file.write(response.content)
+
+
+class _ReplayRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open so client connection reuse is observable
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.replay.connection_opened()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        replay = self.server.replay
+        body = replay.responses.get(self.path.split("?", 1)[0])
+        fault = replay.next_fault()
+
+        if fault["delay"]:
+            time.sleep(fault["delay"])
+
+        if fault["drop"]:
+            self.close_connection = True
+            return
+
+        if fault["error"]:
+            self._send(503, b'{"error": "Service Unavailable"}')
+            return
+
+        if body is None:
+            self._send(404, b'{"error": "Not Found"}')
+            return
+
+        if fault["truncate"]:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+
+        self._send(200, body)
+
+    def _send(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ReplayServer:
+    """
+    Threaded HTTP server that replays recorded API responses.
+    Responses are keyed by request path, e.g. "/v1/latest-prices.json".
+    """
+
+    def __init__(self, responses: Optional[Dict[str, bytes]] = None,
+                 faults: Optional[FaultProfile] = None,
+                 host: str = "127.0.0.1", port: int = 0, prefix: str = "/v1"):
+        """
+        Initialize the server without starting it.
+
+        Args:
+            responses (Optional[Dict[str, bytes]]): Response bodies keyed by endpoint name
+            faults (Optional[FaultProfile]): Faults to inject, none by default
+            host (str): Interface to bind to
+            port (int): Port to bind to, 0 picks a free port
+            prefix (str): Path prefix that mirrors the real API version path
+        """
+        self.prefix = prefix
+        self.responses = {}
+        for endpoint, body in (responses or {}).items():
+            self.set_response(endpoint, body)
+        self.faults = faults or FaultProfile()
+        self.request_count = 0
+        self.connection_count = 0
+        self._random = random.Random(self.faults.seed)
+        self._burst_remaining = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _ReplayRequestHandler)
+        self._server.daemon_threads = True
+        self._server.replay = self
+        self._thread = None
+
+    @classmethod
+    def from_directory(cls, directory: str, **kwargs) -> "ReplayServer":
+        """
+        Create a server replaying every file in a recordings directory.
+
+        Args:
+            directory (str): Directory created by record()
+
+        Returns:
+            ReplayServer: Server serving each file under its file name
+        """
+        responses = {}
+        for name in os.listdir(directory):
+            with open(os.path.join(directory, name), "rb") as file:
+                responses[name] = file.read()
+        return cls(responses, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        """
+        The base URL to pass to PorssiSahkoApiClient.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    def set_response(self, endpoint: str, body: bytes) -> None:
+        """
+        Replace the body served for an endpoint.
+
+        Args:
+            endpoint (str): Endpoint name relative to the prefix
+            body (bytes): Response body
+        """
+        self.responses[f"{self.prefix}/{endpoint}"] = body
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connection_count += 1
+
+    def next_fault(self) -> dict:
+        """
+        Decide which faults apply to the next request.
+
+        Returns:
+            dict: Flags for "error", "truncate" and "drop" plus the "delay" in seconds
+        """
+        faults = self.faults
+        with self._lock:
+            self.request_count += 1
+            rand = self._random.random
+            delay = faults.latency + rand() * faults.latency_jitter
+            if faults.slow_probability and rand() < faults.slow_probability:
+                delay += faults.slow_latency
+
+            if self._burst_remaining == 0 and faults.error_probability and rand() < faults.error_probability:
+                self._burst_remaining = faults.error_burst_length
+            error = self._burst_remaining > 0
+            if error:
+                self._burst_remaining -= 1
+
+            return {
+                "delay": delay,
+                "error": error,
+                "drop": bool(faults.drop_probability) and rand() < faults.drop_probability,
+                "truncate": bool(faults.truncate_probability) and rand() < faults.truncate_probability,
+            }
+
+    def start(self) -> "ReplayServer":
+        """
+        Start serving on a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and release the socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
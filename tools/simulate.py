@@ -0,0 +1,178 @@
+"""
+Accelerated time simulation of the monitoring pipeline.
+Replays recorded prices through the hourly refresh schedule and the alert
+rules using a ManualClock, so a year of operation runs in seconds.
+
+Usage:
+    python -m tools.simulate --lower 2 --upper 15 --mode both
+    python -m tools.simulate --prices history.json --start 2024-01-01
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Sequence
+
+from data.api_client import parse_prices
+from data.recorded_repository import RecordedPriceRepository
+from domain.clock import ManualClock, time_until_next_hour
+from domain.entities import NotifyMode, PriceLimits, PricePoint
+
+
+@dataclass
+class SimulationReport:
+    """
+    Result of a simulation run.
+
+    Attributes:
+        refreshes (int): Number of timer-driven refreshes performed
+        alerts (Dict[str, int]): Number of alerts per breached limit
+        failures (Dict[str, int]): Refreshes that failed, per error message
+        late_refreshes (int): Refreshes whose current price did not start at the refresh time
+        fetches (int): Number of snapshot fetches the repository performed
+        simulated (timedelta): Simulated time covered
+        wall_time (float): Wall-clock duration of the run in seconds
+    """
+    refreshes: int = 0
+    alerts: Dict[str, int] = field(default_factory=dict)
+    failures: Dict[str, int] = field(default_factory=dict)
+    late_refreshes: int = 0
+    fetches: int = 0
+    simulated: timedelta = timedelta(0)
+    wall_time: float = 0.0
+
+    @property
+    def simulated_hours_per_second(self) -> float:
+        if not self.wall_time:
+            return 0.0
+        return self.simulated.total_seconds() / 3600 / self.wall_time
+
+    def format(self) -> str:
+        """
+        Format the report as human-readable text.
+        """
+        lines = [
+            f"Simulated:       {self.simulated} ({self.refreshes} refreshes)",
+            f"Speed:           {self.simulated_hours_per_second:,.0f} simulated hours/s",
+            f"Alerts:          {sum(self.alerts.values())} {dict(self.alerts)}",
+            f"Late refreshes:  {self.late_refreshes}",
+            f"Fetches:         {self.fetches}",
+            f"Failures:        {sum(self.failures.values())}",
+        ]
+        for message, count in sorted(self.failures.items()):
+            lines.append(f"  {message}: {count}")
+        return "\n".join(lines)
+
+
+def simulate(prices: Sequence[PricePoint], limits: PriceLimits, mode: NotifyMode,
+             start: Optional[datetime] = None, end: Optional[datetime] = None) -> SimulationReport:
+    """
+    Replay prices through the hourly refresh and alert logic.
+    Each step advances the clock by the delay the main window's timer would use,
+    refreshes the current and next hour prices and evaluates the alert rule.
+
+    Args:
+        prices (Sequence[PricePoint]): Recorded price points
+        limits (PriceLimits): The alert limits to evaluate
+        mode (NotifyMode): The notification preference to evaluate
+        start (Optional[datetime]): Simulation start, the first recorded price by default
+        end (Optional[datetime]): Simulation end, the last recorded price by default
+
+    Returns:
+        SimulationReport: Statistics of the simulated run
+    """
+    start = start or min(price.start_date for price in prices)
+    end = end or max(price.start_date for price in prices)
+    clock = ManualClock(start)
+    repository = RecordedPriceRepository(prices, clock)
+    report = SimulationReport()
+    alerts = Counter()
+    failures = Counter()
+
+    started = time.perf_counter()
+    while True:
+        clock.advance(time_until_next_hour(clock.now()))
+        now = clock.now()
+        if now > end:
+            break
+        report.refreshes += 1
+        try:
+            current_price, _ = repository.get_current_and_next_hour_prices()
+        except ValueError as e:
+            failures[str(e)] += 1
+            continue
+        if current_price.start_date != now:
+            report.late_refreshes += 1
+        breached = limits.limit_breached(current_price.price, mode)
+        if breached:
+            alerts[breached] += 1
+    report.wall_time = time.perf_counter() - started
+    report.simulated = clock.now() - start
+    report.fetches = repository.fetch_count
+    report.alerts = dict(alerts)
+    report.failures = dict(failures)
+    return report
+
+
+def synthesize_prices(start: datetime, hours: int) -> list:
+    """
+    Generate an hourly price series with a daily shape for simulations.
+
+    Args:
+        start (datetime): Timezone-aware start of the first hour
+        hours (int): Number of hourly prices to generate
+
+    Returns:
+        list: Generated PricePoint objects
+    """
+    daily_shape = [3, 2, 2, 2, 3, 5, 9, 14, 16, 12, 10, 9, 8, 8, 9, 11, 15, 19, 17, 12, 9, 7, 5, 4]
+    return [
+        PricePoint(
+            price=daily_shape[hour % 24] * (1 + (hour // 24 % 7) / 10),
+            start_date=start + timedelta(hours=hour),
+            end_date=start + timedelta(hours=hour + 1)
+        )
+        for hour in range(hours)
+    ]
+
+
+def main(argv=None):
+    """
+    Run a simulation from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Replay price history through the refresh and alert logic")
+    parser.add_argument("--prices", help="JSON file in latest-prices.json format (a year is synthesized if omitted)")
+    parser.add_argument("--start", help="ISO date or time to start the simulation at")
+    parser.add_argument("--end", help="ISO date or time to end the simulation at")
+    parser.add_argument("--lower", type=float, default=0.0, help="Lower limit in snt/kWh")
+    parser.add_argument("--upper", type=float, default=10.0, help="Upper limit in snt/kWh")
+    parser.add_argument("--mode", choices=[mode.value for mode in NotifyMode], default=NotifyMode.LOWER.value)
+    args = parser.parse_args(argv)
+
+    if args.prices:
+        with open(args.prices, "r", encoding="utf-8") as file:
+            prices = parse_prices(json.load(file))
+    else:
+        prices = synthesize_prices(datetime(2024, 1, 1, tzinfo=timezone.utc), 366 * 24)
+
+    def parse_moment(value):
+        if value is None:
+            return None
+        moment = datetime.fromisoformat(value)
+        return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+    report = simulate(
+        prices,
+        PriceLimits(lower_limit=args.lower, upper_limit=args.upper),
+        NotifyMode(args.mode),
+        start=parse_moment(args.start),
+        end=parse_moment(args.end),
+    )
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Soak-test harness for price repositories.
+Drives a PriceRepository (normally PorssiSahkoApiClient pointed at a local
+ReplayServer) with sustained traffic and reports latency percentiles,
+error rates and memory growth.
+
+Usage:
+    python -m tools.soak --iterations 10000 --error-probability 0.01
+"""
+
+import argparse
+import gc
+import statistics
+import time
+import tracemalloc
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+from data.api_client import PorssiSahkoApiClient
+from domain.repositories import PriceRepository
+from tools.replay_server import FaultProfile, ReplayServer, build_payload
+
+
+@dataclass
+class SoakReport:
+    """
+    Result of a soak run.
+
+    Attributes:
+        requests (int): Number of operations performed
+        errors (Dict[str, int]): Number of failures per exception type
+        latencies (array): Latency of every operation in seconds
+        memory_start (int): Traced memory in bytes after warm-up, excluding the harness itself
+        memory_end (int): Traced memory in bytes at the end of the run, excluding the harness itself
+        memory_peak (int): Peak traced memory in bytes during the run, including the harness
+        duration (float): Wall-clock duration of the run in seconds
+    """
+    requests: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    latencies: array = field(default_factory=lambda: array("d"))
+    memory_start: int = 0
+    memory_end: int = 0
+    memory_peak: int = 0
+    duration: float = 0.0
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        return self.error_count / self.requests if self.requests else 0.0
+
+    @property
+    def memory_growth(self) -> int:
+        return self.memory_end - self.memory_start
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile in seconds.
+
+        Args:
+            percent (float): Percentile between 0 and 100
+
+        Returns:
+            float: The latency at the given percentile, 0.0 if nothing was measured
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def format(self) -> str:
+        """
+        Format the report as human-readable text.
+        """
+        lines = [
+            f"Requests:      {self.requests} in {self.duration:.1f} s",
+            f"Error rate:    {self.error_rate:.2%} ({self.error_count} errors)",
+        ]
+        for name, count in sorted(self.errors.items()):
+            lines.append(f"  {name}: {count}")
+        if self.latencies:
+            lines.append(
+                "Latency (ms):  "
+                f"p50={self.percentile(50) * 1000:.1f} "
+                f"p90={self.percentile(90) * 1000:.1f} "
+                f"p99={self.percentile(99) * 1000:.1f} "
+                f"max={max(self.latencies) * 1000:.1f} "
+                f"mean={statistics.fmean(self.latencies) * 1000:.1f}"
+            )
+        lines.append(
+            f"Memory (KiB):  start={self.memory_start / 1024:.1f} "
+            f"end={self.memory_end / 1024:.1f} "
+            f"growth={self.memory_growth / 1024:+.1f} "
+            f"peak={self.memory_peak / 1024:.1f}"
+        )
+        return "\n".join(lines)
+
+
+def repository_operations(repository: PriceRepository, cached: bool = False) -> List[Callable[[], object]]:
+    """
+    Build the mix of read operations a monitoring session performs.
+
+    Args:
+        repository (PriceRepository): The repository under test
+        cached (bool): Let snapshot-backed queries hit the repository's cache;
+            by default the cache is invalidated before each call so every
+            operation exercises the network path
+
+    Returns:
+        List[Callable[[], object]]: Operations that are called round-robin
+    """
+    operations = [repository.get_latest_prices, repository.get_current_and_next_hour_prices]
+    if hasattr(repository, "get_daily_prices"):
+        operations.append(repository.get_daily_prices)
+    if cached or not hasattr(repository, "invalidate"):
+        return operations
+
+    def uncached(operation):
+        def call():
+            repository.invalidate()
+            return operation()
+        return call
+
+    return [uncached(operation) for operation in operations]
+
+
+def _traced_memory() -> int:
+    # Allocations made by this module (latencies, error counters) are not memory
+    # growth of the code under test, so they are filtered out
+    snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, __file__),))
+    return sum(statistic.size for statistic in snapshot.statistics("filename"))
+
+
+def run_soak(operations: Sequence[Callable[[], object]], iterations: Optional[int] = None,
+             duration: Optional[float] = None, interval: float = 0.0, warmup: int = 10) -> SoakReport:
+    """
+    Call the operations round-robin and collect statistics.
+    Stops after the given number of iterations or seconds, whichever comes first.
+
+    Args:
+        operations (Sequence[Callable[[], object]]): Operations to call
+        iterations (Optional[int]): Maximum number of operations to perform
+        duration (Optional[float]): Maximum duration of the run in seconds
+        interval (float): Pause in seconds between operations
+        warmup (int): Number of untimed operations run before measuring memory
+
+    Returns:
+        SoakReport: The collected statistics
+    """
+    if iterations is None and duration is None:
+        raise ValueError("Either iterations or duration must be given")
+
+    for index in range(warmup):
+        try:
+            operations[index % len(operations)]()
+        except Exception:
+            pass
+
+    report = SoakReport()
+    errors = Counter()
+    gc.collect()
+    tracemalloc.start()
+    report.memory_start = _traced_memory()
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else None
+
+    try:
+        while iterations is None or report.requests < iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            operation = operations[report.requests % len(operations)]
+            call_started = time.perf_counter()
+            try:
+                operation()
+            except Exception as e:
+                errors[type(e).__name__] += 1
+            report.latencies.append(time.perf_counter() - call_started)
+            report.requests += 1
+            if interval:
+                time.sleep(interval)
+    finally:
+        report.duration = time.perf_counter() - started
+        gc.collect()
+        report.memory_peak = tracemalloc.get_traced_memory()[1]
+        report.memory_end = _traced_memory()
+        tracemalloc.stop()
+
+    report.errors = dict(errors)
+    return report
+
+
+def main(argv=None):
+    """
+    Run a soak test against a local replay server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Soak-test the price API client against a replay server")
+    parser.add_argument("--recordings", help="Directory of recorded responses (synthesized if omitted)")
+    parser.add_argument("--iterations", type=int, help="Number of operations to perform")
+    parser.add_argument("--duration", type=float, help="Duration of the run in seconds")
+    parser.add_argument("--interval", type=float, default=0.0, help="Pause between operations in seconds")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--slow-probability", type=float, default=0.0)
+    parser.add_argument("--truncate-probability", type=float, default=0.0)
+    parser.add_argument("--error-probability", type=float, default=0.0)
+    parser.add_argument("--error-burst-length", type=int, default=1)
+    parser.add_argument("--drop-probability", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--cached", action="store_true", help="Let queries use the snapshot cache")
+    args = parser.parse_args(argv)
+
+    if args.iterations is None and args.duration is None:
+        args.iterations = 1000
+
+    faults = FaultProfile(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        slow_probability=args.slow_probability,
+        truncate_probability=args.truncate_probability,
+        error_probability=args.error_probability,
+        error_burst_length=args.error_burst_length,
+        drop_probability=args.drop_probability,
+        seed=args.seed,
+    )
+
+    if args.recordings:
+        server = ReplayServer.from_directory(args.recordings, faults=faults)
+    else:
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        payload = build_payload(now - timedelta(hours=24), 48)
+        server = ReplayServer({"latest-prices.json": payload}, faults=faults)
+
+    with server:
+        client = PorssiSahkoApiClient(base_url=server.base_url)
+        report = run_soak(repository_operations(client, cached=args.cached), iterations=args.iterations,
+                          duration=args.duration, interval=args.interval)
+        print(report.format())
+        print(f"Connections:   {server.connection_count} for {server.request_count} HTTP requests")
+
+
+if __name__ == "__main__":
+    main()